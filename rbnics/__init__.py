@@ -15,67 +15,94 @@ __all__ = []
 # Process configuration files first
 from rbnics.utils.config import config
 
-# Import the minimum subset of RBniCS required to run tutorials
-from rbnics.eim.problems import DEIM, EIM, ExactParametrizedFunctions
-from rbnics.problems.elliptic import EllipticCoerciveCompliantProblem, EllipticCoerciveProblem, EllipticProblem
-from rbnics.problems.elliptic_optimal_control import EllipticOptimalControlProblem
-from rbnics.problems.navier_stokes import NavierStokesProblem
-from rbnics.problems.navier_stokes_unsteady import NavierStokesUnsteadyProblem
-from rbnics.problems.nonlinear_elliptic import NonlinearEllipticProblem
-from rbnics.problems.nonlinear_parabolic import NonlinearParabolicProblem
-from rbnics.problems.parabolic import ParabolicCoerciveProblem, ParabolicProblem
-from rbnics.problems.stokes import StokesProblem
-from rbnics.problems.stokes_optimal_control import StokesOptimalControlProblem
-from rbnics.problems.stokes_unsteady import StokesUnsteadyProblem
-from rbnics.sampling.distributions import (DrawFrom, EquispacedDistribution, LogEquispacedDistribution,
-                                           LogUniformDistribution, UniformDistribution)
-from rbnics.scm.problems import ExactStabilityFactor, SCM
-from rbnics.shape_parametrization.problems import AffineShapeParametrization, ShapeParametrization
-from rbnics.utils.decorators import CustomizeReducedProblemFor, CustomizeReductionMethodFor, exact_problem
-from rbnics.utils.factories import ReducedBasis, PODGalerkin
-
-__all__ += [
+# Import the minimum subset of RBniCS required to run tutorials. If the "lazy import" option of the "backends"
+# section of the configuration is enabled, only backends are imported here, while each other module is imported
+# the first time that any of its names is accessed, so that processes which only carry out online computations
+# do not need to import the offline machinery of every problem
+_lazy_imports = {
     # rbnics.eim
-    "DEIM",
-    "EIM",
-    "ExactParametrizedFunctions",
+    "DEIM": "rbnics.eim.problems",
+    "EIM": "rbnics.eim.problems",
+    "ExactParametrizedFunctions": "rbnics.eim.problems",
     # rbnics.problems
-    "EllipticCoerciveCompliantProblem",
-    "EllipticCoerciveProblem",
-    "EllipticOptimalControlProblem",
-    "EllipticProblem",
-    "NavierStokesProblem",
-    "NavierStokesUnsteadyProblem",
-    "NonlinearEllipticProblem",
-    "NonlinearParabolicProblem",
-    "ParabolicCoerciveProblem",
-    "ParabolicProblem",
-    "StokesProblem",
-    "StokesOptimalControlProblem",
-    "StokesUnsteadyProblem",
+    "EllipticCoerciveCompliantProblem": "rbnics.problems.elliptic",
+    "EllipticCoerciveProblem": "rbnics.problems.elliptic",
+    "EllipticProblem": "rbnics.problems.elliptic",
+    "EllipticOptimalControlProblem": "rbnics.problems.elliptic_optimal_control",
+    "NavierStokesProblem": "rbnics.problems.navier_stokes",
+    "NavierStokesUnsteadyProblem": "rbnics.problems.navier_stokes_unsteady",
+    "NonlinearEllipticProblem": "rbnics.problems.nonlinear_elliptic",
+    "NonlinearParabolicProblem": "rbnics.problems.nonlinear_parabolic",
+    "ParabolicCoerciveProblem": "rbnics.problems.parabolic",
+    "ParabolicProblem": "rbnics.problems.parabolic",
+    "StokesProblem": "rbnics.problems.stokes",
+    "StokesOptimalControlProblem": "rbnics.problems.stokes_optimal_control",
+    "StokesUnsteadyProblem": "rbnics.problems.stokes_unsteady",
     # rbnics.sampling
-    "DrawFrom",
-    "EquispacedDistribution",
-    "LogEquispacedDistribution",
-    "LogUniformDistribution",
-    "UniformDistribution",
+    "DrawFrom": "rbnics.sampling.distributions",
+    "EquispacedDistribution": "rbnics.sampling.distributions",
+    "LogEquispacedDistribution": "rbnics.sampling.distributions",
+    "LogUniformDistribution": "rbnics.sampling.distributions",
+    "UniformDistribution": "rbnics.sampling.distributions",
     # rbnics.scm
-    "ExactStabilityFactor",
-    "SCM",
+    "ExactStabilityFactor": "rbnics.scm.problems",
+    "SCM": "rbnics.scm.problems",
     # rbnics.shape_parametrization
-    "AffineShapeParametrization",
-    "ShapeParametrization",
-    # rbnics.utils.config
-    "config",
+    "AffineShapeParametrization": "rbnics.shape_parametrization.problems",
+    "ShapeParametrization": "rbnics.shape_parametrization.problems",
     # rbnics.utils.decorators
-    "CustomizeReducedProblemFor",
-    "CustomizeReductionMethodFor",
-    "exact_problem",
+    "CustomizeReducedProblemFor": "rbnics.utils.decorators",
+    "CustomizeReductionMethodFor": "rbnics.utils.decorators",
+    "exact_problem": "rbnics.utils.decorators",
+    "vectorized_compute_theta": "rbnics.utils.decorators",
     # rbnics.utils.factories
-    "ReducedBasis",
-    "PODGalerkin",
+    "ReducedBasis": "rbnics.utils.factories",
+    "PODGalerkin": "rbnics.utils.factories"
+}
+
+# Names which are defined by the __overridden__ variable of backends wrapping, and thus only become available
+# after deferred backends have been loaded
+_deferred_backends_overrides = {
+    "assemble_operator_for_derivatives",
+    "assemble_operator_for_stability_factor",
+    "assemble_operator_for_supremizers",
+    "compute_theta_for_derivatives",
+    "compute_theta_for_stability_factor",
+    "compute_theta_for_supremizers",
+    "generate_function_space_for_stability_factor",
+    "ParametrizedExpression",
+    "plot",
+    "PullBackFormsToReferenceDomain",
+    "PushForwardToDeformedDomain"
+}
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        class_or_function = getattr(importlib.import_module(_lazy_imports[name]), name)
+        setattr(sys.modules[__name__], name, class_or_function)
+        return class_or_function
+    elif name in _deferred_backends_overrides:
+        importlib.import_module(__name__ + ".backends").load_deferred_backends()
+        if name in globals():  # do not use hasattr, which would call this function again
+            return globals()[name]
+    raise AttributeError("module " + __name__ + " has no attribute " + name)
+
+
+__all__ += list(_lazy_imports.keys())
+__all__ += [
+    # rbnics.utils.config
+    "config"
 ]
 
+if not config.get("backends", "lazy import"):
+    for class_or_function_name in _lazy_imports.keys():
+        __getattr__(class_or_function_name)
+    del class_or_function_name
+else:
+    # Backends depend on rbnics.eim, and cannot be imported before it: import both of them now
+    importlib.import_module(__name__ + ".eim")
+
 # Import remaining modules
 rbnics_directory = os.path.abspath(os.path.dirname(os.path.realpath(__file__)))
 already_imported = ["backends", "eim", "problems", "__pycache__", "reduction_methods", "sampling", "scm",
@@ -26,6 +26,14 @@ def load_backends(required_backends):
             sys.modules[__name__].__all__.remove(class_or_function_name)
     backends_cache.__all__ = set()
 
+    # If lazy import is enabled, required backends are imported the first time that any of their classes or
+    # functions is dispatched to (or is accessed, in case it is only provided by required backends), rather than now
+    if config.get("backends", "lazy import"):
+        deferred_backends = list(required_backends)
+        required_backends = list()
+    else:
+        deferred_backends = list()
+
     # Make sure to import all available backends, so that they are added to the backends cache
     importlib.import_module(__name__ + ".abstract")
     importlib.import_module(__name__ + ".common")
@@ -34,13 +42,84 @@ def load_backends(required_backends):
         importlib.import_module(__name__ + "." + backend + ".wrapping")
     importlib.import_module(__name__ + ".online")
 
+    # Deferred backends will add their concrete implementations to abstract classes and functions, which
+    # have not been dispatched yet: prepare dispatchers for them now, so that other modules can already import them
+    from rbnics.utils.decorators.dispatch import Dispatcher
+    if len(deferred_backends) > 0:
+        for class_or_function_name in backends_cache.__all__:
+            if not isinstance(getattr(backends_cache, class_or_function_name), Dispatcher):
+                setattr(backends_cache, class_or_function_name, Dispatcher(class_or_function_name))
+
     # Copy imported backends from backends cache to this module
     for class_or_function_name in backends_cache.__all__:
         assert not hasattr(sys.modules[__name__], class_or_function_name)
         setattr(sys.modules[__name__], class_or_function_name, getattr(backends_cache, class_or_function_name))
         sys.modules[__name__].__all__.append(class_or_function_name)
 
-    # Next, extend modules with __overridden__ variables in backends wrapping. In order to account for
+    # Apply possible overriddes defined in backends wrapping
+    _override_wrapping(required_backends)
+
+    # In contrast, make sure that this module only contains dispatcher objects
+    for dispatcher_name in sys.modules[__name__].__all__:
+        dispatcher = getattr(sys.modules[__name__], dispatcher_name)
+        # if there was at least a concrete implementation by @BackendFor or @backend_for
+        if isinstance(getattr(backends_cache, dispatcher_name), Dispatcher):
+            assert isinstance(dispatcher, Dispatcher)
+
+    # Store some additional classes, defined in the abstract module, which are base classes but not backends,
+    # and thus have not been processed by @BackendFor and @backend_for decorators
+    for extra_class in ("LinearProblemWrapper", "NonlinearProblemWrapper", "TimeDependentProblemWrapper"):
+        assert not hasattr(sys.modules[__name__], extra_class)
+        setattr(sys.modules[__name__], extra_class, getattr(sys.modules[__name__ + ".abstract"], extra_class))
+        sys.modules[__name__].__all__.append(extra_class)
+
+    # Defer the import of the remaining backends to the first dispatch
+    _deferred_backends.clear()
+    _deferred_backends.extend(deferred_backends)
+    if len(deferred_backends) > 0:
+        for class_or_function_name in backends_cache.__all__:
+            dispatcher = getattr(backends_cache, class_or_function_name)
+            if isinstance(dispatcher, Dispatcher):
+                dispatcher.deferred_registrations.append(load_deferred_backends)
+
+
+# Helper function to load the required backends which have been deferred by load_backends in lazy import mode.
+# Returns True if at least one backend was loaded
+def load_deferred_backends():
+    if len(_deferred_backends) == 0:
+        return False
+    deferred_backends = list(_deferred_backends)
+    _deferred_backends.clear()
+
+    # Deferred registrations have been carried out, and thus should not be carried out again by other dispatchers
+    from rbnics.utils.decorators.backend_for import _cache as backends_cache
+    from rbnics.utils.decorators.dispatch import Dispatcher
+    for class_or_function_name in backends_cache.__all__:
+        dispatcher = getattr(backends_cache, class_or_function_name)
+        if isinstance(dispatcher, Dispatcher) and load_deferred_backends in dispatcher.deferred_registrations:
+            dispatcher.deferred_registrations.remove(load_deferred_backends)
+
+    # Import deferred backends, which add their implementations to the dispatchers prepared by load_backends
+    for backend in deferred_backends:
+        importlib.import_module(__name__ + "." + backend)
+        importlib.import_module(__name__ + "." + backend + ".wrapping")
+
+    # Copy classes and functions which are only provided by deferred backends from backends cache to this module
+    for class_or_function_name in backends_cache.__all__:
+        if hasattr(sys.modules[__name__], class_or_function_name):
+            assert getattr(sys.modules[__name__], class_or_function_name) is getattr(
+                backends_cache, class_or_function_name)
+        else:
+            setattr(sys.modules[__name__], class_or_function_name, getattr(backends_cache, class_or_function_name))
+            sys.modules[__name__].__all__.append(class_or_function_name)
+
+    # Apply possible overriddes defined in backends wrapping
+    _override_wrapping(deferred_backends)
+    return True
+
+
+def _override_wrapping(required_backends):
+    # Extend modules with __overridden__ variables in backends wrapping. In order to account for
     # multiple overrides, sort the list of available backends to account that
     depends_on_backends = dict()
     at_least_one_dependent_backend = False
@@ -78,20 +157,17 @@ def load_backends(required_backends):
             class_or_function = getattr(sys.modules[__name__ + "." + backend], class_or_function_name)
             assert inspect.isclass(class_or_function) or inspect.isfunction(class_or_function)
 
-    # In contrast, make sure that this module only contains dispatcher objects
-    from rbnics.utils.decorators.dispatch import Dispatcher
-    for dispatcher_name in sys.modules[__name__].__all__:
-        dispatcher = getattr(sys.modules[__name__], dispatcher_name)
-        # if there was at least a concrete implementation by @BackendFor or @backend_for
-        if isinstance(getattr(backends_cache, dispatcher_name), Dispatcher):
-            assert isinstance(dispatcher, Dispatcher)
 
-    # Store some additional classes, defined in the abstract module, which are base classes but not backends,
-    # and thus have not been processed by @BackendFor and @backend_for decorators
-    for extra_class in ("LinearProblemWrapper", "NonlinearProblemWrapper", "TimeDependentProblemWrapper"):
-        assert not hasattr(sys.modules[__name__], extra_class)
-        setattr(sys.modules[__name__], extra_class, getattr(sys.modules[__name__ + ".abstract"], extra_class))
-        sys.modules[__name__].__all__.append(extra_class)
+# Storage for required backends which have been deferred by load_backends in lazy import mode
+_deferred_backends = list()
+
+
+# Classes and functions which are only provided by deferred backends are available after loading them
+def __getattr__(name):
+    if load_deferred_backends() and hasattr(sys.modules[__name__], name):
+        return getattr(sys.modules[__name__], name)
+    else:
+        raise AttributeError("module " + __name__ + " has no attribute " + name)
 
 
 # Load required backends
@@ -8,6 +8,7 @@ from rbnics.backends.abstract.abs import abs
 from rbnics.backends.abstract.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.abstract.assign import assign
 from rbnics.backends.abstract.basis_functions_matrix import BasisFunctionsMatrix
+from rbnics.backends.abstract.batched_linear_solve import batched_linear_solve
 from rbnics.backends.abstract.copy import copy
 from rbnics.backends.abstract.eigen_solver import EigenSolver
 from rbnics.backends.abstract.evaluate import evaluate
@@ -40,6 +41,8 @@ from rbnics.backends.abstract.tensors_list import TensorsList
 from rbnics.backends.abstract.time_quadrature import TimeQuadrature
 from rbnics.backends.abstract.time_series import TimeSeries
 from rbnics.backends.abstract.time_stepping import TimeDependentProblemWrapper, TimeStepping
+from rbnics.backends.abstract.to_local_array import to_local_array
+from rbnics.backends.abstract.to_local_index import to_local_index
 from rbnics.backends.abstract.transpose import transpose
 from rbnics.backends.abstract.vector import Vector
 
@@ -48,6 +51,7 @@ __all__ = [
     "AffineExpansionStorage",
     "assign",
     "BasisFunctionsMatrix",
+    "batched_linear_solve",
     "copy",
     "EigenSolver",
     "evaluate",
@@ -83,6 +87,8 @@ __all__ = [
     "TimeQuadrature",
     "TimeSeries",
     "TimeStepping",
+    "to_local_array",
+    "to_local_index",
     "transpose",
     "Vector"
 ]
@@ -7,7 +7,8 @@
 from rbnics.utils.decorators import abstract_backend
 
 
-# assign function_from to function_to storage
+# assign function_from to function_to storage. A function can also be assigned from the array of its local entries,
+# as returned by to_local_array
 @abstract_backend
 def assign(object_to, object_from):
     pass
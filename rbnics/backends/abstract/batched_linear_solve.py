@@ -0,0 +1,16 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import abstract_backend
+
+
+# batched_linear_solve function to solve at once the affinely parametrized linear systems associated to
+# a batch of parameters. For each term of the affine expansion of the left-hand side (and, similarly, of the
+# right-hand side) the thetas of each parameter in the batch (either as a list of tuples, or as a (batch, Q) array)
+# and the affine expansion storage are provided. Returns a list of solutions (one for each parameter in the batch).
+@abstract_backend
+def batched_linear_solve(thetas_lhs, operators_lhs, thetas_rhs, operators_rhs):
+    pass
@@ -23,6 +23,21 @@ class LinearProgramSolver(object, metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def set_cost(self, cost):
+        """
+        Replace the cost c, keeping all constraints unchanged.
+        """
+        pass
+
+    @abstractmethod
+    def set_inequality_constraints(self, inequality_constraints_matrix, inequality_constraints_vector):
+        """
+        Replace the constraints matrix A and vector b, which must have the same number of rows as the ones
+        provided at construction, keeping cost and bounds unchanged.
+        """
+        pass
+
     @abstractmethod
     def solve(self):
         pass
@@ -25,10 +25,10 @@ class ProperOrthogonalDecomposition(object, metaclass=ABCMeta):
 
     # Perform POD on the snapshots previously computed, and store the first
     # POD modes in the basis functions matrix.
-    # Input arguments are: Nmax, tol
+    # Input arguments are: Nmax, tol, mode (either "full", "partial" or "randomized")
     # Output arguments are: POD eigenvalues, POD modes, number of POD modes
     @abstractmethod
-    def apply(self, Nmax, tol):
+    def apply(self, Nmax, tol, mode="full"):
         pass
 
     @abstractmethod
@@ -0,0 +1,15 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import abstract_backend
+
+
+# to_local_array function to copy the entries owned by the current process of a function, vector or matrix
+# (only nonzero entries) into a dense one dimensional array. Lists of functions or tensors (sharing the same
+# sparsity pattern) are copied into a dense two dimensional array, with one column for each element of the list.
+@abstract_backend
+def to_local_array(arg):
+    pass
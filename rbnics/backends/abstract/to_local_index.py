@@ -0,0 +1,14 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import abstract_backend
+
+
+# to_local_index function to get the position, in the array returned by to_local_array, of the entry of a function,
+# vector or matrix associated to the given (global) dofs. Returns None if the entry is not owned by the current process.
+@abstract_backend
+def to_local_index(arg, dofs):
+    pass
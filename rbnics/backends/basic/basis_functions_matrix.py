@@ -27,6 +27,7 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
             self._components_name = list()  # filled in by init
             self._component_name_to_basis_component_index = ComponentNameToBasisComponentIndexDict()  # filled by init
             self._component_name_to_basis_component_length = OnlineSizeDict()
+            self._contiguous = False  # backends may store basis functions contiguously, see transpose
 
         def init(self, components_name):
 
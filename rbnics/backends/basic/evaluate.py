@@ -17,7 +17,7 @@ def evaluate(backend, wrapping, online_backend, online_wrapping):
         @overload(backend.FunctionsList, (backend.ReducedMesh, backend.ReducedVertices))
         def __call__(self, functions_list, at):
             out_size = len(at.get_dofs_list())
-            out = online_backend.OnlineMatrix(out_size, out_size)
+            out = online_backend.OnlineMatrix(out_size, len(functions_list))
             for (j, fun_j) in enumerate(functions_list):
                 evaluate_fun_j = self.__call__(fun_j, at)
                 for (i, out_ij) in enumerate(evaluate_fun_j):
@@ -50,7 +50,7 @@ def evaluate(backend, wrapping, online_backend, online_wrapping):
         @overload(backend.TensorsList, backend.ReducedMesh)
         def __call__(self, tensors_list, at):
             out_size = len(at.get_dofs_list())
-            out = online_backend.OnlineMatrix(out_size, out_size)
+            out = online_backend.OnlineMatrix(out_size, len(tensors_list))
             for (j, tensor_j) in enumerate(tensors_list):
                 evaluate_tensor_j = self.__call__(tensor_j, at)
                 for (i, out_ij) in enumerate(evaluate_tensor_j):
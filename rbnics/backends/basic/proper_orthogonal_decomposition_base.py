@@ -5,7 +5,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import abs, cumsum as compute_retained_energy, isclose, sum as compute_total_energy
+from numpy import abs, asarray, count_nonzero, cumsum as compute_retained_energy, diag, isclose, zeros
+from numpy import sum as compute_total_energy
+from scipy.linalg import eigh
 from rbnics.utils.io import ExportableList
 
 
@@ -17,6 +19,7 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
     class _ProperOrthogonalDecompositionBase(ParentProperOrthogonalDecomposition):
 
         def __init__(self, space, inner_product, *args):
+            from rbnics.utils.config import config  # cannot import at global scope
             self.inner_product = inner_product
             self.space = space
             self.args = args
@@ -26,17 +29,58 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             # Declare a list to store eigenvalues
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            # Incremental POD, which compresses the snapshots matrix every time a snapshot is stored
+            self.incremental = config.get("POD", "incremental")
+            self.incremental_tol = float(config.get("POD", "incremental tolerance"))
+            self._compressed_eigenvalues = zeros(0)
 
         def clear(self):
             self.snapshots_matrix.clear()
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            self._compressed_eigenvalues = zeros(0)
 
         # No implementation is provided for store_snapshot, because
         # it has different interface for the standard POD and
         # the tensor one.
 
-        def apply(self, Nmax, tol):
+        def _compress_snapshots(self):
+            """
+            Replace the snapshots stored so far by a set of functions, orthogonal with respect to the inner product,
+            which spans the same space up to the incremental tolerance (relative to the energy of all snapshots).
+            Only the newly stored snapshots need to be multiplied by the inner product, because the correlation
+            matrix of previously compressed functions is diagonal, and stores the POD eigenvalues.
+            Thus the memory footprint is bounded by the rank of the snapshots rather than by their number, and
+            apply() returns the same POD modes up to the incremental tolerance.
+            """
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+
+            N_compressed = len(self._compressed_eigenvalues)
+            N_snapshots = len(snapshots_matrix)
+            if N_snapshots == N_compressed:
+                return
+            new_snapshots = snapshots_matrix[N_compressed:]
+            if inner_product is not None:
+                new_correlation = asarray(transpose(new_snapshots) * inner_product * snapshots_matrix)
+            else:
+                new_correlation = asarray(transpose(new_snapshots) * snapshots_matrix)
+            correlation = zeros((N_snapshots, N_snapshots))
+            correlation[:N_compressed, :N_compressed] = diag(self._compressed_eigenvalues)
+            correlation[N_compressed:, :] = new_correlation
+            correlation[:N_compressed, N_compressed:] = new_correlation[:, :N_compressed].T
+
+            (eigenvalues, eigenvectors) = eigh(correlation)
+            (eigenvalues, eigenvectors) = (eigenvalues[::-1], eigenvectors[:, ::-1])  # sort by decreasing value
+            total_energy = compute_total_energy(abs(eigenvalues))
+            N_retained = max(count_nonzero(eigenvalues > self.incremental_tol * total_energy), 1)
+            compressed_snapshots = [snapshots_matrix * tuple(eigenvectors[:, n]) for n in range(N_retained)]
+            snapshots_matrix.clear()
+            snapshots_matrix.enrich(compressed_snapshots, copy=False)
+            self._compressed_eigenvalues = eigenvalues[:N_retained]
+
+        def apply(self, Nmax, tol, mode="full"):
             inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
             transpose = backend.transpose
@@ -53,18 +97,37 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
                 "problem_type": "hermitian",
                 "spectrum": "largest real"
             }
+            assert mode in ("full", "partial", "randomized")
+            if mode == "randomized":
+                parameters["method"] = "randomized"
             eigensolver.set_parameters(parameters)
-            eigensolver.solve()
 
             Neigs = len(self.snapshots_matrix)
             Nmax = min(Nmax, Neigs)
             assert len(self.eigenvalues) == 0
+            if mode == "full":
+                eigensolver.solve()
+                total_energy = None
+            else:
+                # Only compute the leading eigenvalues: the total energy is the trace of the correlation matrix.
+                # If a tolerance is provided, start from a few eigenvalues and compute more of them
+                # only until enough energy is retained
+                total_energy = compute_total_energy([abs(correlation[i, i]) for i in range(Neigs)])
+                Neigs = Nmax if tol == 0. else min(Nmax, 16)
+                while True:
+                    eigensolver.solve(Neigs)
+                    retained_energy = compute_retained_energy(
+                        [abs(eigensolver.get_eigenvalue(i)[0]) for i in range(Neigs)])
+                    if Neigs == Nmax or total_energy == 0. or retained_energy[-1] / total_energy > 1. - tol:
+                        break
+                    Neigs = min(2 * Neigs, Nmax)
             for i in range(Neigs):
                 (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
                 assert isclose(eig_i_complex, 0.)
                 self.eigenvalues.append(eig_i_real)
 
-            total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
+            if total_energy is None:
+                total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
             retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
             assert len(self.retained_energy) == 0
             if total_energy > 0.:
@@ -93,7 +156,7 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
 
         def print_eigenvalues(self, N=None):
             if N is None:
-                N = len(self.snapshots_matrix)
+                N = len(self.eigenvalues)
             for i in range(N):
                 print("lambda_" + str(i) + " = " + str(self.eigenvalues[i]))
 
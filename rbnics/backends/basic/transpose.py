@@ -366,12 +366,16 @@ def BasisFunctionsMatrix_Transpose(backend, wrapping, online_backend, online_wra
         def __mul__(self, function):
             logger.log(DEBUG, "Begin Z^T w")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(
-                        wrapping.function_to_vector(fun_i), wrapping.function_to_vector(function))
-                    i += 1
+            if self.basis_functions_matrix._contiguous:
+                output[:] = wrapping.basis_functions_matrix_transpose_mul_vector(
+                    self.basis_functions_matrix, wrapping.function_to_vector(function))
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(
+                            wrapping.function_to_vector(fun_i), wrapping.function_to_vector(function))
+                        i += 1
             logger.log(DEBUG, "End Z^T w")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -387,11 +391,14 @@ def BasisFunctionsMatrix_Transpose(backend, wrapping, online_backend, online_wra
         def __mul__(self, vector):
             logger.log(DEBUG, "Begin Z^T w")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
-                    i += 1
+            if self.basis_functions_matrix._contiguous:
+                output[:] = wrapping.basis_functions_matrix_transpose_mul_vector(self.basis_functions_matrix, vector)
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
+                        i += 1
             logger.log(DEBUG, "End Z^T w")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -444,18 +451,22 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
             output = online_backend.OnlineMatrix(
                 self.basis_functions_matrix._component_name_to_basis_component_length,
                 other_basis_functions_matrix._component_name_to_basis_component_length)
-            j = 0
-            for other_component_name in other_basis_functions_matrix._components_name:
-                for fun_j in other_basis_functions_matrix._components[other_component_name]:
-                    matrix_times_fun_j = wrapping.matrix_mul_vector(
-                        self.matrix, wrapping.function_to_vector(fun_j))
-                    i = 0
-                    for self_component_name in self.basis_functions_matrix._components_name:
-                        for fun_i in self.basis_functions_matrix._components[self_component_name]:
-                            output[i, j] = wrapping.vector_mul_vector(
-                                wrapping.function_to_vector(fun_i), matrix_times_fun_j)
-                            i += 1
-                    j += 1
+            if self.basis_functions_matrix._contiguous and other_basis_functions_matrix._contiguous:
+                output[:, :] = wrapping.basis_functions_matrix_transpose_mul_matrix_mul_basis_functions_matrix(
+                    self.basis_functions_matrix, self.matrix, other_basis_functions_matrix)
+            else:
+                j = 0
+                for other_component_name in other_basis_functions_matrix._components_name:
+                    for fun_j in other_basis_functions_matrix._components[other_component_name]:
+                        matrix_times_fun_j = wrapping.matrix_mul_vector(
+                            self.matrix, wrapping.function_to_vector(fun_j))
+                        i = 0
+                        for self_component_name in self.basis_functions_matrix._components_name:
+                            for fun_i in self.basis_functions_matrix._components[self_component_name]:
+                                output[i, j] = wrapping.vector_mul_vector(
+                                    wrapping.function_to_vector(fun_i), matrix_times_fun_j)
+                                i += 1
+                        j += 1
             logger.log(DEBUG, "End Z^T*A*Z")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == (
@@ -472,11 +483,16 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
             logger.log(DEBUG, "Begin Z^T*A*v")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
             matrix_times_function = wrapping.matrix_mul_vector(self.matrix, wrapping.function_to_vector(function))
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_function)
-                    i += 1
+            if self.basis_functions_matrix._contiguous:
+                output[:] = wrapping.basis_functions_matrix_transpose_mul_vector(
+                    self.basis_functions_matrix, matrix_times_function)
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(
+                            wrapping.function_to_vector(fun_i), matrix_times_function)
+                        i += 1
             logger.log(DEBUG, "End Z^T*A*v")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -489,11 +505,15 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
             logger.log(DEBUG, "Begin Z^T*A*v")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
             matrix_times_vector = wrapping.matrix_mul_vector(self.matrix, vector)
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_vector)
-                    i += 1
+            if self.basis_functions_matrix._contiguous:
+                output[:] = wrapping.basis_functions_matrix_transpose_mul_vector(
+                    self.basis_functions_matrix, matrix_times_vector)
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_vector)
+                        i += 1
             logger.log(DEBUG, "End Z^T*A*v")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
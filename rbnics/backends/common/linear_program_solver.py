@@ -49,6 +49,18 @@ class LinearProgramSolver(AbstractLinearProgramSolver):
         self.inequality_constraints_vector = cvxopt.matrix(hstack((- inequality_constraints_vector,
                                                                    bounds_lower, bounds_upper)))
 
+    def set_cost(self, cost):
+        assert len(cost) == self.Q
+        self.cost[:] = cvxopt.matrix(cost)
+
+    def set_inequality_constraints(self, inequality_constraints_matrix, inequality_constraints_vector):
+        # Only the leading rows are updated, since the trailing 2*Q rows store bound constraints
+        M = len(inequality_constraints_vector)
+        assert M + 2 * self.Q == self.inequality_constraints_vector.size[0]
+        assert inequality_constraints_matrix.shape == (M, self.Q)
+        self.inequality_constraints_matrix[:M, :] = cvxopt.matrix(- inequality_constraints_matrix)
+        self.inequality_constraints_vector[:M] = cvxopt.matrix(- inequality_constraints_vector)
+
     def solve(self):
         result = cvxopt.solvers.lp(self.cost, self.inequality_constraints_matrix, self.inequality_constraints_vector,
                                    solver="glpk", options={"glpk": {"msg_lev": "GLP_MSG_OFF"}})
@@ -39,6 +39,8 @@ from rbnics.backends.dolfin.tensor_snapshots_list import TensorSnapshotsList
 from rbnics.backends.dolfin.tensors_list import TensorsList
 from rbnics.backends.dolfin.time_quadrature import TimeQuadrature
 from rbnics.backends.dolfin.time_stepping import TimeStepping
+from rbnics.backends.dolfin.to_local_array import to_local_array
+from rbnics.backends.dolfin.to_local_index import to_local_index
 from rbnics.backends.dolfin.transpose import transpose
 from rbnics.backends.dolfin.vector import Vector
 
@@ -84,6 +86,8 @@ __all__ = [
     "TensorsList",
     "TimeQuadrature",
     "TimeStepping",
+    "to_local_array",
+    "to_local_index",
     "transpose",
     "Vector"
 ]
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import ndarray as array
 from ufl.core.operator import Operator
 from dolfin import assign as dolfin_assign
 from rbnics.backends.dolfin.function import Function
@@ -14,7 +15,8 @@ from rbnics.utils.decorators import backend_for, list_of, overload
 
 
 @backend_for("dolfin", inputs=((Function.Type(), list_of(Function.Type()), Matrix.Type(), Vector.Type()),
-                               (Function.Type(), list_of(Function.Type()), Matrix.Type(), Operator, Vector.Type())))
+                               (Function.Type(), list_of(Function.Type()), Matrix.Type(), Operator, Vector.Type(),
+                                array)))
 def assign(object_to, object_from):
     _assign(object_to, object_from)
 
@@ -30,6 +32,13 @@ def _assign(object_to: Function.Type(), object_from: Operator):
     dolfin_assign(object_to, function_from_ufl_operators(object_from))
 
 
+@overload
+def _assign(object_to: Function.Type(), object_from: array):
+    # object_from contains the entries owned by the current process, as returned by to_local_array
+    object_to.vector().set_local(object_from)
+    object_to.vector().apply("insert")
+
+
 @overload
 def _assign(object_to: list_of(Function.Type()), object_from: list_of(Function.Type())):
     if object_from is not object_to:
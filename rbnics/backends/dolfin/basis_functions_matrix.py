@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import empty
 from dolfin import FunctionSpace
 from rbnics.backends.basic import BasisFunctionsMatrix as BasicBasisFunctionsMatrix
 from rbnics.backends.dolfin.function import Function
@@ -13,6 +14,7 @@ from rbnics.backends.dolfin.wrapping import (basis_functions_matrix_mul_online_m
                                              function_to_vector, get_function_subspace, get_mpi_comm)
 from rbnics.backends.online import OnlineFunction, OnlineMatrix, OnlineVector
 from rbnics.backends.online.wrapping import function_to_vector as online_function_to_online_vector
+from rbnics.utils.config import config
 from rbnics.utils.decorators import BackendFor, list_of, ModuleWrapper
 
 backend = ModuleWrapper(Function, FunctionsList)
@@ -25,4 +27,39 @@ BasisFunctionsMatrix_Base = BasicBasisFunctionsMatrix(backend, wrapping, online_
 
 @BackendFor("dolfin", inputs=(FunctionSpace, (list_of(str), str, None)))
 class BasisFunctionsMatrix(BasisFunctionsMatrix_Base):
-    pass
+    def __init__(self, space, component=None):
+        BasisFunctionsMatrix_Base.__init__(self, space, component)
+        # In "contiguous" mode the locally owned dofs of all basis functions are also stored as columns of a single
+        # column major array, so that products with online vectors and matrices and projections of offline vectors
+        # and matrices become dense BLAS operations followed by a single reduction; in "objects" mode such
+        # array is rather assembled (and cached) only the first time that content_as_array() is called
+        assert config.get("backends", "basis functions storage") in ("contiguous", "objects")
+        self._contiguous = config.get("backends", "basis functions storage") == "contiguous"
+        self._content_as_array = None  # allocated with spare columns, so that enrichment does not reallocate it
+        self._content_as_array_functions = tuple()  # basis functions currently stored in _content_as_array
+
+    def content_as_array(self):
+        """
+        Returns a column major array of shape (number of locally owned dofs, number of basis functions), whose
+        columns are the basis functions of all components. The array is updated by copying only basis functions
+        which have been added since the previous call, since basis functions are compared by identity: changes
+        to the values of a basis function which has been already stored are not tracked.
+        """
+        functions = tuple(function for component_name in self._components_name
+                          for function in self._components[component_name])
+        N = len(functions)
+        N_stored = len(self._content_as_array_functions)
+        if N_stored > N or any(stored_function is not function for (stored_function, function) in zip(
+                self._content_as_array_functions, functions)):
+            N_stored = 0
+        if self._content_as_array is None or self._content_as_array.shape[1] < N:
+            (ownership_start, ownership_end) = self.space.dofmap().ownership_range()
+            capacity = max(N, 2 * self._content_as_array.shape[1] if self._content_as_array is not None else 0)
+            content_as_array = empty((ownership_end - ownership_start, capacity), order="F")
+            if N_stored > 0:
+                content_as_array[:, :N_stored] = self._content_as_array[:, :N_stored]
+            self._content_as_array = content_as_array
+        for n in range(N_stored, N):
+            self._content_as_array[:, n] = functions[n].vector().get_local()
+        self._content_as_array_functions = functions
+        return self._content_as_array[:, :N]
@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from ufl import Form
-from dolfin import assemble, DirichletBC, PETScLUSolver
+from dolfin import as_backend_type, assemble, DirichletBC, PETScLUSolver
 from rbnics.backends.abstract import LinearSolver as AbstractLinearSolver, LinearProblemWrapper
 from rbnics.backends.dolfin.evaluate import evaluate
 from rbnics.backends.dolfin.function import Function
@@ -17,7 +17,9 @@ from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
 
 
 @BackendFor("dolfin", inputs=((Form, Matrix.Type(), ParametrizedTensorFactory, LinearProblemWrapper),
-                              Function.Type(), (Form, ParametrizedTensorFactory, Vector.Type(), None),
+                              (Function.Type(), list_of(Function.Type())),
+                              (Form, ParametrizedTensorFactory, Vector.Type(),
+                               list_of((Form, ParametrizedTensorFactory, Vector.Type())), None),
                               (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)),
                                dict_of(str, ProductOutputDirichletBC), None)))
 class LinearSolver(AbstractLinearSolver):
@@ -31,6 +33,27 @@ class LinearSolver(AbstractLinearSolver):
         self._init_rhs(rhs, bcs)
         self._apply_bcs(bcs)
         self._linear_solver = "default"
+        self._factorization = None
+        self.monitor = None
+
+    @overload((Form, Matrix.Type(), ParametrizedTensorFactory),
+              list_of(Function.Type()), list_of((Form, ParametrizedTensorFactory, Vector.Type())),
+              (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)),
+               dict_of(str, ProductOutputDirichletBC), None))
+    def __init__(self, lhs, solution, rhs, bcs=None):
+        # Many rhs sharing the same lhs: lhs (and boundary conditions on it) are processed only once,
+        # and a single factorization is used to solve for all rhs
+        assert len(solution) == len(rhs)
+        self.solution = solution
+        self._init_lhs(lhs, bcs)
+        rhs_list = list()
+        for rhs_i in rhs:
+            self._init_rhs(rhs_i, bcs)
+            rhs_list.append(self.rhs)
+        self.rhs = rhs_list
+        self._apply_bcs(bcs)
+        self._linear_solver = "default"
+        self._factorization = None
         self.monitor = None
 
     @overload(LinearProblemWrapper, Function.Type())
@@ -89,22 +112,46 @@ class LinearSolver(AbstractLinearSolver):
     @overload((list_of(DirichletBC), ProductOutputDirichletBC))
     def _apply_bcs(self, bcs):
         for bc in bcs:
-            bc.apply(self.lhs, self.rhs)
+            self._apply_bc(bc)
 
     @overload((dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC)))
     def _apply_bcs(self, bcs):
         for key in bcs:
             for bc in bcs[key]:
-                bc.apply(self.lhs, self.rhs)
+                self._apply_bc(bc)
+
+    def _apply_bc(self, bc):
+        if isinstance(self.rhs, list):
+            bc.apply(self.lhs)
+            for rhs in self.rhs:
+                bc.apply(rhs)
+        else:
+            bc.apply(self.lhs, self.rhs)
 
     def set_parameters(self, parameters):
-        assert len(parameters) in (0, 1)
-        if len(parameters) == 1:
-            assert "linear_solver" in parameters
+        assert all([key in ("linear_solver", "factorization") for key in parameters])
         self._linear_solver = parameters.get("linear_solver", "default")
+        self._factorization = parameters.get("factorization", None)
+        assert self._factorization is None or isinstance(self._factorization, dict)
 
     def solve(self):
-        solver = PETScLUSolver(self._linear_solver)
-        solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        if self._factorization is not None or isinstance(self.rhs, list):
+            # If the caller provides a storage for the factorization, it guarantees that lhs and bcs do not change
+            # across solves sharing it: factorize lhs only the first time, and reuse the factorization for any
+            # later rhs. The caller owns the storage, and releases the factorization by clearing it.
+            # Otherwise, in case of many rhs, the factorization is only shared among them
+            factorization = self._factorization if self._factorization is not None else dict()
+            if self._linear_solver not in factorization:
+                factorization[self._linear_solver] = PETScLUSolver(
+                    self.lhs.mpi_comm(), as_backend_type(self.lhs), self._linear_solver)
+            solver = factorization[self._linear_solver]
+            if isinstance(self.rhs, list):
+                for (solution, rhs) in zip(self.solution, self.rhs):
+                    solver.solve(solution.vector(), rhs)
+            else:
+                solver.solve(self.solution.vector(), self.rhs)
+        else:
+            solver = PETScLUSolver(self._linear_solver)
+            solver.solve(self.lhs, self.solution.vector(), self.rhs)
         if self.monitor is not None:
             self.monitor(self.solution)
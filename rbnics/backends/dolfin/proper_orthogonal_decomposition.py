@@ -38,3 +38,5 @@ class ProperOrthogonalDecomposition(ProperOrthogonalDecomposition_Base):
 
     def store_snapshot(self, snapshot, component=None, weight=None):
         self.snapshots_matrix.enrich(snapshot, component, weight)
+        if self.incremental:
+            self._compress_snapshots()
@@ -6,7 +6,8 @@
 
 import os
 from logging import DEBUG, getLogger
-from mpi4py.MPI import MAX
+from mpi4py.MPI import IN_PLACE, MAX
+from numpy import full
 from dolfin import cells, has_hdf5, has_hdf5_parallel, Mesh, MeshFunction
 from rbnics.backends.abstract import ReducedMesh as AbstractReducedMesh
 from rbnics.backends.dolfin.basis_functions_matrix import BasisFunctionsMatrix
@@ -261,20 +262,19 @@ def BasicReducedMesh(backend, wrapping):
                            + str(dofs__to__reduced_dofs[component]))
             self.reduced_function_spaces[N] = tuple(reduced_function_spaces)
             # ... and fill in reduced_mesh_reduced_dofs_list ...
-            reduced_mesh_reduced_dofs_list = list()
-            for dofs in self.reduced_mesh_dofs_list:
-                reduced_dofs = list()
+            # ... where each process fills in the reduced DOFs it knows about, and then all of them are shared among
+            # all processes by a single collective operation
+            reduced_mesh_reduced_dofs_array = full((len(self.reduced_mesh_dofs_list), len(self.V)), -1, dtype=int)
+            for (index, dofs) in enumerate(self.reduced_mesh_dofs_list):
+                assert len(dofs) in (1, 2)
                 for (component, dof) in enumerate(dofs):
-                    dof_processor = -1
-                    reduced_dof = None
                     if dof in dofs__to__reduced_dofs[component]:
-                        reduced_dof = dofs__to__reduced_dofs[component][dof]
-                        dof_processor = self.mpi_comm.rank
-                    dof_processor = self.mpi_comm.allreduce(dof_processor, op=MAX)
-                    assert dof_processor >= 0
-                    reduced_dofs.append(self.mpi_comm.bcast(reduced_dof, root=dof_processor))
-                assert len(reduced_dofs) in (1, 2)
-                reduced_mesh_reduced_dofs_list.append(tuple(reduced_dofs))
+                        reduced_mesh_reduced_dofs_array[index, component] = dofs__to__reduced_dofs[component][dof]
+            self.mpi_comm.Allreduce(IN_PLACE, reduced_mesh_reduced_dofs_array, op=MAX)
+            assert (reduced_mesh_reduced_dofs_array >= 0).all()
+            reduced_mesh_reduced_dofs_list = [
+                tuple(int(reduced_dof) for reduced_dof in reduced_dofs)
+                for reduced_dofs in reduced_mesh_reduced_dofs_array]
             logger.log(DEBUG, "Reduced DOFs list " + str(reduced_mesh_reduced_dofs_list))
             logger.log(DEBUG, "corresponding to DOFs list " + str(self.reduced_mesh_dofs_list))
             self.reduced_mesh_reduced_dofs_list[N] = reduced_mesh_reduced_dofs_list
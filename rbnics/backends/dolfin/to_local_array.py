@@ -0,0 +1,48 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import empty
+from rbnics.backends.dolfin.function import Function
+from rbnics.backends.dolfin.functions_list import FunctionsList
+from rbnics.backends.dolfin.matrix import Matrix
+from rbnics.backends.dolfin.tensors_list import TensorsList
+from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping import to_petsc4py
+from rbnics.utils.decorators import backend_for, overload
+
+
+@backend_for("dolfin", inputs=((Matrix.Type(), Vector.Type(), Function.Type(), FunctionsList, TensorsList), ))
+def to_local_array(arg):
+    return _to_local_array(arg)
+
+
+@overload
+def _to_local_array(matrix: Matrix.Type()):
+    # Nonzero entries of the local rows, in the order of the sparsity pattern
+    (_, _, values) = to_petsc4py(matrix).getValuesCSR()
+    return values
+
+
+@overload
+def _to_local_array(vector: Vector.Type()):
+    return vector.get_local()
+
+
+@overload
+def _to_local_array(function: Function.Type()):
+    return function.vector().get_local()
+
+
+@overload
+def _to_local_array(functions_or_tensors_list: (FunctionsList, TensorsList)):
+    output = None
+    for (j, function_or_tensor) in enumerate(functions_or_tensors_list):
+        local_array_j = _to_local_array(function_or_tensor)
+        if output is None:
+            output = empty((local_array_j.shape[0], len(functions_or_tensors_list)))
+        output[:, j] = local_array_j
+    assert output is not None
+    return output
@@ -0,0 +1,50 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import searchsorted
+from rbnics.backends.dolfin.function import Function
+from rbnics.backends.dolfin.matrix import Matrix
+from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping import to_petsc4py
+from rbnics.utils.decorators import backend_for, overload
+
+
+@backend_for("dolfin", inputs=((Matrix.Type(), Vector.Type(), Function.Type()), tuple))
+def to_local_index(arg, dofs):
+    return _to_local_index(arg, dofs)
+
+
+@overload
+def _to_local_index(matrix: Matrix.Type(), dofs: tuple):
+    assert len(dofs) == 2
+    mat = to_petsc4py(matrix)
+    row_start, row_end = mat.getOwnershipRange()
+    (i, j) = dofs
+    if i >= row_start and i < row_end:
+        # Nonzero entries of the local rows are stored in the order of the sparsity pattern, with sorted columns
+        (indptr, indices, _) = mat.getValuesCSR()
+        (local_start, local_end) = (indptr[i - row_start], indptr[i - row_start + 1])
+        index = local_start + searchsorted(indices[local_start:local_end], j)
+        assert index < local_end and indices[index] == j
+        return int(index)
+    else:
+        return None
+
+
+@overload
+def _to_local_index(vector: Vector.Type(), dofs: tuple):
+    assert len(dofs) == 1
+    (row_start, row_end) = vector.local_range()
+    (i, ) = dofs
+    if i >= row_start and i < row_end:
+        return int(i - row_start)
+    else:
+        return None
+
+
+@overload
+def _to_local_index(function: Function.Type(), dofs: tuple):
+    return _to_local_index(function.vector(), dofs)
@@ -12,7 +12,9 @@ from rbnics.backends.dolfin.wrapping.assemble_operator_for_stability_factor impo
     assemble_operator_for_stability_factor)
 from rbnics.backends.dolfin.wrapping.assemble_operator_for_supremizers import assemble_operator_for_supremizers
 from rbnics.backends.dolfin.wrapping.basis_functions_matrix_mul import (
-    basis_functions_matrix_mul_online_matrix, basis_functions_matrix_mul_online_vector)
+    basis_functions_matrix_mul_online_matrix, basis_functions_matrix_mul_online_vector,
+    basis_functions_matrix_transpose_mul_matrix_mul_basis_functions_matrix,
+    basis_functions_matrix_transpose_mul_vector)
 from rbnics.backends.dolfin.wrapping.compute_theta_for_derivative import compute_theta_for_derivative
 from rbnics.backends.dolfin.wrapping.compute_theta_for_derivatives import compute_theta_for_derivatives
 from rbnics.backends.dolfin.wrapping.compute_theta_for_restriction import compute_theta_for_restriction
@@ -98,6 +100,8 @@ __all__ = [
     "assemble_operator_for_supremizers",
     "basis_functions_matrix_mul_online_matrix",
     "basis_functions_matrix_mul_online_vector",
+    "basis_functions_matrix_transpose_mul_matrix_mul_basis_functions_matrix",
+    "basis_functions_matrix_transpose_mul_vector",
     "build_dof_map_reader_mapping",
     "build_dof_map_writer_mapping",
     "compute_theta_for_derivative",
@@ -4,7 +4,11 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from mpi4py.MPI import IN_PLACE, SUM
+from numpy import asarray, zeros
+from petsc4py import PETSc
 from dolfin import Function, FunctionSpace
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 
 
 def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matrix, BasisFunctionsMatrixType):
@@ -13,6 +17,17 @@ def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matr
 
     output = BasisFunctionsMatrixType(space)
     assert isinstance(online_matrix.M, dict)
+    if basis_functions_matrix._contiguous:
+        output_content = basis_functions_matrix.content_as_array().dot(asarray(online_matrix, dtype=float))
+        j = 0
+        for col_component_name in basis_functions_matrix._components_name:
+            for _ in range(online_matrix.M[col_component_name]):
+                output_j = Function(space)
+                output_j.vector().set_local(output_content[:, j])
+                output_j.vector().apply("insert")
+                output.enrich(output_j)
+                j += 1
+        return output
     j = 0
     for col_component_name in basis_functions_matrix._components_name:
         for _ in range(online_matrix.M[col_component_name]):
@@ -37,6 +52,10 @@ def basis_functions_matrix_mul_online_vector(basis_functions_matrix, online_vect
     output = Function(space)
     if sum(basis_functions_matrix._component_name_to_basis_component_length.values()) == 0:
         return output
+    elif basis_functions_matrix._contiguous:
+        output.vector().set_local(basis_functions_matrix.content_as_array().dot(asarray(online_vector, dtype=float)))
+        output.vector().apply("insert")
+        return output
     else:
         i = 0
         for component_name in basis_functions_matrix._components_name:
@@ -45,3 +64,32 @@ def basis_functions_matrix_mul_online_vector(basis_functions_matrix, online_vect
                 i += 1
         output.vector().apply("add")
         return output
+
+
+def basis_functions_matrix_transpose_mul_vector(basis_functions_matrix, vector):
+    assert basis_functions_matrix._contiguous
+    output = basis_functions_matrix.content_as_array().T.dot(vector.get_local())
+    basis_functions_matrix.mpi_comm.Allreduce(IN_PLACE, output, op=SUM)
+    return output
+
+
+def basis_functions_matrix_transpose_mul_matrix_mul_basis_functions_matrix(
+        basis_functions_matrix, matrix, other_basis_functions_matrix):
+    assert basis_functions_matrix._contiguous
+    assert other_basis_functions_matrix._contiguous
+    content = basis_functions_matrix.content_as_array()
+    other_content = other_basis_functions_matrix.content_as_array()
+    if content.shape[1] == 0 or other_content.shape[1] == 0:
+        return zeros((content.shape[1], other_content.shape[1]))
+    # Wrap the (column major) local content of the other basis functions matrix in a dense PETSc matrix without
+    # copying it, so that the action of the matrix on all basis functions is computed by a single MatMatMult
+    matrix = to_petsc4py(matrix)
+    other_content = PETSc.Mat().createDense(
+        size=((other_content.shape[0], PETSc.DECIDE), (PETSc.DECIDE, other_content.shape[1])),
+        array=other_content, comm=matrix.getComm())
+    matrix_mul_other_content = matrix.matMult(other_content)
+    output = content.T.dot(matrix_mul_other_content.getDenseArray())
+    matrix_mul_other_content.destroy()
+    other_content.destroy()
+    basis_functions_matrix.mpi_comm.Allreduce(IN_PLACE, output, op=SUM)
+    return output
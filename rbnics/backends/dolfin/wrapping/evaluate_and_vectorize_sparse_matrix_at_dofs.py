@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from mpi4py.MPI import MAX
+from mpi4py.MPI import IN_PLACE, SUM
+from numpy import zeros
 from rbnics.backends.online import OnlineVector
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 
@@ -14,17 +15,17 @@ def evaluate_and_vectorize_sparse_matrix_at_dofs(sparse_matrix, dofs_list):
     row_start, row_end = mat.getOwnershipRange()
     out_size = len(dofs_list)
     out = OnlineVector(out_size)
-    mpi_comm = mat.comm.tompi4py()
+    # Each process fetches the values of the rows it owns, and then values (together with the number of processes
+    # which own each row) are shared among all processes by a single collective operation
+    values_and_owners = zeros((2, out_size))
     for (index, dofs) in enumerate(dofs_list):
         assert len(dofs) == 2
         i = dofs[0]
-        out_index = None
-        mat_ij_processor = -1
         if i >= row_start and i < row_end:
             j = dofs[1]
-            out_index = mat.getValue(i, j)
-            mat_ij_processor = mpi_comm.rank
-        mat_ij_processor = mpi_comm.allreduce(mat_ij_processor, op=MAX)
-        assert mat_ij_processor >= 0
-        out[index] = mpi_comm.bcast(out_index, root=mat_ij_processor)
+            values_and_owners[0, index] = mat.getValue(i, j)
+            values_and_owners[1, index] = 1.
+    mat.comm.tompi4py().Allreduce(IN_PLACE, values_and_owners, op=SUM)
+    assert all(values_and_owners[1] == 1.)
+    out[:] = values_and_owners[0]
     return out
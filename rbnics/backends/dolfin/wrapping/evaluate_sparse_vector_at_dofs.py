@@ -4,26 +4,32 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from mpi4py.MPI import MAX
+from mpi4py.MPI import IN_PLACE, SUM
+from numpy import array, zeros
+from petsc4py import PETSc
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 from rbnics.backends.online import OnlineVector
 
 
 def evaluate_sparse_vector_at_dofs(sparse_vector, dofs_list):
     vec = to_petsc4py(sparse_vector)
-    row_start, row_end = vec.getOwnershipRange()
+    assert all(len(dofs) == 1 for dofs in dofs_list)
     out_size = len(dofs_list)
     out = OnlineVector(out_size)
-    mpi_comm = vec.comm.tompi4py()
-    for (index, dofs) in enumerate(dofs_list):
-        assert len(dofs) == 1
-        i = dofs[0]
-        out_index = None
-        vec_i_processor = -1
-        if i >= row_start and i < row_end:
-            out_index = vec.getValue(i)
-            vec_i_processor = mpi_comm.rank
-        vec_i_processor = mpi_comm.allreduce(vec_i_processor, op=MAX)
-        assert vec_i_processor >= 0
-        out[index] = mpi_comm.bcast(out_index, root=vec_i_processor)
+    out[:] = _evaluate_sparse_vector_at_rows(vec, [dofs[0] for dofs in dofs_list])
     return out
+
+
+def _evaluate_sparse_vector_at_rows(vec, rows):
+    # Each process fetches the values of the rows it owns, and then values (together with the number of processes
+    # which own each row) are shared among all processes by a single collective operation
+    rows = array(rows, dtype=PETSc.IntType)
+    row_start, row_end = vec.getOwnershipRange()
+    owned = (rows >= row_start) & (rows < row_end)
+    values_and_owners = zeros((2, len(rows)))
+    if owned.any():
+        values_and_owners[0, owned] = vec.getValues(rows[owned])
+        values_and_owners[1, owned] = 1.
+    vec.comm.tompi4py().Allreduce(IN_PLACE, values_and_owners, op=SUM)
+    assert all(values_and_owners[1] == 1.)
+    return values_and_owners[0]
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from collections import defaultdict, namedtuple, OrderedDict
+import hashlib
 import itertools
 import numbers
 import re
@@ -34,12 +35,14 @@ from rbnics.backends.dolfin.wrapping.compute_theta_for_stability_factor import c
 from rbnics.backends.dolfin.wrapping.expand_sum_product import expand_sum_product
 from rbnics.backends.dolfin.wrapping.form_description import form_description
 import rbnics.backends.dolfin.wrapping.form_mul  # enable form multiplication and division  # noqa: F401
+from rbnics.backends.dolfin.wrapping.form_name import form_name
 from rbnics.backends.dolfin.wrapping.parametrized_expression import ParametrizedExpression
 from rbnics.backends.dolfin.wrapping.remove_complex_nodes import remove_complex_nodes
 from rbnics.eim.utils.decorators import DefineSymbolicParameters
 from rbnics.utils.cache import Cache
+from rbnics.utils.io import PickleIO
 from rbnics.utils.decorators import (overload, PreserveClassName, ProblemDecoratorFor, ReducedProblemDecoratorFor,
-                                     ReductionMethodDecoratorFor)
+                                     ReductionMethodDecoratorFor, vectorized_compute_theta)
 from rbnics.utils.test import PatchInstanceMethod
 
 logger = getLogger("rbnics/backends/dolfin/wrapping/pull_back_to_reference_domain.py")
@@ -660,7 +663,7 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
             + " or ShapeParametrization")
 
         from rbnics.backends.dolfin import SeparatedParametrizedForm
-        from rbnics.shape_parametrization.utils.symbolic import sympy_eval
+        from rbnics.shape_parametrization.utils.symbolic import sympy_eval, sympy_lambdify
 
         @DefineSymbolicParameters
         @PreserveClassName
@@ -678,12 +681,42 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                 self._pull_back_is_affine = dict()
                 self._pulled_back_operators = dict()
                 self._pulled_back_theta_factors = dict()
+                self._pulled_back_theta_factors_functions = dict()
                 (self._facet_id_to_subdomain_ids,
                  self._subdomain_id_to_facet_ids) = self._map_facet_id_to_subdomain_id(**kwargs)
                 self._facet_id_to_normal_direction_if_straight = self._map_facet_id_to_normal_direction_if_straight(
                     **kwargs)
                 self._shape_parametrization_expressions_sympy_to_ufl = dict()
                 self._shape_parametrization_expressions_ufl_to_sympy = dict()
+                # Cache of the symbolic preprocessing of pulled back forms, which may be persisted on disk
+                # so that it is carried out only once among different runs
+                self._pull_back_collected_forms_theta_factors = None
+
+                def _pull_back_cache_key_generator(*args, **kwargs):
+                    assert len(args) == 1
+                    assert len(kwargs) == 0
+                    return args[0]
+
+                def _pull_back_cache_import(filename):
+                    return PickleIO.load_file(self.folder["cache"], filename)
+
+                def _pull_back_cache_export(filename):
+                    self.folder["cache"].create()
+                    PickleIO.save_file(self._pull_back_collected_forms_theta_factors, self.folder["cache"], filename)
+
+                def _pull_back_cache_filename_generator(*args, **kwargs):
+                    assert len(args) == 1
+                    assert len(kwargs) == 0
+                    return "pull_back_" + args[0]
+
+                self._pull_back_cache = Cache(
+                    "problems",
+                    key_generator=_pull_back_cache_key_generator,
+                    import_=_pull_back_cache_import,
+                    export=_pull_back_cache_export,
+                    filename_generator=_pull_back_cache_filename_generator,
+                    folder=self.folder["cache"]
+                )
                 # Customize DEIM, EIM and ExactParametrizedFunctions decorators so that forms are pulled back
                 # to the reference domain before applying DEIM, EIM or exact initialization.
                 if hasattr(self, "_init_DEIM_approximations"):
@@ -756,19 +789,13 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                                 for (q, pulled_back_form) in enumerate(pulled_back_forms):
                                     if (q in separated_pulled_back_forms
                                             and self._is_affine_parameter_dependent(separated_pulled_back_forms[q])):
-                                        postprocessed_pulled_back_forms.append(
-                                            self._get_affine_parameter_dependent_forms(
-                                                separated_pulled_back_forms[q]))
-                                        postprocessed_pulled_back_theta_factors.append(
-                                            self._get_affine_parameter_dependent_theta_factors(
-                                                separated_pulled_back_forms[q]))
+                                        (collected_forms, collected_theta_factors) = (
+                                            self._get_affine_parameter_dependent_collected_forms_theta_factors(
+                                                pulled_back_form, separated_pulled_back_forms[q]))
+                                        postprocessed_pulled_back_forms.append(collected_forms)
+                                        postprocessed_pulled_back_theta_factors.append(collected_theta_factors)
                                         assert len(postprocessed_pulled_back_forms) == q + 1
                                         assert len(postprocessed_pulled_back_theta_factors) == q + 1
-                                        (postprocessed_pulled_back_forms[q],
-                                         postprocessed_pulled_back_theta_factors[q]) = (
-                                            collect_common_forms_theta_factors(
-                                                postprocessed_pulled_back_forms[q],
-                                                postprocessed_pulled_back_theta_factors[q]))
                                         pull_back_is_affine.append(
                                             (True, ) * len(postprocessed_pulled_back_forms[q]))
                                     else:
@@ -885,10 +912,20 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
             def compute_theta(self, term):
                 if term in self._pulled_back_theta_factors:
                     thetas = ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term)
-                    return tuple([sympy_eval(str(pulled_back_theta_factor), {"mu": self.mu}) * thetas[q]
-                                  for (q, pulled_back_theta_factors) in enumerate(
-                                      self._pulled_back_theta_factors[term])
-                                  for pulled_back_theta_factor in pulled_back_theta_factors])
+                    if term not in self._pulled_back_theta_factors_functions:
+                        # Compile all theta factors of the current term once and for all
+                        self._pulled_back_theta_factors_functions[term] = (
+                            sympy_lambdify([pulled_back_theta_factor
+                                            for pulled_back_theta_factors in self._pulled_back_theta_factors[term]
+                                            for pulled_back_theta_factor in pulled_back_theta_factors],
+                                           len(self.mu)),
+                            tuple([q for (q, pulled_back_theta_factors) in enumerate(
+                                self._pulled_back_theta_factors[term]) for _ in pulled_back_theta_factors]))
+                    (pulled_back_theta_factors_function, pulled_back_theta_factors_to_q) = (
+                        self._pulled_back_theta_factors_functions[term])
+                    return tuple([pulled_back_theta_factor * thetas[q]
+                                  for (pulled_back_theta_factor, q) in zip(
+                                      pulled_back_theta_factors_function(self.mu), pulled_back_theta_factors_to_q)])
                 elif term in self._stability_factor_terms_blacklist:
                     return self._stability_factor_decorated_compute_theta(self, term)
                 else:
@@ -1022,6 +1059,30 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                 # Otherwise, the pulled back form is affine
                 return True
 
+            def _get_affine_parameter_dependent_collected_forms_theta_factors(
+                    self, pulled_back_form, separated_pulled_back_form):
+                affine_parameter_dependent_forms = self._get_affine_parameter_dependent_forms(
+                    separated_pulled_back_form)
+                # The symbolic computation of theta factors and their collection only depend on the shape
+                # parametrization and on the pulled back form: skip them if their result is already available
+                pull_back_cache_key = self._pull_back_cache_key(pulled_back_form)
+                try:
+                    (collected_forms_sympy, collected_theta_factors) = self._pull_back_cache[pull_back_cache_key]
+                except KeyError:
+                    affine_parameter_dependent_theta_factors = self._get_affine_parameter_dependent_theta_factors(
+                        separated_pulled_back_form)
+                    self._pull_back_collected_forms_theta_factors = collect_common_forms_theta_factors_sympy(
+                        forms_to_sympy(affine_parameter_dependent_forms), affine_parameter_dependent_theta_factors)
+                    self._pull_back_cache[pull_back_cache_key] = self._pull_back_collected_forms_theta_factors
+                    (collected_forms_sympy, collected_theta_factors) = self._pull_back_collected_forms_theta_factors
+                return (sympy_to_forms(collected_forms_sympy, affine_parameter_dependent_forms),
+                        collected_theta_factors)
+
+            def _pull_back_cache_key(self, pulled_back_form):
+                cache_key = (self.shape_parametrization_expression, self._facet_id_to_normal_direction_if_straight,
+                             len(self.mu), form_name(pulled_back_form))
+                return hashlib.sha1(str(cache_key).encode("utf-8")).hexdigest()
+
             def _get_affine_parameter_dependent_forms(self, separated_pulled_back_form):
                 affine_parameter_dependent_forms = list()
                 # Append forms which were not originally affinely dependent
@@ -1111,6 +1172,11 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                 theta_factor_sympy = simplify(convert_float_to_int_if_possible(theta_factor_sympy))
                 return theta_factor_sympy
 
+        # Theta factors are evaluated by NumPy, so that pulled back thetas can be computed for a batch
+        # of parameters whenever the original ones can
+        if getattr(ParametrizedDifferentialProblem_DerivedClass.compute_theta, "vectorized", False):
+            vectorized_compute_theta(PullBackFormsToReferenceDomainDecoratedProblem_Class.compute_theta)
+
         # return value (a class) for the decorator
         return PullBackFormsToReferenceDomainDecoratedProblem_Class
 
@@ -1214,7 +1280,23 @@ def convert_float_to_int_if_possible(theta_factor):
     return theta_factor
 
 
-def collect_common_forms_theta_factors(postprocessed_pulled_back_forms, postprocessed_pulled_back_theta_factors):
+def forms_to_sympy(forms):
+    # Convert forms to sympy symbols, such that equal forms are associated to the same symbol
+    forms_ufl_to_sympy = dict()
+    for form in forms:
+        if form not in forms_ufl_to_sympy:
+            forms_ufl_to_sympy[form] = symbols("sympyform" + str(len(forms_ufl_to_sympy)))
+    return tuple(forms_ufl_to_sympy[form] for form in forms)
+
+
+def sympy_to_forms(forms_sympy, forms):
+    from rbnics.shape_parametrization.utils.symbolic import sympy_eval
+    # Convert sympy combinations of symbols (as returned by forms_to_sympy) back to ufl
+    forms_sympy_id_to_ufl = {str(form_sympy): form for (form_sympy, form) in zip(forms_to_sympy(forms), forms)}
+    return tuple(sympy_eval(str(form_sympy), forms_sympy_id_to_ufl) for form_sympy in forms_sympy)
+
+
+def collect_common_forms_theta_factors_sympy(postprocessed_pulled_back_forms, postprocessed_pulled_back_theta_factors):
     from rbnics.shape_parametrization.utils.symbolic import sympy_eval
     # Remove all zero theta factors
     postprocessed_pulled_back_forms_non_zero = list()
@@ -1225,16 +1307,6 @@ def collect_common_forms_theta_factors(postprocessed_pulled_back_forms, postproc
         if postprocessed_pulled_back_theta_factor != 0:
             postprocessed_pulled_back_forms_non_zero.append(postprocessed_pulled_back_form)
             postprocessed_pulled_back_theta_factors_non_zero.append(postprocessed_pulled_back_theta_factor)
-    # Convert forms to sympy symbols
-    postprocessed_pulled_back_forms_ufl_to_sympy = dict()
-    postprocessed_pulled_back_forms_sympy_id_to_ufl = dict()
-    for postprocessed_pulled_back_form in postprocessed_pulled_back_forms_non_zero:
-        if postprocessed_pulled_back_form not in postprocessed_pulled_back_forms_ufl_to_sympy:
-            sympy_id = "sympyform" + str(len(postprocessed_pulled_back_forms_sympy_id_to_ufl))
-            postprocessed_pulled_back_form_sympy = symbols(sympy_id)
-            postprocessed_pulled_back_forms_ufl_to_sympy[
-                postprocessed_pulled_back_form] = postprocessed_pulled_back_form_sympy
-            postprocessed_pulled_back_forms_sympy_id_to_ufl[sympy_id] = postprocessed_pulled_back_form
     # Convert theta factors to sympy symbols
     postprocessed_pulled_back_theta_factors_sympy_independents = list()
     postprocessed_pulled_back_theta_factors_ufl_to_sympy = dict()
@@ -1263,7 +1335,7 @@ def collect_common_forms_theta_factors(postprocessed_pulled_back_forms, postproc
             postprocessed_pulled_back_forms_non_zero, postprocessed_pulled_back_theta_factors_non_zero):
         postprocessed_pulled_back_sum_product += (
             postprocessed_pulled_back_theta_factors_ufl_to_sympy[postprocessed_pulled_back_theta_factor]
-            * postprocessed_pulled_back_forms_ufl_to_sympy[postprocessed_pulled_back_form])
+            * postprocessed_pulled_back_form)
     # Collect first with respect to theta factors
     collected_with_respect_to_theta = collect(
         postprocessed_pulled_back_sum_product, postprocessed_pulled_back_theta_factors_sympy_independents,
@@ -1293,12 +1365,11 @@ def collect_common_forms_theta_factors(postprocessed_pulled_back_forms, postproc
             collected_form = collected_form / ratio
             assert collected_form in collected_with_respect_to_form
             collected_with_respect_to_form_ordered[collected_form] = collected_with_respect_to_form[collected_form]
-    # Convert back to ufl
+    # Convert back theta factors, while forms are still left as sympy combinations of the input symbols
     collected_forms = list()
     collected_theta_factors = list()
     for (collected_form, collected_theta_factor) in collected_with_respect_to_form_ordered.items():
-        collected_forms.append(
-            sympy_eval(str(collected_form), postprocessed_pulled_back_forms_sympy_id_to_ufl))
+        collected_forms.append(collected_form)
         collected_theta_factors.append(
             sympy_eval(str(collected_theta_factor), postprocessed_pulled_back_theta_factors_sympy_id_to_ufl))
     # Return
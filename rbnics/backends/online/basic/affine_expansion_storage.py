@@ -153,25 +153,8 @@ def AffineExpansionStorage(backend, wrapping):
                              "component_name_to_basis_component_length")
 
         def load(self, directory, filename):
-            if self._content is not None:  # avoid loading multiple times
-                if self._content.size > 0:
-                    it = AffineExpansionStorageContent_Iterator(
-                        self._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
-                    while not it.finished:
-                        if self._content[it.multi_index] is not None:
-                            # ... but only if there is at least one element different from None
-                            if isinstance(self._content[it.multi_index], AbstractFunctionsList):
-                                if len(self._content[it.multi_index]) > 0:
-                                    # ... unless it is an empty FunctionsList
-                                    return False
-                            elif isinstance(self._content[it.multi_index], AbstractBasisFunctionsMatrix):
-                                if sum(self._content[
-                                        it.multi_index]._component_name_to_basis_component_length.values()) > 0:
-                                    # ... unless it is an empty BasisFunctionsMatrix
-                                    return False
-                            else:
-                                return False
-                        it.iternext()
+            if self._is_loaded():  # avoid loading multiple times
+                return False
             # Get full directory name
             full_directory = Folders.Folder(os.path.join(str(directory), filename))
             # Exit in the trivial case of empty affine expansion
@@ -191,6 +174,28 @@ def AffineExpansionStorage(backend, wrapping):
             # Return
             return True
 
+        def _is_loaded(self):
+            if self._content is not None:
+                if self._content.size > 0:
+                    it = AffineExpansionStorageContent_Iterator(
+                        self._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
+                    while not it.finished:
+                        if self._content[it.multi_index] is not None:
+                            # ... but only if there is at least one element different from None
+                            if isinstance(self._content[it.multi_index], AbstractFunctionsList):
+                                if len(self._content[it.multi_index]) > 0:
+                                    # ... unless it is an empty FunctionsList
+                                    return True
+                            elif isinstance(self._content[it.multi_index], AbstractBasisFunctionsMatrix):
+                                if sum(self._content[
+                                        it.multi_index]._component_name_to_basis_component_length.values()) > 0:
+                                    # ... unless it is an empty BasisFunctionsMatrix
+                                    return True
+                            else:
+                                return True
+                        it.iternext()
+            return False
+
         def _load_content_item_type_shape(self, full_directory):
             assert ContentItemTypeIO.exists_file(full_directory, "content_item_type")
             content_item_type = ContentItemTypeIO.load_file(full_directory, "content_item_type")
@@ -4,7 +4,6 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from itertools import product as cartesian_product
 from numbers import Number
 from rbnics.backends.abstract import ParametrizedTensorFactory as AbstractParametrizedTensorFactory
 from rbnics.backends.basic.wrapping import DelayedTranspose
@@ -26,24 +25,24 @@ def product(backend, wrapping):
                     backend.Matrix.Type(), backend.Vector.Type(), backend.Function.Type(), Number))
                 assert thetas2 is None
                 assert len(thetas) == len(operators)
-                for (index, (theta, operator)) in enumerate(zip(thetas, operators)):
-                    if index == 0:
-                        output = theta * operator
-                    elif theta != 0.:
-                        output += theta * operator
+                if isinstance(first_operator, backend.Function.Type()):
+                    for (index, (theta, operator)) in enumerate(zip(thetas, operators)):
+                        if index == 0:
+                            output = theta * operator
+                        elif theta != 0.:
+                            output += theta * operator
+                else:
+                    # contract all Q terms at once, rather than with a Python loop over each term
+                    output = self._wrap_contraction(
+                        first_operator, wrapping.affine_expansion_storage_contraction(thetas, operators))
             elif order == 2:
                 # matrix storage of affine expansion online data structures (e.g. error estimation ff/af/aa products)
                 first_operator = operators[0, 0]
                 assert isinstance(first_operator, (backend.Matrix.Type(), backend.Vector.Type(), Number))
                 assert thetas2 is not None
-                # no checks here on the first dimension of operators should be equal to len(thetas), and
-                # similarly that the second dimension should be equal to len(thetas2), because the
-                # current operator interface does not provide a 2D len method
-                for (i, j) in cartesian_product(range(len(thetas)), range(len(thetas2))):
-                    if i == 0 and j == 0:
-                        output = thetas[0] * operators[0, 0] * thetas2[0]
-                    elif thetas[i] != 0. and thetas2[j] != 0.:
-                        output += thetas[i] * operators[i, j] * thetas2[j]
+                # contract all Q1 x Q2 terms at once, rather than with a Python loop over each (i, j) term
+                output = self._wrap_contraction(
+                    first_operator, wrapping.affine_expansion_storage_contraction(thetas, operators, thetas2))
             else:
                 raise ValueError("product(): invalid operands.")
             # Return
@@ -99,6 +98,19 @@ def product(backend, wrapping):
             else:
                 raise ValueError("Invalid type")
 
+        @staticmethod
+        def _wrap_contraction(first_operator, output_content):
+            if isinstance(first_operator, backend.Matrix.Type()):
+                output = type(first_operator)(first_operator.M, first_operator.N, output_content)
+                first_operator._arithmetic_operations_preserve_attributes(output, other_order=0)
+            elif isinstance(first_operator, backend.Vector.Type()):
+                output = type(first_operator)(first_operator.N, output_content)
+                first_operator._arithmetic_operations_preserve_attributes(output, other_order=0)
+            else:
+                assert isinstance(first_operator, Number)
+                output = float(output_content)
+            return output
+
     # Auxiliary class to signal to the sum() function that it is dealing with an output of the product() method
     class ProductOutput(object):
         def __init__(self, sum_product_return_value):
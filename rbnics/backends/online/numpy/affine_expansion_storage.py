@@ -4,13 +4,20 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numbers import Number
+import os
+from numpy import array, asarray, may_share_memory, stack, zeros
 from rbnics.backends.online.basic import AffineExpansionStorage as BasicAffineExpansionStorage
+from rbnics.backends.online.basic.wrapping import slice_to_array
 from rbnics.backends.online.numpy.copy import function_copy, tensor_copy
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.vector import Vector
 from rbnics.backends.online.numpy.wrapping import function_load, function_save, tensor_load, tensor_save
+from rbnics.utils.config import config
 from rbnics.utils.decorators import BackendFor, ModuleWrapper, tuple_of
+from rbnics.utils.io import (ComponentNameToBasisComponentIndexDict, Folders, NumpyArchiveIO, OnlineSizeDict,
+                             TextIO)
 
 backend = ModuleWrapper(Function, Matrix, Vector)
 wrapping = ModuleWrapper(function_load, function_save, tensor_load, tensor_save, function_copy=function_copy,
@@ -21,4 +28,213 @@ AffineExpansionStorage_Base = BasicAffineExpansionStorage(backend, wrapping)
 @BackendFor("numpy", inputs=((int, tuple_of(Matrix.Type()), tuple_of(Vector.Type())), (int, None)))
 class AffineExpansionStorage(AffineExpansionStorage_Base):
     def __init__(self, arg1, arg2=None):
+        # In "contiguous" mode all matrices (or vectors) are stored in a single array with leading axes given by
+        # the affine expansion, and each item is a view on it; in "objects" mode each item owns its own content,
+        # and such array is rather assembled (and cached) the first time that content_as_array() is called
+        assert config.get("backends", "online affine expansion storage") in ("contiguous", "objects")
+        self._contiguous = config.get("backends", "online affine expansion storage") == "contiguous"
+        self._content_as_array = None
         AffineExpansionStorage_Base.__init__(self, arg1, arg2)
+
+    def __getitem__(self, key):
+        if (self._contiguous and self._content_as_array is not None
+                and isinstance(self._content.flat[0], (Matrix.Type(), Vector.Type()))
+                and (isinstance(key, slice) or (isinstance(key, tuple)
+                                                and all([isinstance(key_i, slice) for key_i in key])))):
+            return self._getitem_as_view(key)
+        else:
+            return AffineExpansionStorage_Base.__getitem__(self, key)
+
+    def _getitem_as_view(self, key):
+        """
+        return the subtensors of size "key" for every element in content, as views of the contiguous storage
+        """
+        first_item = self._content.flat[0]
+        slices = slice_to_array(first_item, key, self._component_name_to_basis_component_length,
+                                self._component_name_to_basis_component_index)
+        if slices not in self._precomputed_slices:
+            if isinstance(first_item, Vector.Type()):
+                basic_slices = (_to_basic_slice(slices), )
+            else:
+                basic_slices = tuple(_to_basic_slice(slices_i) for slices_i in slices)
+            if None in basic_slices:  # not a contiguous range, thus a view is not possible
+                return AffineExpansionStorage_Base.__getitem__(self, key)
+            # Slice the first item in order to get shape and auxiliary attributes of the output items
+            sliced_first_item = first_item[key]
+            output = AffineExpansionStorage_Base.__new__(type(self), *self._content.shape)
+            output.__init__(*self._content.shape)
+            output._content_as_array = self._content_as_array[(Ellipsis, ) + basic_slices]
+            for (index, _) in enumerate(self._content.flat):
+                multi_index = _unravel_index(index, self._content.shape)
+                output[multi_index] = _view_like(sliced_first_item, output._content_as_array[multi_index])
+            self._precomputed_slices[slices] = output
+        return self._precomputed_slices[slices]
+
+    def __setitem__(self, key, item):
+        if self._contiguous and isinstance(item, (Matrix.Type(), Vector.Type(), Number)):
+            item_shape = _content_shape(item)
+            if self._content_as_array is not None and may_share_memory(_content(item), self._content_as_array):
+                # item is already a view of the contiguous storage, e.g. when slicing
+                pass
+            else:
+                if key == self._smallest_key or self._content_as_array is None:
+                    self._content_as_array = zeros(self._content.shape + item_shape)
+                if self._content_as_array.shape[len(self._content.shape):] == item_shape:
+                    self._content_as_array[key] = _content(item)
+                    if not isinstance(item, Number):
+                        item = _view_like(item, self._content_as_array[key])
+                else:  # items of different shapes cannot be stored contiguously
+                    self._contiguous = False
+                    self._content_as_array = None
+        else:
+            self._contiguous = False
+            self._content_as_array = None
+        AffineExpansionStorage_Base.__setitem__(self, key, item)
+
+    def save(self, directory, filename):
+        assert config.get("backends", "online affine expansion storage format") in ("archive", "files")
+        if (config.get("backends", "online affine expansion storage format") == "archive"
+                and self._content.size > 0
+                and isinstance(self._content.flat[0], (Matrix.Type(), Vector.Type(), Number))):
+            self._save_archive(directory, filename)
+        else:
+            AffineExpansionStorage_Base.save(self, directory, filename)
+
+    def _save_archive(self, directory, filename):
+        """
+        save the whole content in a single (memory mappable) file, rather than in one file per item
+        """
+        Folders.Folder(str(directory)).create()
+        first_item = self._content.flat[0]
+        if isinstance(first_item, Matrix.Type()):
+            content_item_type = "matrix"
+            content_item_shape = (first_item.M, first_item.N)
+        elif isinstance(first_item, Vector.Type()):
+            content_item_type = "vector"
+            content_item_shape = first_item.N
+        else:
+            content_item_type = "scalar"
+            content_item_shape = None
+        metadata = {
+            "content_item_type": content_item_type,
+            "content_item_shape": content_item_shape,
+            "component_name_to_basis_component_index": self._component_name_to_basis_component_index,
+            "component_name_to_basis_component_length": self._component_name_to_basis_component_length
+        }
+        NumpyArchiveIO.save_file({"content": self.content_as_array()}, directory, filename, metadata)
+
+    def load(self, directory, filename):
+        # Look for files saved in the current format first, and then for the ones saved in the other format
+        if config.get("backends", "online affine expansion storage format") == "archive":
+            load_archive = NumpyArchiveIO.exists_file(directory, filename)
+        else:
+            load_archive = (not TextIO.exists_file(os.path.join(str(directory), filename), "content_item_type")
+                            and NumpyArchiveIO.exists_file(directory, filename))
+        if load_archive:
+            if self._is_loaded():  # avoid loading multiple times
+                return False
+            self._load_archive(directory, filename)
+            return True
+        return_value = AffineExpansionStorage_Base.load(self, directory, filename)
+        if return_value:
+            self._content_as_array = None
+            if self._contiguous and self._content.size > 0:
+                first_item = self._content.flat[0]
+                if isinstance(first_item, (Matrix.Type(), Vector.Type(), Number)):
+                    # Move loaded content to the contiguous storage, and replace items with views on it
+                    self.content_as_array()
+                    if not isinstance(first_item, Number):
+                        for (index, item) in enumerate(self._content.flat):
+                            item.content = self._content_as_array[_unravel_index(index, self._content.shape)]
+                else:
+                    self._contiguous = False
+        return return_value
+
+    def _load_archive(self, directory, filename):
+        """
+        load the content from a single file, as a (copy-on-write) memory map. Items are views on it
+        """
+        (content, metadata) = NumpyArchiveIO.load_file(directory, filename, globals={
+            "ComponentNameToBasisComponentIndexDict": ComponentNameToBasisComponentIndexDict,
+            "OnlineSizeDict": OnlineSizeDict})
+        content_as_array = asarray(content["content"])
+        assert content_as_array.shape[:len(self._content.shape)] == self._content.shape
+        content_item_type = metadata["content_item_type"]
+        assert content_item_type in ("matrix", "vector", "scalar")
+        for (index, _) in enumerate(self._content.flat):
+            multi_index = _unravel_index(index, self._content.shape)
+            if content_item_type == "matrix":
+                (M, N) = metadata["content_item_shape"]
+                item = Matrix.Type()(M, N, content_as_array[multi_index])
+            elif content_item_type == "vector":
+                N = metadata["content_item_shape"]
+                item = Vector.Type()(N, content_as_array[multi_index])
+            else:
+                item = float(content_as_array[multi_index])
+            if content_item_type in ("matrix", "vector"):
+                if metadata["component_name_to_basis_component_index"] is not None:
+                    item._component_name_to_basis_component_index = metadata[
+                        "component_name_to_basis_component_index"]
+                if metadata["component_name_to_basis_component_length"] is not None:
+                    item._component_name_to_basis_component_length = metadata[
+                        "component_name_to_basis_component_length"]
+            self._content_as_array = content_as_array  # to avoid copies in contiguous mode
+            self[multi_index] = item
+        self._content_as_array = content_as_array
+
+    def content_as_array(self):
+        """
+        return the content as a single contiguous array, whose leading axes are the ones of the affine expansion
+        (e.g. an array of shape (Q1, Q2, N, N) for the error estimation aa product)
+        """
+        if self._content_as_array is None:
+            items = self._content.flat
+            first_item = self._content.flat[0]
+            if isinstance(first_item, (Matrix.Type(), Vector.Type())):
+                self._content_as_array = stack([item.content for item in items]).reshape(
+                    self._content.shape + first_item.content.shape)
+            else:
+                assert isinstance(first_item, Number)
+                self._content_as_array = array([float(item) for item in items]).reshape(self._content.shape)
+        return self._content_as_array
+
+
+def _content(item):
+    if isinstance(item, Number):
+        return item
+    else:
+        return item.content
+
+
+def _content_shape(item):
+    if isinstance(item, Number):
+        return ()
+    else:
+        return item.content.shape
+
+
+def _to_basic_slice(indices):
+    if len(indices) == 0:
+        return slice(0, 0)
+    elif indices[-1] - indices[0] + 1 == len(indices):
+        return slice(indices[0], indices[-1] + 1)
+    else:
+        return None
+
+
+def _unravel_index(index, shape):
+    if len(shape) == 1:
+        return index
+    else:
+        assert len(shape) == 2
+        return divmod(index, shape[1])
+
+
+def _view_like(item, content):
+    if isinstance(item, Matrix.Type()):
+        output = type(item)(item.M, item.N, content)
+    else:
+        assert isinstance(item, Vector.Type())
+        output = type(item)(item.N, content)
+    item._arithmetic_operations_preserve_attributes(output, other_order=0)
+    return output
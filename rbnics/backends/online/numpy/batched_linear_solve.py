@@ -0,0 +1,33 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import ndarray as array, newaxis
+from numpy.linalg import solve
+from rbnics.backends.online.numpy.affine_expansion_storage import AffineExpansionStorage
+from rbnics.backends.online.numpy.function import Function
+from rbnics.backends.online.numpy.vector import Vector
+from rbnics.backends.online.numpy.wrapping import affine_expansion_storage_contraction
+from rbnics.utils.decorators import backend_for, list_of, ThetaType, tuple_of
+
+
+# batched_linear_solve function to solve at once the affinely parametrized linear systems associated to
+# a batch of parameters: each term is assembled for the whole batch by a single contraction, resulting in
+# (batch, N, N) and (batch, N) stacks, which are then solved by a single call to numpy.linalg.solve
+@backend_for("numpy", inputs=(tuple_of((list_of(ThetaType), array)), tuple_of(AffineExpansionStorage),
+                              tuple_of((list_of(ThetaType), array)), tuple_of(AffineExpansionStorage)))
+def batched_linear_solve(thetas_lhs, operators_lhs, thetas_rhs, operators_rhs):
+    assert len(thetas_lhs) == len(operators_lhs)
+    assert len(thetas_rhs) == len(operators_rhs)
+    lhs = sum([affine_expansion_storage_contraction(thetas, operators)
+               for (thetas, operators) in zip(thetas_lhs, operators_lhs)])
+    rhs = sum([affine_expansion_storage_contraction(thetas, operators)
+               for (thetas, operators) in zip(thetas_rhs, operators_rhs)])
+    assert len(lhs.shape) == 3
+    assert len(rhs.shape) == 2
+    solutions = solve(lhs, rhs[..., newaxis])[..., 0]
+    # Wrap each solution in a Function, preserving the auxiliary attributes related to basis functions
+    rhs_0 = operators_rhs[0][0]
+    return [Function(Vector.Type()(rhs_0.N, solution)) for solution in solutions]
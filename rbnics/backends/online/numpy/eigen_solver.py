@@ -4,8 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import real, imag
-from scipy.linalg import eig, eigh
+from numpy import asarray, real, imag
+from numpy.random import default_rng
+from scipy.linalg import eig, eigh, qr
 from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
 from rbnics.backends.abstract import EigenSolver as AbstractEigenSolver
 from rbnics.backends.online.numpy.function import Function
@@ -35,12 +36,27 @@ class EigenSolver(AbstractEigenSolver):
 
     def solve(self, n_eigs=None):
         assert "problem_type" in self.parameters
-        if self.parameters["problem_type"] in ("hermitian", "gen_hermitian"):
-            eigs, eigv = eigh(self.A, self.B)
+        assert "spectrum" in self.parameters
+        method = self.parameters.get("method", "dense")
+        assert method in ("dense", "randomized")
+        if method == "randomized":
+            assert self.parameters["problem_type"] == "hermitian"
+            assert self.parameters["spectrum"] == "largest real"
+            assert n_eigs is not None
+            eigs, eigv = _randomized_eigh(asarray(self.A), n_eigs)
+        elif self.parameters["problem_type"] in ("hermitian", "gen_hermitian"):
+            if n_eigs is not None and n_eigs < self.A.N:
+                # Only compute the required eigenpairs
+                if self.parameters["spectrum"] == "largest real":
+                    subset_by_index = (self.A.N - n_eigs, self.A.N - 1)
+                else:
+                    subset_by_index = (0, n_eigs - 1)
+                eigs, eigv = eigh(self.A, self.B, subset_by_index=subset_by_index)
+            else:
+                eigs, eigv = eigh(self.A, self.B)
         else:
             eigs, eigv = eig(self.A, self.B)
 
-        assert "spectrum" in self.parameters
         if self.parameters["spectrum"] == "largest real":
             idx = eigs.argsort()  # sort by increasing value
             idx = idx[::-1]  # reverse the order
@@ -65,3 +81,18 @@ class EigenSolver(AbstractEigenSolver):
         eigv_i_real_fun = Function(eigv_i_real)
         eigv_i_imag_fun = Function(eigv_i_imag)
         return (eigv_i_real_fun, eigv_i_imag_fun)
+
+
+# Largest eigenpairs of a symmetric positive semidefinite matrix A by a randomized range finder (with a few power
+# iterations), followed by a dense eigensolve on the projection of A onto the resulting subspace. The subspace is
+# oversampled by as many vectors as the required eigenpairs (and at least ten). The random generator is seeded,
+# so that results are reproducible.
+def _randomized_eigh(A, n_eigs, power_iterations=2):
+    N = A.shape[0]
+    random_generator = default_rng(0)
+    subspace_dimension = min(n_eigs + max(n_eigs, 10), N)
+    (Q, _) = qr(A @ random_generator.standard_normal((N, subspace_dimension)), mode="economic")
+    for _ in range(power_iterations):
+        (Q, _) = qr(A @ Q, mode="economic")
+    eigs, eigv = eigh(Q.T @ A @ Q)
+    return eigs, Q @ eigv
@@ -4,7 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy.linalg import solve
+from numpy import allclose, asarray
+from numpy.linalg import LinAlgError, solve
+from scipy.linalg import cho_factor, cho_solve, lu_factor, lu_solve, solve_triangular
 from rbnics.backends.abstract import LinearProblemWrapper
 from rbnics.backends.online.basic import LinearSolver as BasicLinearSolver
 from rbnics.backends.online.numpy.function import Function
@@ -23,11 +25,42 @@ LinearSolver_Base = BasicLinearSolver(backend, wrapping)
                              (Vector.Type(), DelayedTransposeWithArithmetic, None),
                              ThetaType + DictOfThetaType + (None,)))
 class LinearSolver(LinearSolver_Base):
+    _lower_triangular = False
+    _reuse_factorization = False
+
     def set_parameters(self, parameters):
-        assert len(parameters) == 0, "NumPy linear solver does not accept parameters yet"
+        assert all([key in ("lower_triangular", "reuse_factorization") for key in parameters]), (
+            "NumPy linear solver only accepts the lower_triangular and reuse_factorization parameters")
+        self._lower_triangular = parameters.get("lower_triangular", False)
+        assert isinstance(self._lower_triangular, bool)
+        self._reuse_factorization = parameters.get("reuse_factorization", False)
+        assert isinstance(self._reuse_factorization, bool)
 
     def solve(self):
-        solution = solve(self.lhs, self.rhs)
+        if self._lower_triangular:
+            # The caller guarantees that lhs is lower triangular (entries above the diagonal are disregarded):
+            # a forward substitution is enough, and no factorization is required
+            solution = solve_triangular(asarray(self.lhs), asarray(self.rhs), lower=True, check_finite=False)
+        elif self._reuse_factorization:
+            # The caller guarantees that lhs does not change across solves: factorize it only the first time,
+            # and reuse the factorization for any later rhs. The factorization is stored in lhs itself, so that
+            # it is discarded together with lhs
+            if not hasattr(self.lhs, "_factorization"):
+                self.lhs._factorization = _factorize(asarray(self.lhs))
+            (solve_factorized, factorization) = self.lhs._factorization
+            solution = solve_factorized(factorization, asarray(self.rhs))
+        else:
+            solution = solve(self.lhs, self.rhs)
         self.solution.vector()[:] = solution
         if self.monitor is not None:
             self.monitor(self.solution)
+
+
+def _factorize(lhs):
+    # Prefer a Cholesky factorization for symmetric positive definite matrices (e.g. inner products)
+    if allclose(lhs, lhs.T):
+        try:
+            return (cho_solve, cho_factor(lhs))
+        except LinAlgError:
+            pass
+    return (lu_solve, lu_factor(lhs))
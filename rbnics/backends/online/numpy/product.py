@@ -11,10 +11,12 @@ from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.non_affine_expansion_storage import NonAffineExpansionStorage
 from rbnics.backends.online.numpy.transpose import DelayedTransposeWithArithmetic
 from rbnics.backends.online.numpy.vector import Vector
+from rbnics.backends.online.numpy.wrapping import affine_expansion_storage_contraction
 from rbnics.utils.decorators import backend_for, ModuleWrapper, ThetaType
 
 backend = ModuleWrapper(AffineExpansionStorage, Function, Matrix, NonAffineExpansionStorage, Vector)
-wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArithmetic)
+wrapping = ModuleWrapper(affine_expansion_storage_contraction,
+                         DelayedTransposeWithArithmetic=DelayedTransposeWithArithmetic)
 (product_base, ProductOutput) = basic_product(backend, wrapping)
 
 
@@ -4,7 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import arange, isclose, linspace
+from numpy import arange, array, array_equal, isclose, linspace
 try:
     from assimulo.solvers import IDA
     from assimulo.problem import Implicit_Problem
@@ -100,6 +100,9 @@ class _ScipyImplicitEuler(object):
         # Setup solver
         if problem_type == "linear":
             self.minus_solution_previous_over_dt = function_copy(solution)
+            # Storage for the lhs of the previous time step, and for its content before application of BCs
+            self.lhs_previous = None
+            self.lhs_previous_content = None
 
             class _LinearSolver(LinearSolver):
                 def __init__(self_, t):
@@ -109,7 +112,15 @@ class _ScipyImplicitEuler(object):
                     lhs = self.jacobian_eval(t, self.zero, self.zero, 1. / self._time_step_size)
                     rhs = - self.residual_eval(t, self.zero, self.minus_solution_previous_over_dt)
                     bcs_t = self.bc_eval(t)
+                    # If lhs does not change in time (e.g. for time independent parameters) reuse the lhs of the
+                    # previous time step, so that its factorization can be reused as well
+                    if self.lhs_previous is not None and array_equal(lhs.content, self.lhs_previous_content):
+                        lhs = self.lhs_previous
+                    else:
+                        self.lhs_previous = lhs
+                        self.lhs_previous_content = array(lhs.content)
                     LinearSolver.__init__(self_, lhs, self.solution, rhs, bcs_t)
+                    self_.set_parameters({"reuse_factorization": True})
 
             self.solver_generator = _LinearSolver
         elif problem_type == "nonlinear":
@@ -5,6 +5,8 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numpy import ix_ as Slicer
+from rbnics.backends.online.numpy.wrapping.affine_expansion_storage_contraction import (
+    affine_expansion_storage_contraction)
 from rbnics.backends.online.numpy.wrapping.basis_functions_matrix_mul import (
     basis_functions_matrix_mul_online_matrix, basis_functions_matrix_mul_online_vector)
 from rbnics.backends.online.numpy.wrapping.function_load import function_load
@@ -21,6 +23,7 @@ from rbnics.backends.online.numpy.wrapping.tensor_save import tensor_save
 from rbnics.backends.online.numpy.wrapping.vector_mul import vector_mul_vector
 
 __all__ = [
+    "affine_expansion_storage_contraction",
     "basis_functions_matrix_mul_online_matrix",
     "basis_functions_matrix_mul_online_vector",
     "function_load",
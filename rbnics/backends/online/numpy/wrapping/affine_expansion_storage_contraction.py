@@ -0,0 +1,37 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import asarray, einsum, outer, tensordot
+
+
+def affine_expansion_storage_contraction(thetas, operators, thetas2=None):
+    # Contract the (Q, ...) or (Q1, Q2, ...) content of an affine expansion storage with the theta vectors
+    # at once, rather than accumulating scaled temporaries one term at a time. A (batch, Q) array of thetas
+    # may also be provided in the former case, resulting in a (batch, ...) stack of contractions
+    content = operators.content_as_array()
+    thetas = asarray(thetas, dtype=float)
+    if thetas2 is None:
+        assert len(thetas.shape) in (1, 2)
+        assert content.shape[:1] == thetas.shape[-1:]
+        axes = 1
+    else:
+        thetas2 = asarray(thetas2, dtype=float)
+        assert content.shape[:2] == (thetas.shape[0], thetas2.shape[0])
+        thetas = outer(thetas, thetas2)
+        axes = 2
+    if content.flags.c_contiguous:
+        # a single BLAS call
+        return tensordot(thetas, content, axes=axes)
+    else:
+        # content is a view (e.g. a slice of a contiguous storage): avoid the copy that tensordot would require
+        return einsum(_subscripts[axes, len(thetas.shape)], thetas, content)
+
+
+_subscripts = {
+    (1, 1): "q,q...->...",
+    (1, 2): "bq,q...->b...",
+    (2, 2): "pq,pq...->..."
+}
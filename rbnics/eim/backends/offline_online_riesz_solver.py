@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-from rbnics.backends import LinearSolver
+from rbnics.backends import Function, LinearSolver
 from rbnics.backends.basic.wrapping import DelayedLinearSolver, DelayedProduct
 from rbnics.eim.backends.offline_online_switch import OfflineOnlineSwitch
 from rbnics.utils.cache import cache
@@ -49,7 +49,8 @@ def OfflineOnlineRieszSolver(problem_name):
                         problem._riesz_solve_homogeneous_dirichlet_bc)
                 if not self.delay:
                     solver = LinearSolver(*args)
-                    solver.set_parameters(problem._linear_solver_parameters)
+                    solver.set_parameters(dict(problem._linear_solver_parameters,
+                                               factorization=problem._riesz_solve_factorization))
                     solver.solve()
                     return problem._riesz_solve_storage
                 else:
@@ -59,12 +60,35 @@ def OfflineOnlineRieszSolver(problem_name):
 
             @overload
             def solve(self, coef: Number, matrix: object, basis_function: object):
+                return self.solve(self._rhs(coef, matrix, basis_function))
+
+            def solve_many(self, solve_args):
+                problem = self.problem
+                if not self.delay and len(solve_args) > 0:
+                    # Factorize the inner product only once for all rhs
+                    rhs = [self._rhs(*solve_args_i) for solve_args_i in solve_args]
+                    solutions = [Function(problem.truth_problem.V) for _ in rhs]
+                    solver = LinearSolver(problem._riesz_solve_inner_product, solutions, rhs,
+                                          problem._riesz_solve_homogeneous_dirichlet_bc)
+                    solver.set_parameters(dict(problem._linear_solver_parameters,
+                                               factorization=problem._riesz_solve_factorization))
+                    solver.solve()
+                    return solutions
+                else:
+                    return [self.solve(*solve_args_i) for solve_args_i in solve_args]
+
+            @overload
+            def _rhs(self, rhs: object):
+                return rhs
+
+            @overload
+            def _rhs(self, coef: Number, matrix: object, basis_function: object):
                 if not self.delay:
-                    rhs = coef * matrix * basis_function
+                    return coef * matrix * basis_function
                 else:
                     rhs = DelayedProduct(coef)
                     rhs *= matrix
                     rhs *= basis_function
-                return self.solve(rhs)
+                    return rhs
 
     return _OfflineOnlineRieszSolver
@@ -6,6 +6,8 @@
 
 import os
 import inspect
+from types import MethodType
+from numpy import asarray, hstack
 from rbnics.backends import ParametrizedTensorFactory
 from rbnics.eim.backends import OfflineOnlineBackend
 from rbnics.eim.problems.eim_approximation import EIMApproximation as DEIMApproximation
@@ -215,6 +217,39 @@ def DEIMDecoratedProblem(
                     deim_thetas.append(original_thetas[q])
                 return tuple(deim_thetas)
 
+            def compute_theta_many(self, term, mus):
+                OfflineOnlineSwitch = self.offline_online_backend.OfflineOnlineSwitch
+                if (
+                    isinstance(self.compute_theta, OfflineOnlineSwitch)
+                    and OfflineOnlineSwitch.get_current_stage() in self._apply_DEIM_at_stages
+                    and term in self.DEIM_approximations
+                ):
+                    return self._compute_theta_many_DEIM(term, mus)
+                else:
+                    return ParametrizedDifferentialProblem_DerivedClass.compute_theta_many(self, term, mus)
+
+            def _compute_theta_many_DEIM(self, term, mus):
+                mus = asarray(mus, dtype=float).reshape(len(mus), len(self.mu_range))
+                original_thetas = self._compute_theta_many(
+                    MethodType(ParametrizedDifferentialProblem_DerivedClass.compute_theta, self), term, mus)
+                deim_thetas = list()
+                assert (len(self.DEIM_approximations[term]) + len(self.non_DEIM_forms[term])
+                        == original_thetas.shape[1])
+                if self._N_DEIM is not None:
+                    assert term in self._N_DEIM
+                    assert len(self.DEIM_approximations[term]) == len(self._N_DEIM[term])
+                # Append forms computed with DEIM, if applicable
+                for (q, deim_approximation) in self.DEIM_approximations[term].items():
+                    N_DEIM = None
+                    if self._N_DEIM is not None:
+                        N_DEIM = self._N_DEIM[term][q]
+                    deim_thetas.append(
+                        deim_approximation.compute_interpolated_theta_many(mus, N_DEIM) * original_thetas[:, q:q + 1])
+                # Append forms which did not require DEIM, if applicable
+                for q in self.non_DEIM_forms[term]:
+                    deim_thetas.append(original_thetas[:, q:q + 1])
+                return hstack(deim_thetas)
+
             def _cache_key_from_kwargs(self, **kwargs):
                 cache_key = ParametrizedDifferentialProblem_DerivedClass._cache_key_from_kwargs(self, **kwargs)
                 # Change cache key depending on current stage
@@ -6,6 +6,9 @@
 
 import os
 import hashlib
+from numpy import asarray, empty, zeros
+from numpy.linalg import solve as dense_solve
+from scipy.linalg import solve_triangular
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.backends import abs, assign, copy, evaluate, export, import_, max
 from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
@@ -38,6 +41,8 @@ class EIMApproximation(ParametrizedProblem):
         self.interpolation_locations = parametrized_expression.create_interpolation_locations_container()
         # Interpolation matrix
         self.interpolation_matrix = OnlineAffineExpansionStorage(1)
+        # Preallocated storage for the interpolated thetas
+        self._interpolated_theta = zeros(0)
         # Solution
         self._interpolation_coefficients = None  # OnlineFunction
 
@@ -73,7 +78,8 @@ class EIMApproximation(ParametrizedProblem):
             key_generator=_snapshot_cache_key_generator,
             import_=_snapshot_cache_import,
             export=_snapshot_cache_export,
-            filename_generator=_snapshot_cache_filename_generator
+            filename_generator=_snapshot_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     # Initialize data structures required for the online phase
@@ -131,24 +137,49 @@ class EIMApproximation(ParametrizedProblem):
                 # Extract the interpolation matrix
                 lhs = self.interpolation_matrix[0][:N, :N]
 
-                # Solve the interpolation problem
+                # Solve the interpolation problem. The interpolation matrix is lower triangular (with unit diagonal)
+                # when locations have been selected by a greedy, so that a forward substitution is enough
                 solver = OnlineLinearSolver(lhs, self._interpolation_coefficients, rhs)
+                if self.basis_generation == "Greedy":
+                    solver.set_parameters({"lower_triangular": True})
                 solver.solve()
         else:
             self._interpolation_coefficients = None  # OnlineFunction
 
-    # Call online_solve and then convert the result of online solve from OnlineVector to a tuple
+    # Call online_solve and then store the result of online solve in the preallocated array of interpolated thetas,
+    # which is returned without copies. Note that the returned array is overwritten by the next call
     def compute_interpolated_theta(self, N=None):
+        if N is None:
+            N = self.N
         interpolated_theta = self.solve(N)
-        interpolated_theta_list = list()
-        for theta in interpolated_theta:
-            interpolated_theta_list.append(theta)
-        if N is not None:
-            # Make sure to append a 0 coefficient for each basis function
-            # which has not been requested
-            for n in range(N, self.N):
-                interpolated_theta_list.append(0.0)
-        return tuple(interpolated_theta_list)
+        if self._interpolated_theta.shape[0] != self.N:
+            self._interpolated_theta = zeros(self.N)
+        # Make sure to store a 0 coefficient for each basis function which has not been requested
+        self._interpolated_theta[N:] = 0.
+        if N > 0:
+            self._interpolated_theta[:N] = asarray(interpolated_theta.vector())
+        return self._interpolated_theta
+
+    # Perform an online solve for each parameter in a batch, and return the interpolated thetas as a (n_mu, self.N)
+    # array. The rhs of all parameters are evaluated at the interpolation locations first, so that the interpolation
+    # system is then solved only once with many rhs. The current value of self.mu is not affected.
+    def compute_interpolated_theta_many(self, mus, N=None):
+        if N is None:
+            N = self.N
+        interpolated_thetas = zeros((len(mus), self.N))
+        if N > 0:
+            mu = self.mu
+            rhs = empty((N, len(mus)))
+            for (i, mu_i) in enumerate(mus):
+                self.set_mu(tuple(mu_i))
+                rhs[:, i] = asarray(evaluate(self.parametrized_expression, self.interpolation_locations[:N]))
+            self.set_mu(mu)
+            lhs = asarray(self.interpolation_matrix[0][:N, :N])
+            if self.basis_generation == "Greedy":
+                interpolated_thetas[:, :N] = solve_triangular(lhs, rhs, lower=True, check_finite=False).T
+            else:
+                interpolated_thetas[:, :N] = dense_solve(lhs, rhs).T
+        return interpolated_thetas
 
     # Compute the interpolation error and/or its maximum location
     def compute_maximum_interpolation_error(self, N=None):
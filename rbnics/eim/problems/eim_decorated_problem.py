@@ -7,6 +7,8 @@
 import os
 import inspect
 from itertools import product as cartesian_product
+from types import MethodType
+from numpy import asarray, hstack, newaxis, ones
 from rbnics.backends import ParametrizedExpressionFactory, SeparatedParametrizedForm
 from rbnics.eim.backends import OfflineOnlineBackend
 from rbnics.eim.problems.eim_approximation import EIMApproximation
@@ -237,6 +239,46 @@ def EIMDecoratedProblem(
                         eim_thetas.append(original_theta)
                 return tuple(eim_thetas)
 
+            def compute_theta_many(self, term, mus):
+                OfflineOnlineSwitch = self.offline_online_backend.OfflineOnlineSwitch
+                if (
+                    isinstance(self.compute_theta, OfflineOnlineSwitch)
+                    and OfflineOnlineSwitch.get_current_stage() in self._apply_EIM_at_stages
+                    and term in self.separated_forms
+                ):
+                    return self._compute_theta_many_EIM(term, mus)
+                else:
+                    return ParametrizedDifferentialProblem_DerivedClass.compute_theta_many(self, term, mus)
+
+            def _compute_theta_many_EIM(self, term, mus):
+                mus = asarray(mus, dtype=float).reshape(len(mus), len(self.mu_range))
+                original_thetas = self._compute_theta_many(
+                    MethodType(ParametrizedDifferentialProblem_DerivedClass.compute_theta, self), term, mus)
+                eim_thetas = list()
+                assert len(self.separated_forms[term]) == original_thetas.shape[1]
+                if self._N_EIM is not None:
+                    assert term in self._N_EIM
+                    assert len(self.separated_forms[term]) == len(self._N_EIM[term])
+                for (q, form) in enumerate(self.separated_forms[term]):
+                    N_EIM = None
+                    if self._N_EIM is not None:
+                        N_EIM = self._N_EIM[term][q]
+                    # Append coefficients computed with EIM, if applicable. Columns of the cartesian product
+                    # are ordered as in _compute_theta_EIM
+                    for addend in form.coefficients:
+                        eim_thetas__cartesian_product = ones((mus.shape[0], 1))
+                        for factor in addend:
+                            eim_thetas_factor = self.EIM_approximations[factor].compute_interpolated_theta_many(
+                                mus, N_EIM)
+                            eim_thetas__cartesian_product = (
+                                eim_thetas__cartesian_product[:, :, newaxis] * eim_thetas_factor[:, newaxis, :]
+                            ).reshape(mus.shape[0], -1)
+                        eim_thetas.append(original_thetas[:, q:q + 1] * eim_thetas__cartesian_product)
+                    # Append coefficients which did not require EIM, if applicable
+                    for _ in form.unchanged_forms:
+                        eim_thetas.append(original_thetas[:, q:q + 1])
+                return hstack(eim_thetas)
+
             def _cache_key_from_kwargs(self, **kwargs):
                 cache_key = ParametrizedDifferentialProblem_DerivedClass._cache_key_from_kwargs(self, **kwargs)
                 # Change cache key depending on current stage
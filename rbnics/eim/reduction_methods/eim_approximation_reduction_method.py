@@ -5,8 +5,10 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from mpi4py.MPI import IN_PLACE, MAX, SUM
+from numpy import absolute, argmax, outer, zeros
 from rbnics.reduction_methods.base import ReductionMethod
-from rbnics.backends import abs, evaluate, max
+from rbnics.backends import abs, evaluate, max, to_local_array, to_local_index
 from rbnics.utils.decorators import snapshot_links_to_cache
 from rbnics.utils.io import (ErrorAnalysisTable, Folders, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              SpeedupAnalysisTable, TextBox, TextLine, Timer)
@@ -32,6 +34,9 @@ class EIMApproximationReductionMethod(ReductionMethod):
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
         self.greedy_selected_parameters = GreedySelectedParametersList()
         self.greedy_errors = GreedyErrorEstimatorsList()
+        # Dense storage of the interpolation residuals of all snapshots (one column for each parameter in
+        # the training set), for the batched greedy
+        self._residuals = None
         #
         # By default set a tolerance slightly larger than zero, in order to
         # stop greedy iterations in trivial cases by default
@@ -121,6 +126,9 @@ class EIMApproximationReductionMethod(ReductionMethod):
         print("")
 
         if self.EIM_approximation.basis_generation == "Greedy":
+            # Store residuals of all snapshots as a dense array, if they fit in memory
+            self._init_batched_greedy()
+
             # Initialize first parameter to be used
             (error_max, relative_error_max) = self.greedy()
             print("initial maximum interpolation error =", error_max)
@@ -148,6 +156,8 @@ class EIMApproximationReductionMethod(ReductionMethod):
                 print("update interpolation matrix")
                 self.update_interpolation_matrix()
 
+                self._update_batched_greedy()
+
                 (error_max, relative_error_max) = self.greedy()
                 print("maximum interpolation error =", error_max)
                 print("maximum interpolation relative error =", relative_error_max)
@@ -178,6 +188,9 @@ class EIMApproximationReductionMethod(ReductionMethod):
                       + "\n".join(description), fill="="))
         print("")
 
+        # Residuals are not needed anymore
+        self._residuals = None
+
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
         self.EIM_approximation.init("online")
@@ -204,7 +217,7 @@ class EIMApproximationReductionMethod(ReductionMethod):
     def compute_basis_POD(self):
         POD = self.EIM_approximation.parametrized_expression.create_POD_container()
         POD.store_snapshot(self.snapshots_container)
-        (_, _, basis_functions, N) = POD.apply(self.Nmax, self.tol)
+        (_, _, basis_functions, N) = POD.apply(self.Nmax, self.tol, mode=self.POD_mode)
         self.EIM_approximation.basis_functions.enrich(basis_functions)
         self.EIM_approximation.basis_functions.save(self.EIM_approximation.folder["basis"], "basis")
         # do not increment self.EIM_approximation.N
@@ -264,7 +277,10 @@ class EIMApproximationReductionMethod(ReductionMethod):
             print("find initial mu")
         else:
             print("find next mu")
-        (error_max, error_argmax) = self.training_set.max(solve_and_computer_error)
+        if self._residuals is not None:
+            (error_max, error_argmax) = self._batched_greedy_max()
+        else:
+            (error_max, error_argmax) = self.training_set.max(solve_and_computer_error)
         self.EIM_approximation.set_mu(self.training_set[error_argmax])
         self.greedy_selected_parameters.append(self.training_set[error_argmax])
         self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
@@ -287,6 +303,56 @@ class EIMApproximationReductionMethod(ReductionMethod):
                 self.tol = 1.
             return (0., 0.)
 
+    # Initialize the dense storage of residuals for the batched greedy. Residuals are stored only if their
+    # size (on each process) does not exceed the greedy memory limit, otherwise the greedy falls back to
+    # solving the interpolation problem for one parameter at a time
+    def _init_batched_greedy(self):
+        from rbnics.utils.cache import size_limit  # cannot import at global scope
+        from rbnics.utils.config import config  # cannot import at global scope
+        self._residuals = None
+        memory_limit = size_limit(config.get("EIM", "greedy memory limit"))
+        if len(self.snapshots_container) > 0:
+            mpi_comm = self.snapshots_container.mpi_comm
+            memory = to_local_array(self.snapshots_container[0]).nbytes * len(self.snapshots_container)
+            if memory_limit is None or mpi_comm.allreduce(memory, op=MAX) <= memory_limit:
+                self._residuals = to_local_array(self.snapshots_container)
+
+    # Update residuals of all snapshots after the basis has been enriched: since the interpolation matrix is
+    # lower triangular, only the interpolation coefficients associated to the new basis function change,
+    # resulting in a rank one update of the residuals. Such coefficients are the current residuals at the new
+    # interpolation location, divided by the value of the new basis function there
+    def _update_batched_greedy(self):
+        if self._residuals is not None:
+            N = self.EIM_approximation.N
+            new_basis_function = to_local_array(self.EIM_approximation.basis_functions[N - 1])
+            if new_basis_function.shape[0] != self._residuals.shape[0]:
+                # Basis function does not share the same sparsity pattern of snapshots: fall back to the
+                # standard greedy from now on
+                self._residuals = None
+                return
+            new_location = self.EIM_approximation.interpolation_locations.get_dofs_list()[N - 1]
+            new_index = to_local_index(self.snapshots_container[0], new_location)
+            # The process which owns the new interpolation location shares the residuals there with all processes
+            residuals_on_new_location = zeros(self._residuals.shape[1])
+            if new_index is not None:
+                residuals_on_new_location[:] = self._residuals[new_index, :]
+            self.snapshots_container.mpi_comm.Allreduce(IN_PLACE, residuals_on_new_location, op=SUM)
+            new_coefficients = (
+                residuals_on_new_location / self.EIM_approximation.interpolation_matrix[0].content[N - 1, N - 1])
+            self._residuals -= outer(new_basis_function, new_coefficients)
+
+    # Compute the maximum interpolation error over all parameters in the training set, and its location
+    def _batched_greedy_max(self):
+        mpi_comm = self.snapshots_container.mpi_comm
+        if self._residuals.shape[0] > 0:
+            local_errors = absolute(self._residuals).max(axis=0)
+        else:
+            local_errors = zeros(self._residuals.shape[1])
+        errors = zeros(self._residuals.shape[1])
+        mpi_comm.Allreduce(local_errors, errors, op=MAX)
+        error_argmax = int(argmax(errors))
+        return (errors[error_argmax], error_argmax)
+
     # Compute the error of the empirical interpolation approximation with respect to the
     # exact function over the testing set
     def error_analysis(self, N_generator=None, filename=None, **kwargs):
@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.backends import LinearProblemWrapper, LinearSolver
+from rbnics.backends import LinearProblemWrapper, LinearSolver, product, sum
+from rbnics.backends.online import OnlineAffineExpansionStorage, online_batched_linear_solve
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 
@@ -23,11 +24,64 @@ def LinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._linear_solver_parameters = dict()
 
         class ProblemSolver(ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, LinearProblemWrapper):
+            # Terms in the affine expansion of the left-hand and right-hand sides. Derived classes which provide them
+            # need not override matrix_eval and vector_eval, and enable batched solves
+            lhs_terms = None
+            rhs_terms = None
+
+            def matrix_eval(self):
+                problem = self.problem
+                N = self.N
+                assert self.lhs_terms is not None
+                assembled_operator = [sum(product(problem.compute_theta(term), problem.operator[term][:N, :N]))
+                                      for term in self.lhs_terms]
+                return _add(assembled_operator)
+
+            def vector_eval(self):
+                problem = self.problem
+                N = self.N
+                assert self.rhs_terms is not None
+                assembled_operator = [sum(product(problem.compute_theta(term), problem.operator[term][:N]))
+                                      for term in self.rhs_terms]
+                return _add(assembled_operator)
+
             def solve(self):
                 problem = self.problem
                 solver = LinearSolver(self, problem._solution)
                 solver.set_parameters(problem._linear_solver_parameters)
                 solver.solve()
 
+        # Perform online solves for a batch of parameters (internal)
+        def _solve_many(self, mus, N, **kwargs):
+            online_N, online_kwargs = self._online_size_from_kwargs(N, **kwargs)
+            online_N += self.N_bc
+            problem_solver = self.ProblemSolver(self, online_N, **online_kwargs)
+            if (
+                online_N == 0
+                # left-hand and right-hand sides must be the ones assembled from lhs_terms and rhs_terms
+                or problem_solver.lhs_terms is None or problem_solver.rhs_terms is None
+                or type(problem_solver).matrix_eval is not LinearReducedProblem_Class.ProblemSolver.matrix_eval
+                or type(problem_solver).vector_eval is not LinearReducedProblem_Class.ProblemSolver.vector_eval
+                or problem_solver.bc_eval() is not None  # non-homogeneous Dirichlet BCs are applied one mu at a time
+                or not all([isinstance(self.operator[term], OnlineAffineExpansionStorage)
+                            for term in problem_solver.lhs_terms + problem_solver.rhs_terms])
+            ):
+                return ParametrizedReducedDifferentialProblem_DerivedClass._solve_many(self, mus, N, **kwargs)
+            thetas = dict()
+            for term in problem_solver.lhs_terms + problem_solver.rhs_terms:
+                thetas[term] = self.compute_theta_many(term, mus)
+            return online_batched_linear_solve(
+                tuple(thetas[term] for term in problem_solver.lhs_terms),
+                tuple(self.operator[term][:online_N, :online_N] for term in problem_solver.lhs_terms),
+                tuple(thetas[term] for term in problem_solver.rhs_terms),
+                tuple(self.operator[term][:online_N] for term in problem_solver.rhs_terms))
+
     # return value (a class) for the decorator
     return LinearReducedProblem_Class
+
+
+def _add(assembled_operator):
+    output = assembled_operator[0]
+    for assembled_operator_i in assembled_operator[1:]:
+        output = output + assembled_operator_i
+    return output
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import array, asarray, broadcast_to, column_stack
 from rbnics.utils.io import Folders
 
 
@@ -47,3 +48,36 @@ class ParametrizedProblem(object):
         """
         assert len(mu) == len(self.mu_range), "mu and mu_range must have the same length"
         self.mu = mu
+
+    def compute_theta_many(self, term, mus):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for a batch of parameters.
+        If compute_theta() has been decorated with @vectorized_compute_theta, thetas are computed by a single
+        call in which each component of self.mu is an array over the batch. Otherwise, compute_theta() is
+        called once for each parameter. The current value of self.mu is not affected.
+
+        :param term: the forms of the class of the problem.
+        :param mus: batch of parameters, either as a list of tuples or as a (n_mu, P) array.
+        :return: (n_mu, Q) array of computed thetas.
+        """
+        return self._compute_theta_many(self.compute_theta, term, mus)
+
+    # Evaluate the provided compute_theta for a batch of parameters (internal). This allows decorators which replace
+    # compute_theta() to evaluate thetas of the original compute_theta() for a batch of parameters as well
+    def _compute_theta_many(self, compute_theta, term, mus):
+        mus = asarray(mus, dtype=float).reshape(len(mus), len(self.mu_range))
+        mu = self.mu
+        if getattr(compute_theta, "vectorized", False):
+            self.mu = tuple(mus[:, p] for p in range(mus.shape[1]))
+            try:
+                thetas = compute_theta(term)
+            finally:
+                self.mu = mu
+            return column_stack([broadcast_to(theta, (mus.shape[0], )) for theta in thetas]).astype(float)
+        else:
+            thetas = list()
+            for mu_i in mus:
+                self.set_mu(tuple(mu_i))
+                thetas.append(compute_theta(term))
+            self.set_mu(mu)
+            return array(thetas, dtype=float).reshape(mus.shape[0], -1)
@@ -11,7 +11,7 @@ from numpy import isclose
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
 from rbnics.backends import assign, BasisFunctionsMatrix, copy, product, sum, transpose
 from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
-from rbnics.utils.cache import Cache
+from rbnics.utils.cache import Cache, ProjectionCache
 from rbnics.utils.decorators import StoreMapFromProblemToReducedProblem, sync_setters
 from rbnics.utils.io import OnlineSizeDict
 from rbnics.utils.test import PatchInstanceMethod
@@ -64,9 +64,17 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         # AffineExpansionStorage (for problem with several components), even though it will contain only one matrix
         self.projection_inner_product = None
         self._combined_projection_inner_product = None
+        # Slices of the combined projection inner product used by project(), kept in order to reuse their
+        # factorization: from on_dirichlet_bc to (combined projection inner product, N, slice)
+        self._combined_projection_inner_product_slices = dict()
         # Solution: OnlineFunction
         self._solution = None
         self._output = 0.
+        self._latest_solve_kwargs = dict()
+        # Solutions of the latest batched solve: list of OnlineFunction
+        self._solution_many = list()
+        self._latest_solve_many_mus = list()
+        self._latest_solve_many_kwargs = dict()
 
         # I/O
         def _solution_cache_key_generator(*args, **kwargs):
@@ -94,6 +102,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         self.truth_problem = truth_problem
         # Basis functions matrix: BasisFunctionsMatrix
         self.basis_functions = None
+        # Projections of truth operators onto the basis, which are updated incrementally as the basis is enriched
+        self._projection_cache = ProjectionCache()
         # I/O
         self.folder["basis"] = os.path.join(self.folder_prefix, "basis")
         self.folder["reduced_operators"] = os.path.join(self.folder_prefix, "reduced_operators")
@@ -376,13 +386,40 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         problem_solver = self.ProblemSolver(self, N, **kwargs)
         problem_solver.solve()
 
+    def solve_many(self, mus, N=None, **kwargs):
+        """
+        Perform online solves for a batch of parameters. self.N will be used as matrix dimension if the default value
+        is provided for N. The current value of self.mu is not affected.
+
+        :param mus: list of parameters
+        :param N : Dimension of the reduced problem
+        :type N : integer
+        :return: list of reduced solutions, one for each parameter
+        """
+        mus = [tuple(mu) for mu in mus]
+        mu = self.mu
+        self._latest_solve_many_mus = mus
+        (_, self._latest_solve_many_kwargs) = self._online_size_from_kwargs(N, **kwargs)
+        self._solution_many = self._solve_many(mus, N, **kwargs)
+        self.set_mu(mu)
+        return self._solution_many
+
+    # Perform online solves for a batch of parameters (internal). N and kwargs are the ones provided to solve_many.
+    # By default, solve one parameter at a time
+    def _solve_many(self, mus, N, **kwargs):
+        solutions = list()
+        for mu in mus:
+            self.set_mu(mu)
+            solutions.append(copy(self.solve(N, **kwargs)))
+        return solutions
+
     def project(self, snapshot, N=None, on_dirichlet_bc=True, **kwargs):
         N, kwargs = self._online_size_from_kwargs(N, **kwargs)
         N += self.N_bc
 
         # Get truth and reduced inner product matrices for projection
         inner_product = self.truth_problem._combined_projection_inner_product
-        inner_product_N = self._combined_projection_inner_product[:N, :N]
+        inner_product_N = self._combined_projection_inner_product_slice(N, on_dirichlet_bc)
 
         # Get basis
         basis_functions = self.basis_functions[:N]
@@ -398,10 +435,23 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             solver = OnlineLinearSolver(inner_product_N, projected_snapshot_N,
                                         transpose(basis_functions) * inner_product * snapshot,
                                         self._combined_and_homogenized_dirichlet_bc)
-        solver.set_parameters(self._linear_solver_parameters)
+        solver.set_parameters(dict(self._linear_solver_parameters, reuse_factorization=True))
         solver.solve()
         return projected_snapshot_N
 
+    def _combined_projection_inner_product_slice(self, N, on_dirichlet_bc):
+        # Dirichlet BCs are applied in place by the solver, hence slices are stored separately for each
+        # value of on_dirichlet_bc
+        if on_dirichlet_bc in self._combined_projection_inner_product_slices:
+            (combined_projection_inner_product, slice_N, inner_product_N) = (
+                self._combined_projection_inner_product_slices[on_dirichlet_bc])
+            if combined_projection_inner_product is self._combined_projection_inner_product and slice_N == N:
+                return inner_product_N
+        inner_product_N = self._combined_projection_inner_product[:N, :N]
+        self._combined_projection_inner_product_slices[on_dirichlet_bc] = (
+            self._combined_projection_inner_product, N, inner_product_N)
+        return inner_product_N
+
     def compute_output(self):
         """
 
@@ -426,6 +476,23 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         self._output = NotImplemented
 
+    def compute_output_many(self):
+        """
+
+        :return: list of reduced outputs, one for each parameter of the latest call to solve_many
+        """
+        (mu, solution, output, latest_solve_kwargs) = (
+            self.mu, self._solution, self._output, self._latest_solve_kwargs)
+        outputs = list()
+        for (mu_i, solution_i) in zip(self._latest_solve_many_mus, self._solution_many):
+            self.set_mu(mu_i)
+            self._solution = solution_i
+            self._latest_solve_kwargs = self._latest_solve_many_kwargs
+            outputs.append(self.compute_output())
+        (self._solution, self._output, self._latest_solve_kwargs) = (solution, output, latest_solve_kwargs)
+        self.set_mu(mu)
+        return outputs
+
     def _online_size_from_kwargs(self, N, **kwargs):
         return OnlineSizeDict.generate_from_N_and_kwargs(self.components, self.N, N, **kwargs)
 
@@ -675,6 +742,20 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         return self.truth_problem.compute_theta(term)
 
+    def compute_theta_many(self, term, mus):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for a batch of parameters.
+
+        :param term: the forms of the class of the problem.
+        :param mus: batch of parameters, either as a list of tuples or as a (n_mu, P) array.
+        :return: (n_mu, Q) array of computed thetas.
+        """
+        if type(self).compute_theta is ParametrizedReducedDifferentialProblem.compute_theta:
+            # thetas are the ones of the truth problem, which may be able to evaluate them at once
+            return self.truth_problem.compute_theta_many(term, mus)
+        else:
+            return ParametrizedProblem.compute_theta_many(self, term, mus)
+
     # Assemble the reduced order affine expansion
     def assemble_operator(self, term, current_stage="online"):
         """
@@ -728,13 +809,10 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                 assert self.Q[term] == self.truth_problem.Q[term]
                 for q in range(self.Q[term]):
                     assert self.terms_order[term] in (0, 1, 2)
-                    if self.terms_order[term] == 2:
-                        self.operator[term][q] = (
-                            transpose(self.basis_functions) * self.truth_problem.operator[term][q]
-                            * self.basis_functions)
-                    elif self.terms_order[term] == 1:
-                        self.operator[term][q] = (
-                            transpose(self.basis_functions) * self.truth_problem.operator[term][q])
+                    if self.terms_order[term] in (1, 2):
+                        self.operator[term][q] = self._projection_cache.project(
+                            (term, q), self.basis_functions, self.truth_problem.operator[term][q],
+                            self.terms_order[term])
                     elif self.terms_order[term] == 0:
                         self.operator[term][q] = self.truth_problem.operator[term][q]
                     else:
@@ -749,9 +827,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.inner_product[component]) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.inner_product[component][0] = (
-                        transpose(self.basis_functions) * self.truth_problem.inner_product[component][0]
-                        * self.basis_functions)
+                    self.inner_product[component][0] = self._projection_cache.project(
+                        (term, 0), self.basis_functions, self.truth_problem.inner_product[component][0], 2)
                     self.inner_product[component].save(self.folder["reduced_operators"], term)
                     return self.inner_product[component]
                 else:
@@ -760,8 +837,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.inner_product) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.inner_product[0] = (
-                        transpose(self.basis_functions) * self.truth_problem.inner_product[0] * self.basis_functions)
+                    self.inner_product[0] = self._projection_cache.project(
+                        (term, 0), self.basis_functions, self.truth_problem.inner_product[0], 2)
                     self.inner_product.save(self.folder["reduced_operators"], term)
                     return self.inner_product
             elif term.startswith("projection_inner_product"):
@@ -772,9 +849,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.projection_inner_product[component]) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.projection_inner_product[component][0] = (
-                        transpose(self.basis_functions) * self.truth_problem.projection_inner_product[component][0]
-                        * self.basis_functions)
+                    self.projection_inner_product[component][0] = self._projection_cache.project(
+                        (term, 0), self.basis_functions, self.truth_problem.projection_inner_product[component][0], 2)
                     self.projection_inner_product[component].save(self.folder["reduced_operators"], term)
                     return self.projection_inner_product[component]
                 else:
@@ -783,9 +859,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.projection_inner_product) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.projection_inner_product[0] = (
-                        transpose(self.basis_functions) * self.truth_problem.projection_inner_product[0]
-                        * self.basis_functions)
+                    self.projection_inner_product[0] = self._projection_cache.project(
+                        (term, 0), self.basis_functions, self.truth_problem.projection_inner_product[0], 2)
                     self.projection_inner_product.save(self.folder["reduced_operators"], term)
                     return self.projection_inner_product
             elif term.startswith("dirichlet_bc"):
@@ -6,9 +6,10 @@
 
 import os
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 from numbers import Number
 from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, LinearSolver, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix, OnlineVector
 from rbnics.utils.decorators import overload, PreserveClassName, RequiredBaseDecorators
 
 
@@ -42,6 +43,7 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._riesz_solve_storage = Function(self.truth_problem.V)
             self._riesz_solve_inner_product = None  # setup by init()
             self._riesz_solve_homogeneous_dirichlet_bc = None  # setup by init()
+            self._riesz_solve_factorization = None  # setup by reuse_riesz_solve_factorization()
             self._error_estimation_inner_product = None  # setup by init()
             # I/O
             self.folder["error_estimation"] = os.path.join(self.folder_prefix, "error_estimation")
@@ -176,31 +178,52 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             :param term: the forms of the truth problem.
             """
             solver = self.RieszSolver(self)
-            # Compute the Riesz representor
+            # Compute the Riesz representors. All of them share the same inner product, hence they are computed
+            # by a single call to the solver
             assert self.terms_order[term] in (1, 2)
             if self.terms_order[term] == 1:
+                riesz_term = solver.solve_many([(self.truth_problem.operator[term][q], ) for q in range(self.Q[term])])
                 for q in range(self.Q[term]):
-                    self.riesz[term][q].enrich(
-                        solver.solve(self.truth_problem.operator[term][q])
-                    )
+                    self.riesz[term][q].enrich(riesz_term[q])
                 self.riesz[term].save(self.folder["error_estimation"], "riesz_" + term)
             elif self.terms_order[term] == 2:
+                solve_args = list()
+                riesz_term_destinations = list()
                 for q in range(self.Q[term]):
                     if len(self.components) > 1:
                         for component in self.components:
                             for n in range(len(self.riesz[term][q][component]),
                                            self.N[component] + self.N_bc[component]):
-                                self.riesz[term][q][component].enrich(
-                                    solver.solve(-1., self.truth_problem.operator[term][q],
-                                                 self.basis_functions[component][n]))
+                                solve_args.append((-1., self.truth_problem.operator[term][q],
+                                                   self.basis_functions[component][n]))
+                                riesz_term_destinations.append(self.riesz[term][q][component])
                     else:
                         for n in range(len(self.riesz[term][q]), self.N + self.N_bc):
-                            self.riesz[term][q].enrich(
-                                solver.solve(-1., self.truth_problem.operator[term][q], self.basis_functions[n]))
+                            solve_args.append((-1., self.truth_problem.operator[term][q], self.basis_functions[n]))
+                            riesz_term_destinations.append(self.riesz[term][q])
+                riesz_term = solver.solve_many(solve_args)
+                for (riesz_term_destination, riesz_term_n) in zip(riesz_term_destinations, riesz_term):
+                    riesz_term_destination.enrich(riesz_term_n)
                 self.riesz[term].save(self.folder["error_estimation"], "riesz_" + term)
             else:
                 raise ValueError("Invalid value for order of term " + term)
 
+        @contextmanager
+        def reuse_riesz_solve_factorization(self):
+            """
+            Reuse the factorization of the inner product among all Riesz solves carried out within the context,
+            e.g. over all iterations of the offline stage, and release it when leaving the context.
+            Outside of the context, each call to the Riesz solver factorizes the inner product again.
+            """
+            if self._riesz_solve_factorization is not None:  # already within the context
+                yield
+            else:
+                self._riesz_solve_factorization = dict()
+                try:
+                    yield
+                finally:
+                    self._riesz_solve_factorization = None
+
         class RieszSolver(object):
             def __init__(self, problem):
                 self.problem = problem
@@ -210,7 +233,9 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 problem = self.problem
                 solver = LinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
                                       problem._riesz_solve_homogeneous_dirichlet_bc)
-                solver.set_parameters(problem._linear_solver_parameters)
+                # Reuse the factorization of the inner product, if within reuse_riesz_solve_factorization()
+                solver.set_parameters(dict(problem._linear_solver_parameters,
+                                           factorization=problem._riesz_solve_factorization))
                 solver.solve()
                 return problem._riesz_solve_storage
 
@@ -218,6 +243,32 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             def solve(self, coef: Number, matrix: object, basis_function: object):
                 return self.solve(coef * matrix * basis_function)
 
+            def solve_many(self, solve_args):
+                """
+                Solve a Riesz problem for each element of solve_args, which collects the arguments of solve().
+                Inner product and homogeneous boundary conditions are the same for all Riesz solves, hence
+                they are factorized only once for all rhs.
+                """
+                problem = self.problem
+                if len(solve_args) == 0:
+                    return list()
+                rhs = [self._rhs(*solve_args_i) for solve_args_i in solve_args]
+                solutions = [Function(problem.truth_problem.V) for _ in rhs]
+                solver = LinearSolver(problem._riesz_solve_inner_product, solutions, rhs,
+                                      problem._riesz_solve_homogeneous_dirichlet_bc)
+                solver.set_parameters(dict(problem._linear_solver_parameters,
+                                           factorization=problem._riesz_solve_factorization))
+                solver.solve()
+                return solutions
+
+            @overload
+            def _rhs(self, rhs: object):
+                return rhs
+
+            @overload
+            def _rhs(self, coef: Number, matrix: object, basis_function: object):
+                return coef * matrix * basis_function
+
         def assemble_error_estimation_operators(self, term, current_stage="online"):
             """
             It assembles operators for error estimation.
@@ -239,15 +290,17 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1])
+                                self._assemble_bordered_error_estimation_operator(
+                                    self.error_estimation_operator[term][q0, q1],
+                                    self.riesz[term[0]][q0], self.riesz[term[1]][q1]))
                 elif self.terms_order[term[0]] == 2 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             assert len(self.riesz[term[1]][q1]) == 1
                             self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1][0])
+                                self._assemble_bordered_error_estimation_operator(
+                                    self.error_estimation_operator[term][q0, q1],
+                                    self.riesz[term[0]][q0], self.riesz[term[1]][q1][0]))
                 elif self.terms_order[term[0]] == 1 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         assert len(self.riesz[term[0]][q0]) == 1
@@ -264,5 +317,54 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             else:
                 raise ValueError("Invalid stage in assemble_error_estimation_operators().")
 
+        @overload(OnlineMatrix.Type(), object, object)
+        def _assemble_bordered_error_estimation_operator(self, previous, riesz0, riesz1):
+            """
+            It assembles transpose(riesz0) * X * riesz1, only computing the rows and columns associated to
+            Riesz representors which have been added since previous was assembled.
+            """
+            N0 = riesz0._component_name_to_basis_component_length
+            N1 = riesz1._component_name_to_basis_component_length
+            if not _is_bordered_by(previous.M, N0) or not _is_bordered_by(previous.N, N1):
+                return self._assemble_bordered_error_estimation_operator(None, riesz0, riesz1)
+            (N0_previous, N1_previous) = (previous.M, previous.N)
+            output = OnlineMatrix(N0, N1)
+            output[:N0_previous, :N1_previous] = previous
+            if N0_previous != N0:
+                output[N0_previous:N0, :N1] = (
+                    transpose(riesz0[N0_previous:N0]) * self._error_estimation_inner_product * riesz1)
+            if N1_previous != N1:
+                output[:N0_previous, N1_previous:N1] = (
+                    transpose(riesz0[:N0_previous]) * self._error_estimation_inner_product
+                    * riesz1[N1_previous:N1])
+            return output
+
+        @overload(OnlineVector.Type(), object, object)
+        def _assemble_bordered_error_estimation_operator(self, previous, riesz0, riesz1):
+            N0 = riesz0._component_name_to_basis_component_length
+            if not _is_bordered_by(previous.N, N0):
+                return self._assemble_bordered_error_estimation_operator(None, riesz0, riesz1)
+            N0_previous = previous.N
+            output = OnlineVector(N0)
+            output[:N0_previous] = previous
+            if N0_previous != N0:
+                output[N0_previous:N0] = (
+                    transpose(riesz0[N0_previous:N0]) * self._error_estimation_inner_product * riesz1)
+            return output
+
+        @overload(object, object, object)
+        def _assemble_bordered_error_estimation_operator(self, previous, riesz0, riesz1):
+            # Nothing to be reused (e.g. first assembly), assemble from scratch
+            return transpose(riesz0) * self._error_estimation_inner_product * riesz1
+
     # return value (a class) for the decorator
     return RBReducedProblem_Class
+
+
+def _is_bordered_by(previous_N, N):
+    """
+    Check if the previous (component-wise) dimension is a leading block of the current one, i.e. if the Riesz
+    representors have only been appended since the previous assembly
+    """
+    return (isinstance(previous_N, dict) and isinstance(N, dict) and list(previous_N.keys()) == list(N.keys())
+            and all([previous_N[component] <= N[component] for component in N]))
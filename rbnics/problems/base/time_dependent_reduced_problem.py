@@ -333,6 +333,34 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
                 solver.set_parameters(problem._time_stepping_parameters)
                 solver.solve()
 
+        # Perform online solves for a batch of parameters (internal). Time stepping is carried out one parameter
+        # at a time, and the solution over time is returned for each parameter
+        def _solve_many(self, mus, N, **kwargs):
+            solutions_over_time = list()
+            for mu in mus:
+                self.set_mu(mu)
+                solutions_over_time.append(copy(self.solve(N, **kwargs)))
+            return solutions_over_time
+
+        # Perform an online evaluation of the output for each parameter of the latest call to solve_many,
+        # returning the output over time for each parameter
+        def compute_output_many(self):
+            (mu, solution, solution_over_time, output, output_over_time, latest_solve_kwargs) = (
+                self.mu, self._solution, self._solution_over_time, self._output, self._output_over_time,
+                self._latest_solve_kwargs)
+            outputs_over_time = list()
+            for (mu_i, solution_over_time_i) in zip(self._latest_solve_many_mus, self._solution_many):
+                self.set_mu(mu_i)
+                self._solution = solution_over_time_i[-1]
+                self._solution_over_time = solution_over_time_i
+                self._output_over_time = TimeSeries(output_over_time)
+                self._latest_solve_kwargs = self._latest_solve_many_kwargs
+                outputs_over_time.append(self.compute_output())
+            (self._solution, self._solution_over_time, self._output, self._output_over_time,
+             self._latest_solve_kwargs) = (solution, solution_over_time, output, output_over_time, latest_solve_kwargs)
+            self.set_mu(mu)
+            return outputs_over_time
+
         # Perform an online evaluation of the output
         def compute_output(self):
             N = self._solution.N
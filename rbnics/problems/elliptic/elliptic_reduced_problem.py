@@ -17,15 +17,8 @@ def EllipticReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
     class EllipticReducedProblem_Class(EllipticReducedProblem_Base):
 
         class ProblemSolver(EllipticReducedProblem_Base.ProblemSolver):
-            def matrix_eval(self):
-                problem = self.problem
-                N = self.N
-                return sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
-
-            def vector_eval(self):
-                problem = self.problem
-                N = self.N
-                return sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
+            lhs_terms = ("a", )
+            rhs_terms = ("f", )
 
         # Perform an online evaluation of the output
         def _compute_output(self, N):
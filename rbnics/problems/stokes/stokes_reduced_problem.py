@@ -36,21 +36,8 @@ def StokesReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             )
 
         class ProblemSolver(StokesReducedProblem_Base.ProblemSolver):
-            def matrix_eval(self):
-                problem = self.problem
-                N = self.N
-                assembled_operator = dict()
-                for term in ("a", "b", "bt"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N, :N]))
-                return assembled_operator["a"] + assembled_operator["b"] + assembled_operator["bt"]
-
-            def vector_eval(self):
-                problem = self.problem
-                N = self.N
-                assembled_operator = dict()
-                for term in ("f", "g"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N]))
-                return assembled_operator["f"] + assembled_operator["g"]
+            lhs_terms = ("a", "b", "bt")
+            rhs_terms = ("f", "g")
 
             # Custom combination of boundary conditions *not* to add BCs of supremizers
             def bc_eval(self):
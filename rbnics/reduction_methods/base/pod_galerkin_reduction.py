@@ -5,10 +5,12 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from functools import partial
 from numbers import Number
-from rbnics.backends import ProperOrthogonalDecomposition
+from rbnics.backends import assign, copy, ProperOrthogonalDecomposition, to_local_array
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
 from rbnics.utils.io import ErrorAnalysisTable, OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer
+from rbnics.utils.mpi import init_local_worker_config, local_processes, local_worker_config_options
 
 
 @RequiredBaseDecorators(None)
@@ -32,6 +34,8 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             # ProperOrthogonalDecomposition (for problems with one component)
             # or dict of ProperOrthogonalDecomposition (for problem with several components)
             self.POD = None
+            # Generator of truth problems for the snapshot farm
+            self.truth_problem_generator = None
             # I/O
             self.folder["snapshots"] = os.path.join(self.folder_prefix, "snapshots")
             self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
@@ -122,13 +126,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
 
-            for (mu_index, mu) in enumerate(self.training_set):
-                print(TextLine(str(mu_index), fill="#"))
-
-                self.truth_problem.set_mu(mu)
-
-                print("truth solve for mu =", self.truth_problem.mu)
-                snapshot = self.truth_problem.solve()
+            for (mu_index, snapshot) in self._farm_snapshots():
                 self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(mu_index), snapshot)
                 snapshot = self.postprocess_snapshot(snapshot, mu_index)
 
@@ -148,6 +146,50 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
 
+        def set_snapshot_farm(self, truth_problem_generator):
+            """
+            Enable the snapshot farm, which distributes truth solves over a pool of spawned local processes (as many
+            as the "snapshot processes" option of the "sampling" section of the configuration) in serial runs.
+            Scripts enabling the snapshot farm must call offline() under an if __name__ == "__main__" guard.
+
+            :param truth_problem_generator: a picklable function without arguments (e.g., defined at module level),
+                which returns a truth problem equivalent to the one provided to this reduction method. It is called
+                once in each process of the pool, which owns its own truth problem.
+            """
+            self.truth_problem_generator = truth_problem_generator
+
+        def _farm_snapshots(self):
+            """
+            Yield the truth solution for each parameter in the training set, in order, together with its index.
+            If the snapshot farm is enabled, truth solves are carried out by a pool of spawned local processes, and
+            truth solutions are streamed back as soon as they are available. Each one is then stored in the truth
+            problem and in its cache as if it had been computed by a truth solve, so that the snapshots matrix, the
+            exported snapshots and the cache are the same as in a serial run.
+            """
+            if (self.truth_problem_generator is not None and self.training_set.mpi_comm.size == 1
+                    and local_processes("sampling", "snapshot processes") > 1):
+                initializer = partial(
+                    _init_farmed_truth_problem, self.truth_problem_generator, local_worker_config_options())
+                for (mu_index, mu, snapshot_array) in self.training_set.farm(_farmed_truth_solve, initializer):
+                    print(TextLine(str(mu_index), fill="#"))
+
+                    self.truth_problem.set_mu(mu)
+
+                    print("truth solve for mu =", self.truth_problem.mu, "(farmed)")
+                    self.truth_problem._latest_solve_kwargs = dict()
+                    snapshot = self.truth_problem._solution
+                    assign(snapshot, snapshot_array)
+                    self.truth_problem._solution_cache[self.truth_problem.mu, {}] = copy(snapshot)
+                    yield (mu_index, snapshot)
+            else:
+                for (mu_index, mu) in enumerate(self.training_set):
+                    print(TextLine(str(mu_index), fill="#"))
+
+                    self.truth_problem.set_mu(mu)
+
+                    print("truth solve for mu =", self.truth_problem.mu)
+                    yield (mu_index, self.truth_problem.solve())
+
         def update_snapshots_matrix(self, snapshot):
             """
             It updates the snapshots matrix.
@@ -168,7 +210,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                 for component in self.truth_problem.components:
                     print("# POD for component", component)
                     POD = self.POD[component]
-                    (_, _, basis_functions, N) = POD.apply(self.Nmax, self.tol[component])
+                    (_, _, basis_functions, N) = POD.apply(self.Nmax, self.tol[component], mode=self.POD_mode)
                     self.reduced_problem.basis_functions.enrich(basis_functions, component=component)
                     self.reduced_problem.N[component] += N
                     POD.print_eigenvalues(N)
@@ -176,7 +218,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     POD.save_retained_energy_file(self.folder["post_processing"], "retained_energy_" + component)
                 self.reduced_problem.basis_functions.save(self.reduced_problem.folder["basis"], "basis")
             else:
-                (_, _, basis_functions, N) = self.POD.apply(self.Nmax, self.tol)
+                (_, _, basis_functions, N) = self.POD.apply(self.Nmax, self.tol, mode=self.POD_mode)
                 self.reduced_problem.basis_functions.enrich(basis_functions)
                 self.reduced_problem.N += N
                 self.POD.print_eigenvalues(N)
@@ -385,3 +427,21 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
 
     # return value (a class) for the decorator
     return PODGalerkinReduction_Class
+
+
+# Set up the truth problem owned by a process of the snapshot farm. Disk caching is disabled, since the current
+# process stores all truth solutions in the cache of its own truth problem
+def _init_farmed_truth_problem(truth_problem_generator, config_options):
+    global _farmed_truth_problem
+    init_local_worker_config(config_options)
+    _farmed_truth_problem = truth_problem_generator()
+    _farmed_truth_problem.init()
+
+
+# Carry out a truth solve in a process of the snapshot farm, and return the local entries of the truth solution
+def _farmed_truth_solve(mu):
+    _farmed_truth_problem.set_mu(mu)
+    return to_local_array(_farmed_truth_problem.solve())
+
+
+_farmed_truth_problem = None
@@ -5,12 +5,14 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from functools import partial
 from math import sqrt
 from logging import DEBUG, getLogger
 from rbnics.backends import GramSchmidt
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
 from rbnics.utils.io import (ErrorAnalysisTable, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer)
+from rbnics.utils.mpi import init_local_worker_config, local_processes, local_worker_config_options
 
 logger = getLogger("rbnics/reduction_methods/base/rb_reduction.py")
 
@@ -43,6 +45,8 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
             self.label = "RB"
+            # Generator of reduction methods for the greedy farm
+            self.reduction_method_generator = None
 
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
@@ -71,7 +75,10 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             """
             need_to_do_offline_stage = self._init_offline()
             if need_to_do_offline_stage:
-                self._offline()
+                # The factorization of the inner product is shared by all Riesz solves of the offline stage,
+                # and released at its end
+                with self.reduced_problem.reuse_riesz_solve_factorization():
+                    self._offline()
             self._finalize_offline()
             return self.reduced_problem
 
@@ -182,7 +189,28 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             else:
                 print("find next mu")
 
-            return self.training_set.max(solve_and_estimate_error)
+            # Online solves and error estimation are independent for each mu: if the greedy farm is enabled, they
+            # are carried out on a pool of spawned local processes, each one loading the current reduced problem
+            if (self.reduction_method_generator is not None and self.reduced_problem.N > 0
+                    and self.training_set.mpi_comm.size == 1 and local_processes("sampling", "max processes") > 1):
+                initializer = partial(
+                    _init_farmed_reduced_problem, self.reduction_method_generator, local_worker_config_options())
+                return self.training_set.max(_farmed_solve_and_estimate_error, initializer=initializer)
+            else:
+                return self.training_set.max(solve_and_estimate_error)
+
+        def set_greedy_farm(self, reduction_method_generator):
+            """
+            Enable the greedy farm, which distributes online solves and error estimation over the training set on a
+            pool of spawned local processes (as many as the "max processes" option of the "sampling" section of the
+            configuration) in serial runs. A new pool is started at each greedy iteration, and each of its processes
+            loads the current reduced problem from disk: this pays off only for large training sets. Scripts
+            enabling the greedy farm must call offline() under an if __name__ == "__main__" guard.
+
+            :param reduction_method_generator: a picklable function without arguments (e.g., defined at module level),
+                which returns a reduction method equivalent to this one.
+            """
+            self.reduction_method_generator = reduction_method_generator
 
         def error_analysis(self, N_generator=None, filename=None, **kwargs):
             """
@@ -593,3 +621,24 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
 
     # return value (a class) for the decorator
     return RBReduction_Class
+
+
+# Set up the reduced problem owned by a process of the greedy farm, loading the offline data computed so far
+def _init_farmed_reduced_problem(reduction_method_generator, config_options):
+    global _farmed_reduced_problem
+    init_local_worker_config(config_options)
+    reduction_method = reduction_method_generator()
+    need_to_do_offline_stage = reduction_method._init_offline()
+    assert not need_to_do_offline_stage
+    _farmed_reduced_problem = reduction_method.reduced_problem
+    _farmed_reduced_problem.init("online")
+
+
+# Carry out an online solve and error estimation in a process of the greedy farm
+def _farmed_solve_and_estimate_error(mu):
+    _farmed_reduced_problem.set_mu(mu)
+    _farmed_reduced_problem.solve()
+    return _farmed_reduced_problem.estimate_error()
+
+
+_farmed_reduced_problem = None
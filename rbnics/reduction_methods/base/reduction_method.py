@@ -22,6 +22,9 @@ class ReductionMethod(object, metaclass=ABCMeta):
         self.Nmax = 0
         # Tolerance to be used for the stopping criterion in the basis selection
         self.tol = 0.
+        # Eigensolver to be used by POD on the correlation matrix: either "full" (all eigenvalues), "partial" (only
+        # the leading ones) or "randomized" (the leading ones, by a randomized range finder)
+        self.POD_mode = "full"
         # Training set
         self.training_set = ParameterSpaceSubset()
         # I/O
@@ -43,6 +46,11 @@ class ReductionMethod(object, metaclass=ABCMeta):
     def set_tolerance(self, tol, **kwargs):
         self.tol = tol
 
+    # OFFLINE: set eigensolver to be used by POD
+    def set_POD_mode(self, mode):
+        assert mode in ("full", "partial", "randomized")
+        self.POD_mode = mode
+
     # OFFLINE: set the elements in the training set.
     def initialize_training_set(self, mu_range, ntrain, enable_import=True, sampling=None, **kwargs):
         # Create I/O folder
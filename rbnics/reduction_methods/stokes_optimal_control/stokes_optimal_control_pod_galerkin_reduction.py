@@ -64,7 +64,8 @@ class StokesOptimalControlPODGalerkinReduction(StokesOptimalControlPODGalerkinRe
             POD = self.POD[component]
             assert self.tol[component] == 0.
             # TODO first negelect tolerances, then compute the max of N for each aggregated pair
-            (_, _, basis_functions[component], N[component]) = POD.apply(self.Nmax, self.tol[component])
+            (_, _, basis_functions[component], N[component]) = POD.apply(
+                self.Nmax, self.tol[component], mode=self.POD_mode)
             POD.print_eigenvalues(N[component])
             POD.save_eigenvalues_file(self.folder["post_processing"], "eigs_" + component)
             POD.save_retained_energy_file(self.folder["post_processing"], "retained_energy_" + component)
@@ -4,15 +4,14 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import operator  # to find closest parameters
-from math import sqrt
 from mpi4py.MPI import COMM_WORLD
 from numpy import zeros as array
-from numpy import argmax
+from numpy import argmax, asarray, atleast_1d, lexsort, max as amax, sqrt, sum as asum
 from rbnics.sampling.distributions import CompositeDistribution, UniformDistribution
 from rbnics.utils.decorators import overload
 from rbnics.utils.io import ExportableList
-from rbnics.utils.mpi import parallel_io as parallel_generate, parallel_max
+from rbnics.utils.mpi import (
+    local_processes, local_spawned_pool_imap, local_spawned_pool_map, parallel_io as parallel_generate, parallel_max)
 
 
 class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
@@ -20,6 +19,7 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         ExportableList.__init__(self, "text")
         self.mpi_comm = COMM_WORLD
         self.distributed_max = True
+        self._closest_index = None  # spatial index for closest(), built on demand
 
     @overload
     def __getitem__(self, key: int):
@@ -32,8 +32,30 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         output._list = self._list[key]
         return output
 
+    # Methods which change the parameters in this set also discard the spatial index for closest()
+    def append(self, element):
+        ExportableList.append(self, element)
+        self._closest_index = None
+
+    def extend(self, other_list):
+        ExportableList.extend(self, other_list)
+        self._closest_index = None
+
+    def clear(self):
+        ExportableList.clear(self)
+        self._closest_index = None
+
+    def load(self, directory, filename):
+        self._closest_index = None
+        return ExportableList.load(self, directory, filename)
+
+    def __setitem__(self, key, item):
+        ExportableList.__setitem__(self, key, item)
+        self._closest_index = None
+
     # Method for generation of parameter space subsets
     def generate(self, box, n, sampling=None):
+        self._closest_index = None
         if len(box) > 0:
             if sampling is None:
                 sampling = UniformDistribution()
@@ -49,7 +71,14 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
             for i in range(n):
                 self._list.append(tuple())
 
-    def max(self, generator, postprocessor=None):
+    def max(self, generator, postprocessor=None, initializer=None):
+        """
+        Return the maximum value of generator over the parameters in this set, and the index of the corresponding
+        parameter. If initializer is provided, in serial runs generator is evaluated on a pool of spawned local
+        processes (as many as the "max processes" option of the "sampling" section of the configuration), each one
+        set up once by initializer, as in farm(). Otherwise, generator is evaluated in the current process (after
+        having called initializer, if provided).
+        """
         if postprocessor is None:
             def postprocessor(value):
                 return value
@@ -60,9 +89,19 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
             local_list_indices = list(range(len(self._list)))
         values = array(len(local_list_indices))
         values_with_postprocessing = array(len(local_list_indices))
-        for i in range(len(local_list_indices)):
-            values[i] = generator(self._list[local_list_indices[i]])
-            values_with_postprocessing[i] = postprocessor(values[i])
+        processes = local_processes("sampling", "max processes")
+        if (initializer is not None and self.distributed_max and self.mpi_comm.size == 1 and processes > 1
+                and len(local_list_indices) > 1):
+            values[:] = local_spawned_pool_map(
+                generator, [self._list[i] for i in local_list_indices], processes, initializer)
+            for i in range(len(local_list_indices)):
+                values_with_postprocessing[i] = postprocessor(values[i])
+        else:
+            if initializer is not None:
+                initializer()
+            for i in range(len(local_list_indices)):
+                values[i] = generator(self._list[local_list_indices[i]])
+                values_with_postprocessing[i] = postprocessor(values[i])
         if self.distributed_max:
             local_i_max = argmax(values_with_postprocessing)
             local_value_max = values[local_i_max]
@@ -76,6 +115,25 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
             global_value_max = values[global_i_max]
         return (global_value_max, global_i_max)
 
+    def farm(self, generator, initializer, processes=None):
+        """
+        Yield (index, parameter, value) triplets for the parameters in this set, in order, where value is the result
+        of generator on the parameter. In serial runs, generator is evaluated on a pool of spawned local processes
+        (as many as the "snapshot processes" option of the "sampling" section of the configuration, unless processes
+        is provided), each one set up once by initializer, and each triplet is yielded as soon as its value is
+        available. Otherwise, initializer and generator are simply called in the current process.
+        """
+        if processes is None:
+            processes = local_processes("sampling", "snapshot processes")
+        if self.mpi_comm.size == 1 and processes > 1 and len(self._list) > 1:
+            values = local_spawned_pool_imap(generator, self._list, processes, initializer)
+            for (mu_index, (mu, value)) in enumerate(zip(self._list, values)):
+                yield (mu_index, mu, value)
+        else:
+            initializer()
+            for (mu_index, mu) in enumerate(self._list):
+                yield (mu_index, mu, generator(mu))
+
     def serialize_maximum_computations(self):
         self.distributed_max = False
 
@@ -100,10 +158,26 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         if M == 0:
             return output
 
-        parameters_and_distances = list()
-        for xi_i in self:
-            distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
-            parameters_and_distances.append((xi_i, distance))
-        parameters_and_distances.sort(key=operator.itemgetter(1))
-        output._list = [xi_i for (xi_i, _) in parameters_and_distances[:M]]
+        # Query a KD-tree for the M-th closest distance, and then retrieve all parameters within such distance,
+        # so that ties are broken by the position in this set
+        (index, parameters) = self._get_closest_index()
+        mu = asarray(mu, dtype=float)
+        if parameters.shape[1] == 0:  # trivial case of an empty parameter space: all distances are zero
+            candidates = list(range(M))
+        else:
+            (distances, _) = index.query(mu, k=M)
+            M_distance = amax(atleast_1d(distances))
+            candidates = index.query_ball_point(mu, M_distance * (1. + 1.e-10))
+        candidates = asarray(candidates, dtype=int)
+        distances = sqrt(asum((parameters[candidates] - mu)**2, axis=1))
+        candidates = candidates[lexsort((candidates, distances))][:M]
+        assert len(candidates) == M
+        output._list = [self._list[i] for i in candidates]
         return output
+
+    def _get_closest_index(self):
+        if self._closest_index is None or self._closest_index[1].shape[0] != len(self._list):
+            from scipy.spatial import cKDTree  # not imported at global scope, as it is expensive to import
+            parameters = asarray(self._list, dtype=float).reshape(len(self._list), -1)
+            self._closest_index = (cKDTree(parameters) if parameters.shape[1] > 0 else None, parameters)
+        return self._closest_index
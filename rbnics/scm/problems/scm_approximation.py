@@ -6,7 +6,7 @@
 
 import os
 import hashlib
-from numpy import isclose
+from numpy import full, isclose, isnan, nan
 from rbnics.backends import export, import_, LinearProgramSolver
 from rbnics.backends.common.linear_program_solver import Error as LinearProgramSolverError, Matrix, Vector
 from rbnics.problems.base import ParametrizedProblem
@@ -45,6 +45,16 @@ class SCMApproximation(ParametrizedProblem):
         # Storage for online computations
         self._stability_factor_lower_bound = 0.
         self._stability_factor_upper_bound = 0.
+        # linear_programs: dict, over N and number of constraints, of linear programs which are reused for every mu
+        self._linear_programs = dict()
+        # stability_factor_lower_bounds: dict, over N, of arrays storing the lower bounds computed so far at each
+        # position of the training set (nan if not computed yet)
+        self._stability_factor_lower_bounds = dict()
+        # training_set_positions: dict mapping each parameter in the training set to its position
+        self._training_set_positions = None
+        # training_set_thetas: array storing theta of the stability factor affine expansion at each position
+        # of the training set
+        self._training_set_thetas = None
 
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "reduced_cache")
@@ -74,7 +84,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_lower_bound_cache_import,
             export=_stability_factor_lower_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _stability_factor_upper_bound_cache_import(filename):
@@ -89,7 +100,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_upper_bound_cache_import,
             export=_stability_factor_upper_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         # Stability factor eigen problem
@@ -104,6 +116,11 @@ class SCMApproximation(ParametrizedProblem):
         self.truth_problem.init()
         # Init exact stability factor computations
         self.stability_factor_calculator.init()
+        # Clean up data structures which depend on the training set or on the bounding box
+        self._linear_programs.clear()
+        self._stability_factor_lower_bounds.clear()
+        self._training_set_positions = None
+        self._training_set_thetas = None
         # Read/Initialize reduced order data structures
         if current_stage == "online":
             self.bounding_box_min.load(self.folder["reduced_operators"], "bounding_box_min")
@@ -134,11 +151,22 @@ class SCMApproximation(ParametrizedProblem):
     def get_stability_factor_lower_bound(self, N=None):
         if N is None:
             N = self.N
-        try:
-            self._stability_factor_lower_bound = self._stability_factor_lower_bound_cache[self.mu, N]
-        except KeyError:
-            self._get_stability_factor_lower_bound(N)
-            self._stability_factor_lower_bound_cache[self.mu, N] = self._stability_factor_lower_bound
+        position = self._training_set_position(self.mu)
+        if position is not None:
+            # Lower bounds at parameters in the training set are only stored by position
+            if N not in self._stability_factor_lower_bounds:
+                self._stability_factor_lower_bounds[N] = full(len(self.training_set), nan)
+            if isnan(self._stability_factor_lower_bounds[N][position]):
+                self._get_stability_factor_lower_bound(N)
+                self._stability_factor_lower_bounds[N][position] = self._stability_factor_lower_bound
+            else:
+                self._stability_factor_lower_bound = self._stability_factor_lower_bounds[N][position]
+        else:
+            try:
+                self._stability_factor_lower_bound = self._stability_factor_lower_bound_cache[self.mu, N]
+            except KeyError:
+                self._get_stability_factor_lower_bound(N)
+                self._stability_factor_lower_bound_cache[self.mu, N] = self._stability_factor_lower_bound
         return self._stability_factor_lower_bound
 
     def _get_stability_factor_lower_bound(self, N):
@@ -147,39 +175,27 @@ class SCMApproximation(ParametrizedProblem):
         M_e = N
         M_p = min(N, len(self.training_set) - len(self.greedy_selected_parameters))
 
-        # 1. Constrain the Q variables to be in the bounding box
-        bounds = list()  # of Q pairs
-        for q in range(Q):
-            assert (
-                self.bounding_box_min[q] <= self.bounding_box_max[q]
-                or isclose(self.bounding_box_min[q], self.bounding_box_max[q]))
-            bounds.append((self.bounding_box_min[q], self.bounding_box_max[q]))
-
-        # 2. Add three different sets of constraints.
+        # 1. Add three different sets of constraints.
         #    Our constrains are of the form
         #       a^T * x >= b
         constraints_matrix = Matrix(M_e + M_p + 1, Q)
         constraints_vector = Vector(M_e + M_p + 1)
 
-        # 2a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters
+        # 1a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters
         mu_bak = self.mu
         closest_selected_parameters = self._closest_selected_parameters(M_e, N, self.mu)
         for (j, omega) in enumerate(closest_selected_parameters):
             # Overwrite parameter values
             self.set_mu(omega)
 
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
-
             # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[j, q] = current_theta[q]
+            constraints_matrix[j, :] = self._compute_theta()
 
             # Assemble the RHS of the constraint: note that computations for this call may be already cached
             (constraints_vector[j], _) = self.evaluate_stability_factor()
         self.set_mu(mu_bak)
 
-        # 2b. Add constraints: also constrain the closest point in the complement of selected parameters,
+        # 1b. Add constraints: also constrain the closest point in the complement of selected parameters,
         #                      with RHS depending on previously computed lower bounds
         mu_bak = self.mu
         closest_selected_parameters_complement = self._closest_unselected_parameters(M_p, N, self.mu)
@@ -187,38 +203,52 @@ class SCMApproximation(ParametrizedProblem):
             # Overwrite parameter values
             self.set_mu(nu)
 
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
-
             # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[M_e + j, q] = current_theta[q]
+            constraints_matrix[M_e + j, :] = self._compute_theta()
 
-            # Assemble the RHS of the constraint: note that computations for this call may be already cached
+            # Assemble the RHS of the constraint: note that computations for this call are memoized
+            # by training set position
             if N > 1:
                 constraints_vector[M_e + j] = self.get_stability_factor_lower_bound(N - 1)
             else:
                 constraints_vector[M_e + j] = 0.
         self.set_mu(mu_bak)
 
-        # 2c. Add constraints: also constrain the stability factor for mu to be positive
+        # 1c. Add constraints: also constrain the stability factor for mu to be positive
         # Compute theta
-        current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        current_theta = self._compute_theta()
 
         # Assemble the LHS of the constraint
-        for q in range(Q):
-            constraints_matrix[M_e + M_p, q] = current_theta[q]
+        constraints_matrix[M_e + M_p, :] = current_theta
 
         # Assemble the RHS of the constraint
         constraints_vector[M_e + M_p] = 0.
 
-        # 3. Add cost function coefficients
+        # 2. Add cost function coefficients
         cost = Vector(Q)
-        for q in range(Q):
-            cost[q] = current_theta[q]
+        cost[:] = current_theta
+
+        # 3. Update the linear program associated to N and to the current number of constraints (which changes
+        #    while the greedy selects more parameters), which shares the bounding box constraints with all
+        #    previous solves
+        linear_program_key = (N, M_e + M_p)
+        if linear_program_key not in self._linear_programs:
+            # Constrain the Q variables to be in the bounding box
+            bounds = list()  # of Q pairs
+            for q in range(Q):
+                assert (
+                    self.bounding_box_min[q] <= self.bounding_box_max[q]
+                    or isclose(self.bounding_box_min[q], self.bounding_box_max[q]))
+                bounds.append((self.bounding_box_min[q], self.bounding_box_max[q]))
+            self._linear_programs[linear_program_key] = LinearProgramSolver(
+                cost, constraints_matrix, constraints_vector, bounds)
+        else:
+            self._linear_programs[linear_program_key].set_cost(cost)
+            self._linear_programs[linear_program_key].set_inequality_constraints(
+                constraints_matrix, constraints_vector)
+        linear_program = self._linear_programs[linear_program_key]
 
         # 4. Solve the linear programming problem
-        linear_program = LinearProgramSolver(cost, constraints_matrix, constraints_vector, bounds)
         try:
             stability_factor_lower_bound = linear_program.solve()
         except LinearProgramSolverError:
@@ -267,6 +297,23 @@ class SCMApproximation(ParametrizedProblem):
     def _cache_file(self, N):
         return hashlib.sha1(str(self._cache_key(N)).encode("utf-8")).hexdigest()
 
+    def _training_set_position(self, mu):
+        if self.training_set is None:
+            return None
+        if self._training_set_positions is None:
+            self._training_set_positions = {nu: i for (i, nu) in enumerate(self.training_set)}
+        return self._training_set_positions.get(mu)
+
+    def _compute_theta(self):
+        # theta at parameters in the training set are computed once in a batch, and then looked up by position
+        position = self._training_set_position(self.mu)
+        if position is None:
+            return self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        if self._training_set_thetas is None:
+            self._training_set_thetas = self.truth_problem.compute_theta_many(
+                "stability_factor_left_hand_matrix", self.training_set)
+        return self._training_set_thetas[position]
+
     def _closest_selected_parameters(self, M, N, mu):
         return self.greedy_selected_parameters[:N].closest(M, mu)
 
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from functools import partial
 from numpy import isclose
 from rbnics.backends import transpose
 from rbnics.backends.online import OnlineVector
@@ -12,6 +13,8 @@ from rbnics.reduction_methods.base import ReductionMethod
 from rbnics.scm.problems import ParametrizedStabilityFactorEigenProblem
 from rbnics.utils.io import (ErrorAnalysisTable, Folders, GreedyErrorEstimatorsList, SpeedupAnalysisTable,
                              TextBox, TextLine, Timer)
+from rbnics.utils.mpi import (init_local_worker_config, local_processes, local_spawned_pool_imap,
+                              local_worker_config_options)
 
 
 # Empirical interpolation method for the interpolation of parametrized functions
@@ -29,6 +32,8 @@ class SCMApproximationReductionMethod(ReductionMethod):
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
         self.greedy_selected_parameters = SCM_approximation.greedy_selected_parameters
         self.greedy_error_estimators = GreedyErrorEstimatorsList()
+        # Generator of truth problems for the bounding box farm
+        self.truth_problem_generator = None
 
     # OFFLINE: set the elements in the training set.
     def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
@@ -117,27 +122,13 @@ class SCMApproximationReductionMethod(ReductionMethod):
 
     # Compute the bounding box \mathcal{B}
     def compute_bounding_box(self):
-        # Resize the bounding box storage
-        Q = self.SCM_approximation.truth_problem.Q["stability_factor_left_hand_matrix"]
-
-        for q in range(Q):
-            # Compute the minimum eigenvalue
-            minimum_eigenvalue_calculator = ParametrizedStabilityFactorEigenProblem(
-                self.SCM_approximation.truth_problem, "smallest",
-                self.SCM_approximation.truth_problem._eigen_solver_parameters["bounding_box_minimum"],
-                self.folder_prefix, expansion_index=q)
-            minimum_eigenvalue_calculator.init()
-            (self.SCM_approximation.bounding_box_min[q], _) = minimum_eigenvalue_calculator.solve()
-            print("bounding_box_min[" + str(q) + "] = " + str(self.SCM_approximation.bounding_box_min[q]))
-
-            # Compute the maximum eigenvalue
-            maximum_eigenvalue_calculator = ParametrizedStabilityFactorEigenProblem(
-                self.SCM_approximation.truth_problem, "largest",
-                self.SCM_approximation.truth_problem._eigen_solver_parameters["bounding_box_maximum"],
-                self.folder_prefix, expansion_index=q)
-            maximum_eigenvalue_calculator.init()
-            (self.SCM_approximation.bounding_box_max[q], _) = maximum_eigenvalue_calculator.solve()
-            print("bounding_box_max[" + str(q) + "] = " + str(self.SCM_approximation.bounding_box_max[q]))
+        for (q, spectrum, eigenvalue) in self._farm_bounding_box():
+            if spectrum == "smallest":
+                self.SCM_approximation.bounding_box_min[q] = eigenvalue
+                print("bounding_box_min[" + str(q) + "] = " + str(self.SCM_approximation.bounding_box_min[q]))
+            else:
+                self.SCM_approximation.bounding_box_max[q] = eigenvalue
+                print("bounding_box_max[" + str(q) + "] = " + str(self.SCM_approximation.bounding_box_max[q]))
 
         # Save to file
         self.SCM_approximation.bounding_box_min.save(
@@ -145,6 +136,42 @@ class SCMApproximationReductionMethod(ReductionMethod):
         self.SCM_approximation.bounding_box_max.save(
             self.SCM_approximation.folder["reduced_operators"], "bounding_box_max")
 
+    def set_bounding_box_farm(self, truth_problem_generator):
+        """
+        Enable the bounding box farm, which distributes the bounding box eigenproblems over a pool of spawned local
+        processes (as many as the "bounding box processes" option of the "SCM" section of the configuration) in
+        serial runs. Scripts enabling the bounding box farm must call offline() under an if __name__ == "__main__"
+        guard.
+
+        :param truth_problem_generator: a picklable function without arguments (e.g., defined at module level),
+            which returns a truth problem equivalent to the one of this SCM approximation. It is called once in each
+            process of the pool, which owns its own truth problem.
+        """
+        self.truth_problem_generator = truth_problem_generator
+
+    def _farm_bounding_box(self):
+        """
+        Yield (expansion index, spectrum, eigenvalue) triplets for the smallest and largest eigenvalues of each term
+        of the stability factor left hand side, in order. If the bounding box farm is enabled, eigenproblems are
+        solved by a pool of spawned local processes, which receive only the expansion index and the spectrum and
+        send back only the eigenvalue. Otherwise, eigenproblems are solved one after the other.
+        """
+        Q = self.SCM_approximation.truth_problem.Q["stability_factor_left_hand_matrix"]
+        inputs = [(q, spectrum) for q in range(Q) for spectrum in ("smallest", "largest")]
+        processes = local_processes("SCM", "bounding box processes")
+        if (self.truth_problem_generator is not None and self.training_set.mpi_comm.size == 1
+                and processes > 1 and len(inputs) > 1):
+            initializer = partial(
+                _init_farmed_truth_problem, self.truth_problem_generator, self.folder_prefix,
+                local_worker_config_options())
+            eigenvalues = local_spawned_pool_imap(_farmed_bounding_box_solve, inputs, processes, initializer)
+        else:
+            eigenvalues = (
+                _bounding_box_solve(self.SCM_approximation.truth_problem, self.folder_prefix, q, spectrum)
+                for (q, spectrum) in inputs)
+        for ((q, spectrum), eigenvalue) in zip(inputs, eigenvalues):
+            yield (q, spectrum, eigenvalue)
+
     # Store the greedy parameter
     def store_greedy_selected_parameters(self):
         mu = self.SCM_approximation.mu
@@ -286,6 +313,7 @@ class SCMApproximationReductionMethod(ReductionMethod):
         # expression evaluation is actually carried out
         self.SCM_approximation._stability_factor_lower_bound_cache.clear()
         self.SCM_approximation._stability_factor_upper_bound_cache.clear()
+        self.SCM_approximation._stability_factor_lower_bounds.clear()
         self.SCM_approximation.stability_factor_calculator._eigenvalue_cache.clear()
         self.SCM_approximation.stability_factor_calculator._eigenvector_cache.clear()
 
@@ -337,3 +365,34 @@ class SCMApproximationReductionMethod(ReductionMethod):
         # Export speedup analysis table
         speedup_analysis_table.save(
             self.folder["speedup_analysis"], "speedup_analysis" if filename is None else filename)
+
+
+# Solve the eigenproblem for the smallest or largest eigenvalue of a term of the stability factor left hand side
+def _bounding_box_solve(truth_problem, folder_prefix, q, spectrum):
+    eigen_solver_parameters = truth_problem._eigen_solver_parameters[
+        "bounding_box_minimum" if spectrum == "smallest" else "bounding_box_maximum"]
+    eigenvalue_calculator = ParametrizedStabilityFactorEigenProblem(
+        truth_problem, spectrum, eigen_solver_parameters, folder_prefix, expansion_index=q)
+    eigenvalue_calculator.init()
+    (eigenvalue, _) = eigenvalue_calculator.solve()
+    return eigenvalue
+
+
+# Set up the truth problem owned by a process of the bounding box farm. Disk caching is disabled, since the current
+# process stores all bounding box eigenvalues
+def _init_farmed_truth_problem(truth_problem_generator, folder_prefix, config_options):
+    global _farmed_truth_problem, _farmed_folder_prefix
+    init_local_worker_config(config_options)
+    _farmed_truth_problem = truth_problem_generator()
+    _farmed_truth_problem.init()
+    _farmed_folder_prefix = folder_prefix
+
+
+# Solve a bounding box eigenproblem in a process of the bounding box farm, and return its eigenvalue
+def _farmed_bounding_box_solve(q_and_spectrum):
+    (q, spectrum) = q_and_spectrum
+    return _bounding_box_solve(_farmed_truth_problem, _farmed_folder_prefix, q, spectrum)
+
+
+_farmed_truth_problem = None
+_farmed_folder_prefix = None
@@ -70,6 +70,10 @@ def SCMDecoratedReductionMethod(DifferentialProblemReductionMethod_DerivedClass)
             # Return
             return import_successful and import_successful_SCM
 
+        # OFFLINE: enable the farm of SCM bounding box eigenproblems
+        def set_bounding_box_farm(self, truth_problem_generator):
+            self.SCM_reduction.set_bounding_box_farm(truth_problem_generator)
+
         # Perform the offline phase of the reduced order model
         def offline(self):
             # Perform first the SCM offline phase, ...
@@ -15,6 +15,7 @@ from rbnics.shape_parametrization.utils.symbolic.strings_to_sympy_symbolic_param
 from rbnics.shape_parametrization.utils.symbolic.sympy_eval import sympy_eval
 from rbnics.shape_parametrization.utils.symbolic.sympy_exec import sympy_exec
 from rbnics.shape_parametrization.utils.symbolic.sympy_io import SympyIO
+from rbnics.shape_parametrization.utils.symbolic.sympy_lambdify import sympy_lambdify
 from rbnics.shape_parametrization.utils.symbolic.sympy_symbolic_coordinates import sympy_symbolic_coordinates
 from rbnics.shape_parametrization.utils.symbolic.vertices_mapping_io import VerticesMappingIO
 
@@ -27,6 +28,7 @@ __all__ = [
     "sympy_eval",
     "sympy_exec",
     "SympyIO",
+    "sympy_lambdify",
     "sympy_symbolic_coordinates",
     "VerticesMappingIO"
 ]
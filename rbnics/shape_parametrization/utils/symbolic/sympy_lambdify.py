@@ -0,0 +1,19 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from sympy import lambdify, symbols, sympify
+
+
+def sympy_lambdify(expressions, P):
+    """
+    Compile a tuple of expressions (either sympy expressions, strings or numbers) depending on mu[0], ..., mu[P - 1]
+    into a function of mu returning the tuple of the values of all expressions, so that the expressions do not need
+    to be converted to string and evaluated by sympy_eval each time. Components of mu may also be arrays over
+    a batch of parameters.
+    """
+    mu_symb = [symbols("mu[" + str(p) + "]") for p in range(P)]
+    expressions = tuple(sympify(expression, locals={"mu": mu_symb}) for expression in expressions)
+    return lambdify([mu_symb], expressions, modules="numpy")
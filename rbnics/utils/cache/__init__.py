@@ -4,11 +4,15 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.utils.cache.cache import Cache, cache
+from rbnics.utils.cache.cache import Cache, cache, entries_limit, size_limit
+from rbnics.utils.cache.projection_cache import ProjectionCache
 from rbnics.utils.cache.time_series_cache import TimeSeriesCache
 
 __all__ = [
     "Cache",
     "cache",
+    "entries_limit",
+    "ProjectionCache",
+    "size_limit",
     "TimeSeriesCache"
 ]
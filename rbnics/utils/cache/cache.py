@@ -4,56 +4,64 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from collections.abc import MutableMapping
+import glob
+import os
+import re
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable, MutableMapping
 from functools import wraps
 from logging import DEBUG, getLogger
-from pylru import lrucache
 
 logger = getLogger("rbnics/utils/cache/cache.py")
 
 
 class Cache(object):
-    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None):
+    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None,
+                 folder=None):
         self._config_section = config_section
+        self._statistics = {"RAM hits": 0, "disk hits": 0, "misses": 0}
+        self._disk_storage = None
+        self._disk_suffixes = set()
         if self._config_section is None:
             self._storage = dict()
             self._key_generator = None
             self._import = None
             self._export = None
             self._filename_generator = None
+            self._folder = None
         else:
             from rbnics.utils.config import config  # cannot import at global scope
             cache_options = config.get(self._config_section, "cache")
             assert isinstance(cache_options, set)
             if "RAM" in cache_options:
-                cache_size = config.get(self._config_section, "RAM cache limit")
-                assert isinstance(cache_size, str)
-                if cache_size == "unlimited":
-                    self._storage = dict()
-                else:
-                    assert cache_size.isdigit()
-                    cache_size = int(cache_size)
-                    assert cache_size > 0
-                    self._storage = lrucache(cache_size)
+                self._storage = LRUStorage(
+                    entries_limit(config.get(self._config_section, "RAM cache limit")),
+                    size_limit(config.get(self._config_section, "RAM cache size limit")))
                 assert key_generator is not None
                 self._key_generator = key_generator
             else:
                 self._storage = DisabledStorage()
                 self._key_generator = key_generator
             if "disk" in cache_options:
-                cache_size = config.get(self._config_section, "disk cache limit")
-                assert isinstance(cache_size, str)
-                assert cache_size == "unlimited"
                 assert import_ is not None
                 self._import = import_
                 assert export is not None
                 self._export = export
                 assert filename_generator is not None
                 self._filename_generator = filename_generator
+                self._folder = folder
+                disk_entries_limit = entries_limit(config.get(self._config_section, "disk cache limit"))
+                disk_size_limit = size_limit(config.get(self._config_section, "disk cache size limit"))
+                if disk_entries_limit is not None or disk_size_limit is not None:
+                    assert folder is not None, "A folder is required to bound the disk cache"
+                    self._disk_storage = LRUStorage(
+                        disk_entries_limit, disk_size_limit, sizeof=int, on_evict=self._remove_from_disk)
             else:
                 self._import = None
                 self._export = None
                 self._filename_generator = None
+                self._folder = None
 
     def __len__(self):
         """
@@ -85,26 +93,34 @@ class Cache(object):
             if self._filename_generator is not None:
                 storage_filename = self._filename_generator(*args, **kwargs)
                 try:
-                    self._storage[storage_key] = self._import(storage_filename)
+                    storage_value = self._import(storage_filename)
                 except OSError:
                     logger.log(DEBUG, "Could not load key " + str(storage_key)
                                + " (corresponding to args = " + str(args)
                                + " and kwargs = " + str(kwargs) + ") from cache or disk")
+                    if self._disk_storage is not None and storage_filename in self._disk_storage:
+                        del self._disk_storage[storage_filename]
+                    self._statistics["misses"] += 1
                     raise key_error
                 else:
                     logger.log(DEBUG, "Loaded key " + str(storage_key)
                                + " (corresponding to args = " + str(args)
                                + " and kwargs = " + str(kwargs) + ") from disk")
-                    return self._storage[storage_key]
+                    self._storage[storage_key] = storage_value
+                    self._update_disk_storage(storage_filename)
+                    self._statistics["disk hits"] += 1
+                    return storage_value
             else:
                 logger.log(DEBUG, "Could not load key " + str(storage_key)
                            + " (corresponding to args = " + str(args)
                            + " and kwargs = " + str(kwargs) + ") from cache")
+                self._statistics["misses"] += 1
                 raise key_error
         else:
             logger.log(DEBUG, "Loaded key " + str(storage_key)
                        + " (corresponding to args = " + str(args)
                        + " and kwargs = " + str(kwargs) + ") from cache")
+            self._statistics["RAM hits"] += 1
             return storage_value
 
     def __setitem__(self, key, value):
@@ -115,7 +131,18 @@ class Cache(object):
         self._storage[storage_key] = value
         if self._filename_generator is not None:
             storage_filename = self._filename_generator(*args, **kwargs)
-            self._export(storage_filename)
+            if self._disk_storage is not None:
+                # Learn the suffixes of the files written by export, excluding files which already existed (e.g.,
+                # written by another cache sharing the same folder and filenames)
+                storage_prefix = os.path.join(str(self._folder), storage_filename)
+                existing_paths = self._glob_disk_paths(storage_prefix)
+                self._export(storage_filename)
+                self._disk_suffixes.update(
+                    storage_path[len(storage_prefix):]
+                    for storage_path in self._glob_disk_paths(storage_prefix) - existing_paths)
+            else:
+                self._export(storage_filename)
+            self._update_disk_storage(storage_filename)
 
     def __delitem__(self, key):
         """
@@ -148,6 +175,56 @@ class Cache(object):
                 storage_key = args
         return (args, kwargs, storage_key)
 
+    def _update_disk_storage(self, storage_filename):
+        """
+        Record the current size of the files associated to storage_filename, and mark them as most recently used.
+        Files which were not written or read during the current run are not accounted for, nor are files read
+        before export has been called at least once during the current run, since their suffixes are not known yet.
+        """
+        if self._disk_storage is not None and len(self._disk_suffixes) > 0:
+            from rbnics.utils.mpi import parallel_io  # cannot import at global scope
+            storage_paths = self._disk_paths(storage_filename)
+
+            def compute_disk_size():
+                return sum(
+                    os.path.getsize(storage_path) for storage_path in storage_paths if os.path.exists(storage_path))
+
+            self._disk_storage[storage_filename] = parallel_io(compute_disk_size)
+
+    def _remove_from_disk(self, storage_filename, _):
+        from rbnics.utils.mpi import parallel_io  # cannot import at global scope
+        storage_paths = self._disk_paths(storage_filename)
+
+        def remove_files():
+            for storage_path in storage_paths:
+                if os.path.exists(storage_path):
+                    os.remove(storage_path)
+
+        parallel_io(remove_files)
+        logger.log(DEBUG, "Removed " + storage_filename + " from disk")
+
+    def _disk_paths(self, storage_filename):
+        storage_prefix = os.path.join(str(self._folder), storage_filename)
+        return [storage_prefix + suffix for suffix in sorted(self._disk_suffixes)]
+
+    @staticmethod
+    def _glob_disk_paths(storage_prefix):
+        from rbnics.utils.mpi import parallel_io  # cannot import at global scope
+
+        def glob_paths():
+            return set(glob.glob(glob.escape(storage_prefix) + "*"))
+
+        return parallel_io(glob_paths)
+
+    def statistics(self):
+        """
+        Returns the number of hits, misses and evictions recorded so far.
+        """
+        statistics = dict(self._statistics)
+        statistics["RAM evictions"] = getattr(self._storage, "evictions", 0)
+        statistics["disk evictions"] = self._disk_storage.evictions if self._disk_storage is not None else 0
+        return statistics
+
     def __iter__(self):
         """
         Iterate over current RAM cache.
@@ -205,3 +282,121 @@ class DisabledStorage(MutableMapping):
 
     def __keytransform__(self, key):
         return key
+
+
+class LRUStorage(MutableMapping):
+    """
+    Least recently used storage, bounded by the number of entries and/or by the overall size (in bytes) of the
+    stored values. The most recently stored entry is never evicted.
+    """
+
+    def __init__(self, entries_limit=None, size_limit=None, sizeof=None, on_evict=None):
+        assert entries_limit is None or entries_limit > 0
+        assert size_limit is None or size_limit > 0
+        self._entries_limit = entries_limit
+        self._size_limit = size_limit
+        if sizeof is None:
+            sizeof = _sizeof
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self._storage = OrderedDict()
+        self._sizes = dict()
+        self.size = 0
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        value = self._storage[key]
+        self._storage.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._storage:
+            self.size -= self._sizes.pop(key)
+        self._storage[key] = value
+        self._storage.move_to_end(key)
+        if self._size_limit is not None:
+            self._sizes[key] = self._sizeof(value)
+            self.size += self._sizes[key]
+        self._evict()
+
+    def __delitem__(self, key):
+        del self._storage[key]
+        if key in self._sizes:
+            self.size -= self._sizes.pop(key)
+
+    def __contains__(self, key):
+        return key in self._storage
+
+    def __iter__(self):
+        return iter(self._storage)
+
+    def __len__(self):
+        return len(self._storage)
+
+    def clear(self):
+        self._storage.clear()
+        self._sizes.clear()
+        self.size = 0
+
+    def refresh(self, key):
+        """
+        Recompute the size of an entry whose value has been changed in place.
+        """
+        if self._size_limit is not None and key in self._storage:
+            self.size -= self._sizes[key]
+            self._sizes[key] = self._sizeof(self._storage[key])
+            self.size += self._sizes[key]
+            self._evict()
+
+    def _evict(self):
+        while len(self._storage) > 1 and (
+            (self._entries_limit is not None and len(self._storage) > self._entries_limit)
+            or (self._size_limit is not None and self.size > self._size_limit)
+        ):
+            (key, value) = self._storage.popitem(last=False)
+            if key in self._sizes:
+                self.size -= self._sizes.pop(key)
+            self.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+
+
+def _sizeof(value):
+    if hasattr(value, "nbytes"):  # numpy arrays
+        return value.nbytes
+    elif hasattr(value, "content"):  # online vectors and matrices
+        return _sizeof(value.content)
+    elif hasattr(value, "vector"):  # functions
+        return _sizeof(value.vector())
+    elif hasattr(value, "local_size"):  # dolfin vectors
+        return value.local_size() * 8
+    elif isinstance(value, Iterable) and not isinstance(value, (str, bytes)):  # time series, lists and tuples
+        return sum(_sizeof(v) for v in value)
+    else:
+        return sys.getsizeof(value)
+
+
+def entries_limit(limit):
+    assert isinstance(limit, str)
+    if limit == "unlimited":
+        return None
+    else:
+        assert limit.isdigit()
+        limit = int(limit)
+        assert limit > 0
+        return limit
+
+
+_size_units = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def size_limit(limit):
+    assert isinstance(limit, str)
+    if limit == "unlimited":
+        return None
+    else:
+        match = re.fullmatch(r"\s*(\d+)\s*([KMGT]?B)?\s*", limit.upper())
+        assert match is not None, "Invalid size limit " + limit
+        limit = int(match.group(1)) * _size_units[match.group(2) or "B"]
+        assert limit > 0
+        return limit
@@ -0,0 +1,86 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+
+class ProjectionCache(object):
+    """
+    Storage of the projections of truth operators onto a basis functions matrix. If the same truth operator is
+    projected again after the basis has been enriched (e.g. at every iteration of a greedy algorithm), only the
+    entries associated to the new basis functions are computed, while the remaining ones are copied from the
+    previous projection. Basis functions are compared by identity, so that any basis function which has been
+    replaced (rather than appended) triggers a full projection.
+    """
+
+    def __init__(self):
+        self._storage = dict()  # from key to (truth operator, basis functions, reduced operator)
+
+    def project(self, key, basis_functions, truth_operator, order):
+        """
+        Returns transpose(basis_functions) * truth_operator * basis_functions for matrices (order 2), or
+        transpose(basis_functions) * truth_operator for vectors (order 1).
+        """
+        from rbnics.backends import transpose  # cannot import at global scope
+        from rbnics.backends.online import OnlineMatrix, OnlineVector  # cannot import at global scope
+        from rbnics.utils.io import OnlineSizeDict  # cannot import at global scope
+        assert order in (1, 2)
+        functions = {component_name: tuple(basis_functions[component_name])
+                     for component_name in basis_functions._components_name}
+        N = OnlineSizeDict(basis_functions._component_name_to_basis_component_length)
+        N_previous = self._previous_size(key, functions, truth_operator)
+        if N_previous is None:
+            if order == 2:
+                reduced_operator = transpose(basis_functions) * truth_operator * basis_functions
+            else:
+                reduced_operator = transpose(basis_functions) * truth_operator
+        elif N_previous == N:
+            reduced_operator = self._storage[key][2]
+        else:
+            previous_reduced_operator = self._storage[key][2]
+            new_basis_functions = basis_functions[N_previous:N]
+            if order == 2:
+                reduced_operator = OnlineMatrix(N, N)
+                reduced_operator[:N_previous, :N_previous] = previous_reduced_operator
+                reduced_operator[:N, N_previous:N] = transpose(basis_functions) * truth_operator * new_basis_functions
+                reduced_operator[N_previous:N, :N_previous] = (
+                    transpose(new_basis_functions) * truth_operator * basis_functions[:N_previous])
+            else:
+                reduced_operator = OnlineVector(N)
+                reduced_operator[:N_previous] = previous_reduced_operator
+                reduced_operator[N_previous:N] = transpose(new_basis_functions) * truth_operator
+        self._storage[key] = (truth_operator, functions, reduced_operator)
+        return reduced_operator
+
+    def _previous_size(self, key, functions, truth_operator):
+        """
+        Returns the size of the previous projection if it can be reused, and None otherwise.
+        """
+        from rbnics.backends.online import OnlineMatrix, OnlineVector  # cannot import at global scope
+        from rbnics.utils.io import OnlineSizeDict  # cannot import at global scope
+        if key not in self._storage:
+            return None
+        (previous_truth_operator, previous_functions, previous_reduced_operator) = self._storage[key]
+        if (
+            previous_truth_operator is not truth_operator
+            or not isinstance(previous_reduced_operator, (OnlineMatrix.Type(), OnlineVector.Type()))
+            or previous_functions.keys() != functions.keys()
+        ):
+            return None
+        N_previous = OnlineSizeDict()
+        for (component_name, component_functions) in functions.items():
+            previous_component_functions = previous_functions[component_name]
+            if (
+                len(previous_component_functions) > len(component_functions)
+                or any(previous_function is not function for (previous_function, function) in zip(
+                    previous_component_functions, component_functions))
+            ):
+                return None
+            N_previous[component_name] = len(previous_component_functions)
+        if sum(N_previous.values()) == 0:
+            return None
+        return N_previous
+
+    def clear(self):
+        self._storage.clear()
@@ -4,7 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.utils.cache.cache import Cache
+from rbnics.utils.cache.cache import Cache, LRUStorage
 
 
 class TimeSeriesCache(Cache):
@@ -24,6 +24,18 @@ class TimeSeriesCache(Cache):
             def patched_append(self_, item):
                 self._export(storage_filename, item, len(self_))
                 original_append(item)
+                self._update_disk_storage(storage_filename)
+                self._refresh_storage(storage_key)
+
+            PatchInstanceMethod(value, "append", patched_append).patch()
+        elif isinstance(self._storage, LRUStorage):
+            # Patch value's append method to keep track of its size in RAM
+            (_, _, storage_key) = self._compute_storage_key(key)
+            original_append = value.append
+
+            def patched_append(self_, item):
+                original_append(item)
+                self._refresh_storage(storage_key)
 
             PatchInstanceMethod(value, "append", patched_append).patch()
         # Call standard setitem, disabling export
@@ -31,3 +43,7 @@ class TimeSeriesCache(Cache):
         self._filename_generator = None
         Cache.__setitem__(self, key, value)
         self._filename_generator = bak_filename_generator
+
+    def _refresh_storage(self, storage_key):
+        if isinstance(self._storage, LRUStorage):
+            self._storage.refresh(storage_key)
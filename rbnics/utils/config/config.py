@@ -17,27 +17,48 @@ class Config(object):
     # Set class defaults
     defaults = {
         "backends": {
+            "basis functions storage": "objects",
+            "lazy import": False,
             "online backend": "numpy",
+            "online affine expansion storage": "objects",
+            "online affine expansion storage format": "files",
             "required backends": None
         },
         "EIM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
-            "RAM cache limit": "1"
+            "disk cache size limit": "unlimited",
+            "greedy memory limit": "1GB",
+            "RAM cache limit": "1",
+            "RAM cache size limit": "unlimited"
+        },
+        "POD": {
+            "incremental": False,
+            "incremental tolerance": "1e-12"
         },
         "problems": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
-            "RAM cache limit": "1"
+            "disk cache size limit": "unlimited",
+            "RAM cache limit": "1",
+            "RAM cache size limit": "unlimited"
         },
         "reduced problems": {
             "cache": {"RAM"},
-            "RAM cache limit": "unlimited"
+            "RAM cache limit": "unlimited",
+            "RAM cache size limit": "unlimited"
+        },
+        "sampling": {
+            "max processes": "1",
+            "snapshot processes": "1"
         },
         "SCM": {
+            "bounding box processes": "1",
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
-            "RAM cache limit": "1"
+            "disk cache size limit": "unlimited",
+            "RAM cache limit": "1",
+            "RAM cache size limit": "unlimited"
         }
     }
 
@@ -43,6 +43,7 @@ from rbnics.utils.decorators.store_problem_decorators_for_factories import (
     StoreProblemDecoratorsForFactories)
 from rbnics.utils.decorators.sync_setters import sync_setters
 from rbnics.utils.decorators.theta_type import ComputeThetaType, DictOfThetaType, ThetaType
+from rbnics.utils.decorators.vectorized_compute_theta import vectorized_compute_theta
 
 __all__ = [
     "ABCMeta",
@@ -101,5 +102,6 @@ __all__ = [
     "sync_setters",
     "ThetaType",
     "tuple_of",
-    "UpdateMapFromProblemToTrainingStatus"
+    "UpdateMapFromProblemToTrainingStatus",
+    "vectorized_compute_theta"
 ]
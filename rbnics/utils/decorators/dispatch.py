@@ -75,11 +75,13 @@ class InvalidSignatureError(TypeError):
 # == Customize Dispatcher == #
 class Dispatcher(OriginalDispatcher):
     # extend slots with new private members
-    __slots__ = "__name__", "name", "funcs", "_ordering", "_cache", "doc", "signature_to_provided_signature"
+    __slots__ = ("__name__", "name", "funcs", "_ordering", "_cache", "doc", "signature_to_provided_signature",
+                 "deferred_registrations")
 
     def __init__(self, name, doc=None):
         OriginalDispatcher.__init__(self, name, doc)
         self.signature_to_provided_signature = dict()
+        self.deferred_registrations = list()
 
     def add(self, signature, func, replaces=None, replaces_if=None):
         for types in expand_tuples(signature):
@@ -150,6 +152,8 @@ class Dispatcher(OriginalDispatcher):
         return func(*args, **kwargs)
 
     def _get_func(self, *args):
+        while len(self.deferred_registrations) > 0:
+            self.deferred_registrations.pop(0)()
         if len(args) > 1:
             types = get_types(args)
         elif len(args) == 1 and args[0] is not None:
@@ -169,6 +173,8 @@ class Dispatcher(OriginalDispatcher):
             * get_types() function is used to get input types. This handles the case of
               array_of, dict_of, iterable_of, list_of, set_of, tuple_of
             * a custom UnavailableSignatureError is thrown if no corresponding signature is provided
+            * deferred registrations (e.g. of backends which are imported lazily) are carried out
+              before the first dispatch
         It is based on the original multipledispatch implementation of Dispatcher.__call__
         """
 
@@ -250,7 +256,7 @@ class MethodDispatcher_Wrapper(object):
 class MethodDispatcher(Dispatcher):
     # extend slots with new private members
     __slots__ = ("__name__", "name", "funcs", "_ordering", "_cache", "doc", "signature_to_provided_signature",
-                 "origin", "obj")
+                 "deferred_registrations", "origin", "obj")
 
     def __init__(self, origin, cls, name, doc=None):
         Dispatcher.__init__(self, name, doc)
@@ -630,7 +636,11 @@ def get_type(input_):
         # should be preserved
         or (type_input_ in (array, ) and input_.dtype == object)
     ):
-        subtypes = get_types(input_)
+        # Fast path: if no element requires a recursive inspection (i.e., elements are neither containers nor None),
+        # the set of their types can be computed without calling get_type() on each one of them
+        subtypes = set(map(type, input_))
+        if not subtypes.isdisjoint(_recursively_inspected_types):
+            subtypes = get_types(input_)
         subtypes = tuple(set(subtypes))  # remove repeated types
         if len(subtypes) == 1:
             subtypes = subtypes[0]
@@ -661,6 +671,10 @@ def get_type(input_):
             return None
 
 
+# Element types which require get_type() to be called recursively, rather than simply calling type()
+_recursively_inspected_types = frozenset((array, dict, list, set, tuple, type(None)))
+
+
 # == Customize tuple expansion to handle array_of, dict_of, iterable_of, list_of, set_of, tuple_of == #
 def expand_tuples(L):
     if not L:
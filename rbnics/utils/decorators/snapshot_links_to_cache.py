@@ -6,6 +6,7 @@
 
 import glob
 import os
+import shutil
 from rbnics.utils.mpi import parallel_io
 from rbnics.utils.test import PatchInstanceMethod
 
@@ -22,10 +23,17 @@ def snapshot_links_to_cache(offline_method):
                         or hasattr(truth_problem, "_cache_file"))
                 if hasattr(truth_problem, "_cache_file_from_kwargs"):  # differential problem
                     cache_filename = truth_problem._cache_file_from_kwargs(**truth_problem._latest_solve_kwargs)
+                    if hasattr(truth_problem, "_solution_over_time_cache"):  # time dependent problem
+                        cache = truth_problem._solution_over_time_cache
+                    else:
+                        cache = truth_problem._solution_cache
                 elif hasattr(truth_problem, "_cache_file"):  # EIM
                     cache_filename = truth_problem._cache_file()
+                    cache = truth_problem._snapshot_cache
                 else:
                     raise AttributeError("Invalid cache file attribute.")
+                # Files in a bounded disk cache may be evicted later on, and thus cannot be linked
+                cache_is_bounded = cache._disk_storage is not None
 
                 def create_links():
                     for cache_path in glob.iglob(os.path.join(str(cache_folder), cache_filename + "*")):
@@ -45,8 +53,10 @@ def snapshot_links_to_cache(offline_method):
                                 should_link = True
                             else:
                                 should_link = (header != "<?xml")
-                            if should_link:
+                            if should_link and not cache_is_bounded:
                                 os.symlink(cache_relpath, snapshot_path)
+                            elif should_link:
+                                shutil.copyfile(cache_path, snapshot_path)
                             else:
                                 with open(cache_path, "r") as cache_file, open(snapshot_path, "w") as snapshot_file:
                                     for l in cache_file.readlines():  # noqa: E741
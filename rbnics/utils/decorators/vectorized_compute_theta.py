@@ -0,0 +1,16 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+
+def vectorized_compute_theta(compute_theta):
+    """
+    Decorator to be applied to a compute_theta(term) method which only uses NumPy broadcasting (or basic arithmetic)
+    on the components of self.mu. In this case, thetas for a batch of parameters are computed by compute_theta_many()
+    through a single call in which each component of self.mu is an array over the batch, rather than one call
+    for each parameter.
+    """
+    compute_theta.vectorized = True
+    return compute_theta
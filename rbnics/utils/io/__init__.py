@@ -11,6 +11,7 @@ from rbnics.utils.io.exportable_list import ExportableList
 from rbnics.utils.io.folders import Folders
 from rbnics.utils.io.greedy_error_estimators_list import GreedyErrorEstimatorsList
 from rbnics.utils.io.greedy_selected_parameters_list import GreedySelectedParametersList
+from rbnics.utils.io.numpy_archive_io import NumpyArchiveIO
 from rbnics.utils.io.numpy_io import NumpyIO
 from rbnics.utils.io.performance_table import PerformanceTable
 from rbnics.utils.io.online_size_dict import OnlineSizeDict
@@ -29,6 +30,7 @@ __all__ = [
     "Folders",
     "GreedyErrorEstimatorsList",
     "GreedySelectedParametersList",
+    "NumpyArchiveIO",
     "NumpyIO",
     "OnlineSizeDict",
     "PerformanceTable",
@@ -0,0 +1,100 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import numpy
+from rbnics.utils.mpi import parallel_io
+
+
+class NumpyArchiveIO(object):
+    """
+    Pack several arrays in a single file, preceded by a header containing their index (dtype, shape and offset
+    of each array) and further user defined metadata. Arrays are loaded as memory maps, so that they are read
+    lazily and their pages are shared between all processes which load the same file.
+    """
+
+    _magic = b"RBNICS_ARCHIVE\x01"
+    _alignment = 64
+
+    # Save a dict from string to array to file
+    @staticmethod
+    def save_file(content, directory, filename, metadata=None):
+        if not filename.endswith(".npa"):
+            filename = filename + ".npa"
+        if metadata is None:
+            metadata = dict()
+
+        def save_file_task():
+            content_as_contiguous_arrays = dict()
+            for (key, array) in content.items():
+                content_as_contiguous_arrays[key] = numpy.ascontiguousarray(array)
+            # Compute index, assuming a header of (at most) the same length of the one without offsets
+            # and then iterating until the header length does not change
+            header_length = 0
+            while True:
+                data_offset = NumpyArchiveIO._align(len(NumpyArchiveIO._magic) + 8 + header_length)
+                index = dict()
+                for (key, array) in content_as_contiguous_arrays.items():
+                    index[key] = (array.dtype.str, array.shape, data_offset)
+                    data_offset = NumpyArchiveIO._align(data_offset + array.nbytes)
+                header = repr({"index": index, "metadata": metadata}).encode()
+                if len(header) == header_length:
+                    break
+                else:
+                    header_length = len(header)
+            # Write to a temporary file and then move it, so that processes which have already memory-mapped
+            # a previous version of the file are not affected
+            full_filename = os.path.join(str(directory), filename)
+            with open(full_filename + ".tmp", "wb") as outfile:
+                outfile.write(NumpyArchiveIO._magic)
+                outfile.write(header_length.to_bytes(8, "little"))
+                outfile.write(header)
+                for (key, array) in content_as_contiguous_arrays.items():
+                    (_, _, offset) = index[key]
+                    outfile.write(b"\0" * (offset - outfile.tell()))
+                    outfile.write(array.tobytes())
+            os.replace(full_filename + ".tmp", full_filename)
+
+        parallel_io(save_file_task)
+
+    # Load a dict from string to (memory mapped) array from file, and the associated metadata
+    @staticmethod
+    def load_file(directory, filename, globals=None):
+        if not filename.endswith(".npa"):
+            filename = filename + ".npa"
+        if globals is None:
+            globals = dict()
+        globals.update({"__builtins__": None})
+        full_filename = os.path.join(str(directory), filename)
+        with open(full_filename, "rb") as infile:
+            assert infile.read(len(NumpyArchiveIO._magic)) == NumpyArchiveIO._magic, (
+                full_filename + " is not a valid archive")
+            header_length = int.from_bytes(infile.read(8), "little")
+            header = eval(infile.read(header_length).decode(), globals, {})
+        content = dict()
+        for (key, (dtype, shape, offset)) in header["index"].items():
+            if numpy.prod(shape) > 0:
+                # copy-on-write memory map: pages are shared until (and unless) they are modified
+                content[key] = numpy.memmap(full_filename, dtype=numpy.dtype(dtype), mode="c", offset=offset,
+                                            shape=shape)
+            else:
+                content[key] = numpy.zeros(shape, dtype=numpy.dtype(dtype))
+        return (content, header["metadata"])
+
+    # Check if the file exists
+    @staticmethod
+    def exists_file(directory, filename):
+        if not filename.endswith(".npa"):
+            filename = filename + ".npa"
+
+        def exists_file_task():
+            return os.path.exists(os.path.join(str(directory), filename))
+
+        return parallel_io(exists_file_task)
+
+    @staticmethod
+    def _align(offset):
+        return - (- offset // NumpyArchiveIO._alignment) * NumpyArchiveIO._alignment
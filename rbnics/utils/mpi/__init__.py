@@ -4,11 +4,18 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from rbnics.utils.mpi.local_pool import (init_local_worker_config, local_processes, local_spawned_pool_imap,
+                                         local_spawned_pool_map, local_worker_config_options)
 from rbnics.utils.mpi.parallel_io import parallel_io
 from rbnics.utils.mpi.parallel_max import parallel_max
 from rbnics.utils.mpi.print import print
 
 __all__ = [
+    "init_local_worker_config",
+    "local_processes",
+    "local_spawned_pool_imap",
+    "local_spawned_pool_map",
+    "local_worker_config_options",
     "parallel_io",
     "parallel_max",
     "print"
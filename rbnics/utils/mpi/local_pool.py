@@ -0,0 +1,65 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from math import ceil
+from multiprocessing import get_context
+
+
+# Evaluate a generator on a pool of local processes. Workers are spawned rather than forked, so that they do not
+# inherit any MPI or PETSc state of the current process: an initializer is called once in each worker to set up the
+# data required by generator (e.g., a truth or reduced problem). Both generator and initializer must be picklable,
+# and scripts must only start the pool under an if __name__ == "__main__" guard, since spawned workers import the
+# main module. This is only meant for serial runs, and for generators which do not require any collective
+# communication.
+def local_processes(config_section, option):
+    from rbnics.utils.config import config  # cannot import at global scope
+    processes = config.get(config_section, option)
+    if processes == "auto":
+        return os.cpu_count()
+    else:
+        assert processes.isdigit()
+        return int(processes)
+
+
+def local_spawned_pool_map(generator, inputs, processes, initializer):
+    """
+    Return the list of values of generator on each input.
+    """
+    processes = min(processes, len(inputs))
+    with get_context("spawn").Pool(processes, initializer=initializer) as pool:
+        return pool.map(generator, inputs, chunksize=ceil(len(inputs) / (4 * processes)))
+
+
+def local_spawned_pool_imap(generator, inputs, processes, initializer):
+    """
+    Yield the value of generator on each input, in order, as soon as it is available.
+    """
+    processes = min(processes, len(inputs))
+    with get_context("spawn").Pool(processes, initializer=initializer) as pool:
+        yield from pool.imap(generator, inputs)
+
+
+def local_worker_config_options():
+    """
+    Return the options of the current configuration, to be replicated in each worker by init_local_worker_config.
+    """
+    from rbnics.utils.config import config  # cannot import at global scope
+    return {
+        section: {option: config.get(section, option) for option in options}
+        for (section, options) in config.defaults.items() if section != "backends"}
+
+
+def init_local_worker_config(config_options):
+    """
+    Replicate the options of the configuration of the current process in a worker. Disk caching of truth problems
+    is disabled, since the current process stores all results computed by workers.
+    """
+    from rbnics.utils.config import config  # cannot import at global scope
+    for (section, options) in config_options.items():
+        for (option, value) in options.items():
+            config.set(section, option, value)
+    config.set("problems", "cache", {"RAM"})
@@ -4,15 +4,25 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import matplotlib
-import matplotlib.pyplot as plt
-matplotlib_backend = matplotlib.get_backend()
+# matplotlib is only imported when needed, since it would otherwise considerably increase the time required
+# to import RBniCS
+matplotlib_backend = None
 
 
 def disable_matplotlib():
+    global matplotlib_backend
+    import matplotlib
+    import matplotlib.pyplot as plt
+    if matplotlib_backend is None:
+        matplotlib_backend = matplotlib.get_backend()
     plt.switch_backend("agg")
 
 
 def enable_matplotlib():
-    plt.switch_backend(matplotlib_backend)
+    import matplotlib
+    import matplotlib.pyplot as plt
+    if matplotlib_backend is None:
+        plt.switch_backend(matplotlib.get_backend())
+    else:
+        plt.switch_backend(matplotlib_backend)
     plt.close("all")  # do not trigger matplotlib max_open_warning
@@ -9,11 +9,11 @@ import sys
 import gc
 import time
 from math import ceil
-import matplotlib.pyplot as plt
 from rbnics.utils.io import Timer
 
 
 def patch_benchmark_plugin(benchmark_plugin):
+    import matplotlib.pyplot as plt
     from pytest_benchmark.fixture import BenchmarkFixture as OriginalBenchmarkFixture
     from pytest_benchmark.session import BenchmarkSession as OriginalBenchmarkSession
     from pytest_benchmark.timers import compute_timer_precision as original_compute_timer_precision
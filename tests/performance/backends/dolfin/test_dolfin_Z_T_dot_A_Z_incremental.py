@@ -0,0 +1,67 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from numpy.linalg import norm
+from dolfin import assemble, dx, grad, FunctionSpace, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics.backends import BasisFunctionsMatrix, transpose
+from rbnics.utils.cache import ProjectionCache
+from test_dolfin_utils import RandomDolfinFunction
+
+
+class Data(object):
+    def __init__(self, Th, N):
+        self.N = N
+        mesh = UnitSquareMesh(Th, Th)
+        self.V = FunctionSpace(mesh, "Lagrange", 1)
+        u = TrialFunction(self.V)
+        v = TestFunction(self.V)
+        self.a = lambda k: k * inner(grad(u), grad(v)) * dx
+
+    def generate_random(self):
+        # Generate random vectors
+        Z = BasisFunctionsMatrix(self.V)
+        Z.init("u")
+        for _ in range(self.N):
+            b = RandomDolfinFunction(self.V)
+            Z.enrich(b)
+        k = RandomDolfinFunction(self.V)
+        # Generate random matrix
+        A = assemble(self.a(k))
+        # Return
+        return (Z, A)
+
+    def evaluate_full(self, Z, A):
+        # Assemble the reduced matrix from scratch at each iteration of a greedy-like enrichment of Z
+        for n in range(1, self.N + 1):
+            result_full = transpose(Z[:n]) * A * Z[:n]
+        return result_full
+
+    def evaluate_incremental(self, Z, A):
+        # Only compute the row and column associated to the new basis function at each iteration
+        projection_cache = ProjectionCache()
+        for n in range(1, self.N + 1):
+            result_incremental = projection_cache.project("A", Z[:n], A, 2)
+        return result_incremental
+
+    def assert_incremental(self, Z, A, result_incremental):
+        result_full = transpose(Z) * A * Z
+        relative_error = norm(result_full - result_incremental) / norm(result_full)
+        assert isclose(relative_error, 0., atol=1e-12)
+
+
+@pytest.mark.parametrize("Th", [2**i for i in range(3, 7)])
+@pytest.mark.parametrize("N", [10 + 4 * j for j in range(1, 4)])
+@pytest.mark.parametrize("test_type", ["full", "incremental"])
+def test_dolfin_Z_T_dot_A_Z_incremental(Th, N, test_type, benchmark):
+    data = Data(Th, N)
+    print("Th = " + str(Th) + ", Nh = " + str(data.V.dim()) + ", N = " + str(N))
+    print("Testing", test_type)
+    if test_type == "full":
+        benchmark(data.evaluate_full, setup=data.generate_random)
+    else:
+        benchmark(data.evaluate_incremental, setup=data.generate_random, teardown=data.assert_incremental)
@@ -12,6 +12,7 @@ from rbnics.backends import BasisFunctionsMatrix
 from rbnics.backends import transpose as factory_transpose
 from rbnics.backends.dolfin import transpose as dolfin_transpose
 from rbnics.backends.online.numpy import Vector as NumpyVector
+from rbnics.utils.config import config
 from test_dolfin_utils import RandomDolfinFunction
 
 transpose = None
@@ -32,6 +33,9 @@ class Data(object):
             b = RandomDolfinFunction(self.V)
             Z.enrich(b)
         F = RandomDolfinFunction(self.V)
+        # The local content of Z is kept in sync with the basis during enrichment rather than assembled at each
+        # product, so prepare it here in order not to time it
+        Z.content_as_array()
         # Return
         return (Z, F)
 
@@ -52,15 +56,21 @@ class Data(object):
 
 @pytest.mark.parametrize("Th", [2**i for i in range(3, 7)])
 @pytest.mark.parametrize("N", [10 + 4 * j for j in range(1, 4)])
+@pytest.mark.parametrize("storage", ["objects", "contiguous"])
 @pytest.mark.parametrize("test_type", ["builtin"] + list(all_transpose.keys()))
-def test_dolfin_Z_T_dot_F(Th, N, test_type, benchmark):
+def test_dolfin_Z_T_dot_F(Th, N, storage, test_type, benchmark):
     data = Data(Th, N)
-    print("Th = " + str(Th) + ", Nh = " + str(data.V.dim()) + ", N = " + str(N))
-    if test_type == "builtin":
-        print("Testing", test_type)
-        benchmark(data.evaluate_builtin, setup=data.generate_random)
-    else:
-        print("Testing", test_type, "backend")
-        global transpose
-        transpose = all_transpose[test_type]
-        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
+    print("Th = " + str(Th) + ", Nh = " + str(data.V.dim()) + ", N = " + str(N) + ", storage = " + storage)
+    default_storage = config.get("backends", "basis functions storage")
+    config.set("backends", "basis functions storage", storage)
+    try:
+        if test_type == "builtin":
+            print("Testing", test_type)
+            benchmark(data.evaluate_builtin, setup=data.generate_random)
+        else:
+            print("Testing", test_type, "backend")
+            global transpose
+            transpose = all_transpose[test_type]
+            benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
+    finally:
+        config.set("backends", "basis functions storage", default_storage)
@@ -8,6 +8,7 @@ import pytest
 from numpy import isclose
 from dolfin import FunctionSpace, UnitSquareMesh
 from rbnics.backends import BasisFunctionsMatrix
+from rbnics.utils.config import config
 from test_dolfin_utils import RandomDolfinFunction, RandomNumpyVector
 
 
@@ -25,6 +26,9 @@ class Data(object):
             b = RandomDolfinFunction(self.V)
             Z.enrich(b)
         uN = RandomNumpyVector(self.N)
+        # The local content of Z is kept in sync with the basis during enrichment rather than assembled at each
+        # product, so prepare it here in order not to time it
+        Z.content_as_array()
         # Return
         return (Z, uN)
 
@@ -46,13 +50,19 @@ class Data(object):
 
 @pytest.mark.parametrize("Th", [2**i for i in range(3, 7)])
 @pytest.mark.parametrize("N", [10 + 4 * j for j in range(1, 4)])
+@pytest.mark.parametrize("storage", ["objects", "contiguous"])
 @pytest.mark.parametrize("test_type", ["builtin", "__mul__"])
-def test_dolfin_Z_uN(Th, N, test_type, benchmark):
+def test_dolfin_Z_uN(Th, N, storage, test_type, benchmark):
     data = Data(Th, N)
-    print("Th = " + str(Th) + ", Nh = " + str(data.V.dim()) + ", N = " + str(N))
-    if test_type == "builtin":
-        print("Testing", test_type)
-        benchmark(data.evaluate_builtin, setup=data.generate_random)
-    else:
-        print("Testing", test_type, "backend")
-        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
+    print("Th = " + str(Th) + ", Nh = " + str(data.V.dim()) + ", N = " + str(N) + ", storage = " + storage)
+    default_storage = config.get("backends", "basis functions storage")
+    config.set("backends", "basis functions storage", storage)
+    try:
+        if test_type == "builtin":
+            print("Testing", test_type)
+            benchmark(data.evaluate_builtin, setup=data.generate_random)
+        else:
+            print("Testing", test_type, "backend")
+            benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
+    finally:
+        config.set("backends", "basis functions storage", default_storage)
@@ -0,0 +1,92 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+# The cost of evaluating at DOFs is dominated by collective operations in parallel, so that this test is
+# meant to be run with e.g. mpirun -n 4
+
+import pytest
+from mpi4py.MPI import COMM_WORLD, MAX
+from numpy import isclose
+from numpy.linalg import norm
+from numpy.random import randint
+from dolfin import assemble, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics.backends.dolfin.wrapping import (evaluate_and_vectorize_sparse_matrix_at_dofs,
+                                             evaluate_sparse_vector_at_dofs, to_petsc4py)
+from rbnics.backends.online.numpy import Vector as NumpyVector
+from test_dolfin_utils import RandomDolfinFunction
+
+
+class Data(object):
+    def __init__(self, Th, M, tensor):
+        self.M = M
+        self.tensor = tensor
+        mesh = UnitSquareMesh(Th, Th)
+        self.V = FunctionSpace(mesh, "Lagrange", 1)
+        u = TrialFunction(self.V)
+        v = TestFunction(self.V)
+        self.a = lambda k: k * inner(grad(u), grad(v)) * dx
+
+    def generate_random(self):
+        # Generate random tensor
+        k = RandomDolfinFunction(self.V)
+        if self.tensor == "vector":
+            A = k.vector()
+        else:
+            A = assemble(self.a(k))
+        # Generate random DOFs, which are the same on every process. Matrix DOFs are taken on the diagonal,
+        # which is always part of the sparsity pattern
+        if COMM_WORLD.rank == 0:
+            rows = randint(self.V.dim(), size=self.M).tolist()
+        else:
+            rows = None
+        rows = COMM_WORLD.bcast(rows, root=0)
+        if self.tensor == "vector":
+            dofs_list = [(i, ) for i in rows]
+        else:
+            dofs_list = [(i, i) for i in rows]
+        # Return
+        return (A, dofs_list)
+
+    def evaluate_builtin(self, A, dofs_list):
+        # Find the owner of each DOF and broadcast its value, one DOF at a time
+        tensor = to_petsc4py(A)
+        row_start, row_end = tensor.getOwnershipRange()
+        mpi_comm = tensor.comm.tompi4py()
+        result_builtin = NumpyVector(self.M)
+        for (index, dofs) in enumerate(dofs_list):
+            value = None
+            processor = -1
+            if dofs[0] >= row_start and dofs[0] < row_end:
+                value = tensor.getValue(*dofs)
+                processor = mpi_comm.rank
+            processor = mpi_comm.allreduce(processor, op=MAX)
+            result_builtin[index] = mpi_comm.bcast(value, root=processor)
+        return result_builtin
+
+    def evaluate_backend(self, A, dofs_list):
+        if self.tensor == "vector":
+            return evaluate_sparse_vector_at_dofs(A, dofs_list)
+        else:
+            return evaluate_and_vectorize_sparse_matrix_at_dofs(A, dofs_list)
+
+    def assert_backend(self, A, dofs_list, result_backend):
+        result_builtin = self.evaluate_builtin(A, dofs_list)
+        relative_error = norm(result_builtin - result_backend) / norm(result_builtin)
+        assert isclose(relative_error, 0., atol=1e-12)
+
+
+@pytest.mark.parametrize("Th", [2**i for i in range(3, 7)])
+@pytest.mark.parametrize("M", [25 * j for j in range(1, 5)])
+@pytest.mark.parametrize("tensor", ["vector", "matrix"])
+@pytest.mark.parametrize("test_type", ["builtin", "backend"])
+def test_dolfin_evaluate_at_dofs(Th, M, tensor, test_type, benchmark):
+    data = Data(Th, M, tensor)
+    print("Th = " + str(Th) + ", Nh = " + str(data.V.dim()) + ", M = " + str(M) + ", tensor = " + tensor)
+    print("Testing", test_type)
+    if test_type == "builtin":
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
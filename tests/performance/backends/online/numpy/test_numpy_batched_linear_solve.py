@@ -0,0 +1,67 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from numpy.linalg import norm
+from rbnics.backends import LinearSolver, product, sum
+from rbnics.backends.online import OnlineAffineExpansionStorage, online_batched_linear_solve, OnlineFunction
+from test_numpy_utils import RandomNumpyMatrix, RandomNumpyVector, RandomTuple
+
+
+class Data(object):
+    def __init__(self, N, Qa, Qf, batch):
+        self.N = N
+        self.Qa = Qa
+        self.Qf = Qf
+        self.batch = batch
+
+    def generate_random(self):
+        a = OnlineAffineExpansionStorage(self.Qa)
+        for i in range(self.Qa):
+            a[i] = RandomNumpyMatrix(self.N, self.N)
+        f = OnlineAffineExpansionStorage(self.Qf)
+        for i in range(self.Qf):
+            f[i] = RandomNumpyVector(self.N)
+        theta_a = [RandomTuple(self.Qa) for _ in range(self.batch)]
+        theta_f = [RandomTuple(self.Qf) for _ in range(self.batch)]
+        return (theta_a, theta_f, a, f)
+
+    def evaluate_builtin(self, theta_a, theta_f, a, f):
+        solutions = list()
+        for (theta_a_b, theta_f_b) in zip(theta_a, theta_f):
+            solution = OnlineFunction(self.N)
+            solver = LinearSolver(sum(product(theta_a_b, a)), solution, sum(product(theta_f_b, f)))
+            solver.solve()
+            solutions.append(solution)
+        return solutions
+
+    def evaluate_batched(self, theta_a, theta_f, a, f):
+        return online_batched_linear_solve((theta_a, ), (a, ), (theta_f, ), (f, ))
+
+    def assert_batched(self, theta_a, theta_f, a, f, result_batched):
+        result_builtin = self.evaluate_builtin(theta_a, theta_f, a, f)
+        assert len(result_batched) == len(result_builtin) == self.batch
+        for (solution_batched, solution_builtin) in zip(result_batched, result_builtin):
+            assert solution_batched.N == solution_builtin.N
+            error = solution_batched.vector().content - solution_builtin.vector().content
+            assert isclose(norm(error) / norm(solution_builtin.vector().content), 0., atol=1e-8)
+
+
+@pytest.mark.parametrize("N", [2**(i + 3) for i in range(1, 3)])
+@pytest.mark.parametrize("Qa", [2 + 4 * j for j in range(1, 3)])
+@pytest.mark.parametrize("Qf", [2 + 4 * k for k in range(1, 3)])
+@pytest.mark.parametrize("batch", [1000])
+@pytest.mark.parametrize("test_type", ["builtin", "batched"])
+def test_numpy_batched_linear_solve(N, Qa, Qf, batch, test_type, benchmark):
+    data = Data(N, Qa, Qf, batch)
+    print("N = " + str(N) + ", Qa = " + str(Qa) + ", Qf = " + str(Qf) + ", batch = " + str(batch))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type)
+        benchmark(data.evaluate_batched, setup=data.generate_random, teardown=data.assert_batched)
@@ -0,0 +1,56 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from numpy.linalg import norm
+from rbnics.backends import product, sum
+from rbnics.backends.online import OnlineAffineExpansionStorage
+from test_numpy_utils import RandomNumpyMatrix, RandomTuple
+
+
+class Data(object):
+    def __init__(self, N, Q):
+        self.N = N
+        self.Q = Q
+
+    def generate_random(self):
+        A = OnlineAffineExpansionStorage(self.Q)
+        for i in range(self.Q):
+            # Generate random matrix
+            A[i] = RandomNumpyMatrix(self.N, self.N)
+        # Genereate random theta
+        theta = RandomTuple(self.Q)
+        # Resolve dispatch once and for all, as an upper bound of the achievable speed up
+        resolved_product = product._get_func(theta, A)
+        resolved_sum = sum._get_func(resolved_product(theta, A))
+        # Return
+        return (theta, A, resolved_product, resolved_sum)
+
+    def evaluate_builtin(self, theta, A, resolved_product, resolved_sum):
+        return resolved_sum(resolved_product(theta, A))
+
+    def evaluate_backend(self, theta, A, resolved_product, resolved_sum):
+        return sum(product(theta, A))
+
+    def assert_backend(self, theta, A, resolved_product, resolved_sum, result_backend):
+        result_builtin = self.evaluate_builtin(theta, A, resolved_product, resolved_sum)
+        relative_error = norm(result_builtin - result_backend) / norm(result_builtin)
+        assert isclose(relative_error, 0., atol=1e-12)
+
+
+@pytest.mark.parametrize("N", [2, 16])
+@pytest.mark.parametrize("Q", [10, 50, 250])
+@pytest.mark.parametrize("test_type", ["builtin", "factory"])
+def test_numpy_dispatch_overhead(N, Q, test_type, benchmark):
+    data = Data(N, Q)
+    print("N = " + str(N) + ", Q = " + str(Q))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type, "backend")
+        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
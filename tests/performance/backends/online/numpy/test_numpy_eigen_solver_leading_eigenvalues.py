@@ -0,0 +1,63 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import arange, diag, exp, isclose
+from rbnics.backends.online import OnlineEigenSolver
+from test_numpy_utils import RandomNumpyMatrix
+
+
+class Data(object):
+    def __init__(self, N, n_eigs):
+        self.N = N
+        self.n_eigs = n_eigs
+
+    def generate_random(self):
+        # Correlation matrix of snapshots with exponentially decaying energy, as in POD
+        S = RandomNumpyMatrix(2 * self.N, self.N)
+        S[:, :] = S.content @ diag(exp(- arange(self.N) / 10.))
+        C = RandomNumpyMatrix(self.N, self.N)
+        C[:, :] = S.content.T @ S.content
+        return (C, )
+
+    def evaluate(self, C, method, n_eigs):
+        eigensolver = OnlineEigenSolver(None, C)
+        eigensolver.set_parameters({
+            "problem_type": "hermitian",
+            "spectrum": "largest real",
+            "method": method
+        })
+        eigensolver.solve(n_eigs)
+        return [eigensolver.get_eigenvalue(i)[0] for i in range(self.n_eigs)]
+
+    def evaluate_full(self, C):
+        return self.evaluate(C, "dense", None)
+
+    def evaluate_partial(self, C):
+        return self.evaluate(C, "dense", self.n_eigs)
+
+    def evaluate_randomized(self, C):
+        return self.evaluate(C, "randomized", self.n_eigs)
+
+    def assert_leading_eigenvalues(self, C, result):
+        result_full = self.evaluate_full(C)
+        for (eig, eig_full) in zip(result, result_full):
+            assert isclose(eig, eig_full, rtol=1e-6, atol=1e-10 * result_full[0])
+
+
+@pytest.mark.parametrize("N", [2**(i + 6) for i in range(1, 6)])
+@pytest.mark.parametrize("n_eigs", [20])
+@pytest.mark.parametrize("test_type", ["full", "partial", "randomized"])
+def test_numpy_eigen_solver_leading_eigenvalues(N, n_eigs, test_type, benchmark):
+    data = Data(N, n_eigs)
+    print("N = " + str(N) + ", n_eigs = " + str(n_eigs))
+    print("Testing", test_type)
+    if test_type == "full":
+        benchmark(data.evaluate_full, setup=data.generate_random)
+    elif test_type == "partial":
+        benchmark(data.evaluate_partial, setup=data.generate_random, teardown=data.assert_leading_eigenvalues)
+    elif test_type == "randomized":
+        benchmark(data.evaluate_randomized, setup=data.generate_random, teardown=data.assert_leading_eigenvalues)
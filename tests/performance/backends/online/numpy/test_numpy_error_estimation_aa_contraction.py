@@ -0,0 +1,71 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from itertools import product as cartesian_product
+from numpy import isclose
+from numpy.linalg import norm
+from rbnics.backends import product as factory_product, sum as factory_sum
+from rbnics.backends.online import OnlineAffineExpansionStorage, online_product, online_sum
+from rbnics.backends.online.numpy import product as numpy_product, sum as numpy_sum
+from test_numpy_utils import RandomNumpyMatrix, RandomTuple
+
+product = None
+sum = None
+all_product = {"numpy": numpy_product, "online": online_product, "factory": factory_product}
+all_sum = {"numpy": numpy_sum, "online": online_sum, "factory": factory_sum}
+
+
+class Data(object):
+    def __init__(self, N, Q):
+        self.N = N
+        self.Q = Q
+
+    def generate_random(self):
+        aa_product = OnlineAffineExpansionStorage(self.Q, self.Q)
+        for i in range(self.Q):
+            for j in range(self.Q):
+                # Generate random matrix
+                aa_product[i, j] = RandomNumpyMatrix(self.N, self.N)
+        # Genereate random theta
+        theta = RandomTuple(self.Q)
+        # Contiguous storage is prepared once and then reused for every parameter in the greedy,
+        # so prepare it here in order not to time it
+        aa_product.content_as_array()
+        # Return
+        return (theta, aa_product)
+
+    def evaluate_loop(self, theta, aa_product):
+        for (i, j) in cartesian_product(range(self.Q), range(self.Q)):
+            if i == 0 and j == 0:
+                output = theta[0] * aa_product[0, 0] * theta[0]
+            else:
+                output += theta[i] * aa_product[i, j] * theta[j]
+        return output
+
+    def evaluate_backend(self, theta, aa_product):
+        return sum(product(theta, aa_product, theta))
+
+    def assert_backend(self, theta, aa_product, result_backend):
+        result_loop = self.evaluate_loop(theta, aa_product)
+        relative_error = norm(result_loop.content - result_backend.content) / norm(result_loop.content)
+        assert isclose(relative_error, 0., atol=1e-10)
+
+
+@pytest.mark.parametrize("N", [2**(i + 3) for i in range(1, 3)])
+@pytest.mark.parametrize("Q", [2 + 4 * j for j in range(1, 3)] + [30])
+@pytest.mark.parametrize("test_type", ["loop"] + list(all_product.keys()))
+def test_numpy_error_estimation_aa_contraction(N, Q, test_type, benchmark):
+    data = Data(N, Q)
+    print("N = " + str(N) + ", Q = " + str(Q))
+    if test_type == "loop":
+        print("Testing", test_type)
+        benchmark(data.evaluate_loop, setup=data.generate_random)
+    else:
+        print("Testing", test_type, "backend")
+        global product, sum
+        product, sum = all_product[test_type], all_sum[test_type]
+        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
@@ -0,0 +1,68 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose, tril
+from numpy.linalg import norm
+from rbnics.backends import LinearSolver
+from rbnics.backends.online import OnlineFunction
+from test_numpy_utils import RandomNumpyMatrix, RandomNumpyVector
+
+
+class Data(object):
+    def __init__(self, N, snapshots):
+        self.N = N
+        self.snapshots = snapshots
+
+    def generate_random(self):
+        # Lower triangular matrix with unit diagonal, as the EIM interpolation matrix. Entries below the diagonal
+        # are scaled so that the matrix is well conditioned
+        A = RandomNumpyMatrix(self.N, self.N)
+        A[:, :] = tril(A.content, -1) / self.N
+        for n in range(self.N):
+            A[n, n] = 1.
+        f = [RandomNumpyVector(self.N) for _ in range(self.snapshots)]
+        return (A, f)
+
+    def evaluate_builtin(self, A, f):
+        solutions = list()
+        for f_s in f:
+            solution = OnlineFunction(self.N)
+            solver = LinearSolver(A, solution, f_s)
+            solver.solve()
+            solutions.append(solution)
+        return solutions
+
+    def evaluate_lower_triangular(self, A, f):
+        solutions = list()
+        for f_s in f:
+            solution = OnlineFunction(self.N)
+            solver = LinearSolver(A, solution, f_s)
+            solver.set_parameters({"lower_triangular": True})
+            solver.solve()
+            solutions.append(solution)
+        return solutions
+
+    def assert_lower_triangular(self, A, f, result_lower_triangular):
+        result_builtin = self.evaluate_builtin(A, f)
+        for (solution_lower_triangular, solution_builtin) in zip(result_lower_triangular, result_builtin):
+            error = solution_lower_triangular.vector().content - solution_builtin.vector().content
+            assert isclose(norm(error) / norm(solution_builtin.vector().content), 0., atol=1e-8)
+
+
+@pytest.mark.parametrize("N", [2**(i + 3) for i in range(1, 6)])
+@pytest.mark.parametrize("snapshots", [1000])
+@pytest.mark.parametrize("test_type", ["builtin", "lower_triangular"])
+def test_numpy_linear_solver_lower_triangular(N, snapshots, test_type, benchmark):
+    data = Data(N, snapshots)
+    print("N = " + str(N) + ", snapshots = " + str(snapshots))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type)
+        benchmark(data.evaluate_lower_triangular, setup=data.generate_random,
+                  teardown=data.assert_lower_triangular)
@@ -0,0 +1,66 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import identity, isclose
+from numpy.linalg import norm
+from rbnics.backends import LinearSolver
+from rbnics.backends.online import OnlineFunction
+from test_numpy_utils import RandomNumpyMatrix, RandomNumpyVector
+
+
+class Data(object):
+    def __init__(self, N, snapshots):
+        self.N = N
+        self.snapshots = snapshots
+
+    def generate_random(self):
+        # Symmetric positive definite matrix, as in the projection on the reduced basis
+        B = RandomNumpyMatrix(self.N, self.N)
+        X = RandomNumpyMatrix(self.N, self.N)
+        X[:, :] = B.content.T @ B.content + self.N * identity(self.N)
+        f = [RandomNumpyVector(self.N) for _ in range(self.snapshots)]
+        return (X, f)
+
+    def evaluate_builtin(self, X, f):
+        solutions = list()
+        for f_s in f:
+            solution = OnlineFunction(self.N)
+            solver = LinearSolver(X, solution, f_s)
+            solver.solve()
+            solutions.append(solution)
+        return solutions
+
+    def evaluate_reuse_factorization(self, X, f):
+        solutions = list()
+        for f_s in f:
+            solution = OnlineFunction(self.N)
+            solver = LinearSolver(X, solution, f_s)
+            solver.set_parameters({"reuse_factorization": True})
+            solver.solve()
+            solutions.append(solution)
+        return solutions
+
+    def assert_reuse_factorization(self, X, f, result_reuse_factorization):
+        result_builtin = self.evaluate_builtin(X, f)
+        for (solution_reuse_factorization, solution_builtin) in zip(result_reuse_factorization, result_builtin):
+            error = solution_reuse_factorization.vector().content - solution_builtin.vector().content
+            assert isclose(norm(error) / norm(solution_builtin.vector().content), 0., atol=1e-8)
+
+
+@pytest.mark.parametrize("N", [2**(i + 3) for i in range(1, 6)])
+@pytest.mark.parametrize("snapshots", [1000])
+@pytest.mark.parametrize("test_type", ["builtin", "reuse_factorization"])
+def test_numpy_linear_solver_reuse_factorization(N, snapshots, test_type, benchmark):
+    data = Data(N, snapshots)
+    print("N = " + str(N) + ", snapshots = " + str(snapshots))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type)
+        benchmark(data.evaluate_reuse_factorization, setup=data.generate_random,
+                  teardown=data.assert_reuse_factorization)
@@ -0,0 +1,75 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from numpy.linalg import norm
+from rbnics.backends import product as factory_product, sum as factory_sum
+from rbnics.backends.online import OnlineAffineExpansionStorage, online_product, online_sum
+from rbnics.backends.online.numpy import product as numpy_product, sum as numpy_sum
+from rbnics.utils.config import config
+from test_numpy_utils import RandomNumpyMatrix, RandomTuple
+
+product = None
+sum = None
+all_product = {"numpy": numpy_product, "online": online_product, "factory": factory_product}
+all_sum = {"numpy": numpy_sum, "online": online_sum, "factory": factory_sum}
+
+
+class Data(object):
+    def __init__(self, Nmax, Q):
+        self.Nmax = Nmax
+        self.Q = Q
+
+    def generate_random(self):
+        A = OnlineAffineExpansionStorage(self.Q)
+        for i in range(self.Q):
+            # Generate random matrix
+            A[i] = RandomNumpyMatrix(self.Nmax, self.Nmax)
+        # Genereate random theta
+        theta = RandomTuple(self.Q)
+        # Slices are precomputed once and then reused for every parameter in the greedy,
+        # so prepare them here in order not to time them
+        slice_ = slice(0, self.Nmax // 2)
+        A[slice_, slice_].content_as_array()
+        # Return
+        return (theta, A, slice_)
+
+    def evaluate_builtin(self, theta, A, slice_):
+        result_builtin = theta[0] * A[0][slice_, slice_]
+        for i in range(1, self.Q):
+            result_builtin += theta[i] * A[i][slice_, slice_]
+        return result_builtin
+
+    def evaluate_backend(self, theta, A, slice_):
+        return sum(product(theta, A[slice_, slice_]))
+
+    def assert_backend(self, theta, A, slice_, result_backend):
+        result_builtin = self.evaluate_builtin(theta, A, slice_)
+        relative_error = norm(result_builtin - result_backend) / norm(result_builtin)
+        assert isclose(relative_error, 0., atol=1e-12)
+
+
+@pytest.mark.parametrize("N", [2**i for i in range(2, 7)])
+@pytest.mark.parametrize("Q", [10 + 10 * j for j in range(0, 3)])
+@pytest.mark.parametrize("storage", ["objects", "contiguous"])
+@pytest.mark.parametrize("test_type", ["builtin"] + list(all_product.keys()))
+def test_numpy_matrix_assembly_contiguous_storage(N, Q, storage, test_type, benchmark):
+    data = Data(N, Q)
+    print("N = " + str(N) + ", Q = " + str(Q) + ", storage = " + storage)
+    default_storage = config.get("backends", "online affine expansion storage")
+    config.set("backends", "online affine expansion storage", storage)
+    try:
+        if test_type == "builtin":
+            print("Testing", test_type)
+            benchmark(data.evaluate_builtin, setup=data.generate_random)
+        else:
+            print("Testing", test_type, "backend")
+            global product, sum
+            product, sum = all_product[test_type], all_sum[test_type]
+            benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
+    finally:
+        config.set("backends", "online affine expansion storage", default_storage)
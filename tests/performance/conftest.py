@@ -9,7 +9,7 @@ try:
     import dolfin  # otherwise the next import from rbnics would disable dolfin as a required backend  # noqa: F401
 except ImportError:
     pass
-from rbnics.utils.test import add_performance_options, patch_benchmark_plugin
+from rbnics.utils.test import add_performance_options, patch_benchmark_plugin, tempdir  # noqa: F401
 
 
 def pytest_addoption(parser):
@@ -0,0 +1,59 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import operator
+import pytest
+from math import sqrt
+from rbnics.sampling import ParameterSpaceSubset
+
+
+class Data(object):
+    def __init__(self, M, P, Ntrain, Nquery):
+        self.M = M
+        self.P = P
+        self.Ntrain = Ntrain
+        self.Nquery = Nquery
+
+    def generate_random(self):
+        training_set = ParameterSpaceSubset()
+        training_set.generate([(0.1, 10.)] * self.P, self.Ntrain)
+        query_set = ParameterSpaceSubset()
+        query_set.generate([(0.1, 10.)] * self.P, self.Nquery)
+        return (training_set, query_set)
+
+    def evaluate_builtin(self, training_set, query_set):
+        # Compute the distance to every parameter in the training set, and sort them
+        result = list()
+        for mu in query_set:
+            parameters_and_distances = list()
+            for xi_i in training_set:
+                distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
+                parameters_and_distances.append((xi_i, distance))
+            parameters_and_distances.sort(key=operator.itemgetter(1))
+            result.append([xi_i for (xi_i, _) in parameters_and_distances[:self.M]])
+        return result
+
+    def evaluate_kd_tree(self, training_set, query_set):
+        return [list(training_set.closest(self.M, mu)) for mu in query_set]
+
+    def assert_kd_tree(self, training_set, query_set, result_kd_tree):
+        result_builtin = self.evaluate_builtin(training_set, query_set)
+        assert result_kd_tree == result_builtin
+
+
+@pytest.mark.parametrize("M", [1, 10])
+@pytest.mark.parametrize("P", [2, 4])
+@pytest.mark.parametrize("Ntrain", [10000])
+@pytest.mark.parametrize("Nquery", [100])
+@pytest.mark.parametrize("test_type", ["builtin", "kd_tree"])
+def test_parameter_space_subset_closest(M, P, Ntrain, Nquery, test_type, benchmark):
+    data = Data(M, P, Ntrain, Nquery)
+    print("M = " + str(M) + ", P = " + str(P) + ", Ntrain = " + str(Ntrain) + ", Nquery = " + str(Nquery))
+    print("Testing", test_type)
+    if test_type == "builtin":
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        benchmark(data.evaluate_kd_tree, setup=data.generate_random, teardown=data.assert_kd_tree)
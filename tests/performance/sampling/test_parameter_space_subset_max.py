@@ -0,0 +1,70 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from functools import partial
+import pytest
+from numpy import argmax, identity, isclose
+from numpy.linalg import norm, solve
+from numpy.random import random
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.utils.config import config
+
+
+# Generator and initializer are defined at module level, so that they can be pickled to spawned workers
+def initializer(A, F):
+    global affine_expansion
+    affine_expansion = (A, F)
+
+
+# Mimic an online solve followed by the evaluation of a residual based error estimator
+def solve_and_estimate_error(mu):
+    (A, F) = affine_expansion
+    A_mu = sum([mu_q * A_q for (mu_q, A_q) in zip(mu, A)])
+    F_mu = sum([mu_q * F_q for (mu_q, F_q) in zip(mu, F)])
+    return norm(F_mu - A_mu.dot(solve(A_mu, F_mu) + 1.e-3))
+
+
+affine_expansion = None
+
+
+class Data(object):
+    def __init__(self, N, Q, Ntrain):
+        self.N = N
+        self.Q = Q
+        self.Ntrain = Ntrain
+
+    def generate_random(self):
+        # Random affine expansion of a reduced (well conditioned) operator and of a reduced rhs
+        A = random((self.Q, self.N, self.N)) + self.N * random((self.Q, 1, 1)) * identity(self.N)
+        F = random((self.Q, self.N))
+        # Random training set
+        training_set = ParameterSpaceSubset()
+        training_set.generate([(0.1, 10.)] * self.Q, self.Ntrain)
+        return (training_set, partial(initializer, A, F))
+
+    def evaluate(self, training_set, initializer):
+        return training_set.max(solve_and_estimate_error, initializer=initializer)
+
+    def assert_max(self, training_set, initializer, result):
+        initializer()
+        values = [solve_and_estimate_error(mu) for mu in training_set]
+        assert result[1] == argmax(values)
+        assert isclose(result[0], values[result[1]])
+
+
+@pytest.mark.parametrize("N", [10, 50])
+@pytest.mark.parametrize("Q", [4])
+@pytest.mark.parametrize("Ntrain", [10000])
+@pytest.mark.parametrize("max_processes", ["1", "auto"])
+def test_parameter_space_subset_max(N, Q, Ntrain, max_processes, benchmark):
+    data = Data(N, Q, Ntrain)
+    print("N = " + str(N) + ", Q = " + str(Q) + ", Ntrain = " + str(Ntrain) + ", max processes = " + max_processes)
+    original_max_processes = config.get("sampling", "max processes")
+    config.set("sampling", "max processes", max_processes)
+    try:
+        benchmark(data.evaluate, setup=data.generate_random, teardown=data.assert_max)
+    finally:
+        config.set("sampling", "max processes", original_max_processes)
@@ -0,0 +1,61 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import subprocess
+import sys
+import pytest
+
+
+class Data(object):
+    def __init__(self, tempdir, lazy_import):
+        self.tempdir = tempdir
+        self.lazy_import = lazy_import
+
+    def generate_configuration(self):
+        # The configuration file is read from the current working directory when running python -c
+        with open(os.path.join(self.tempdir, ".rbnicsrc"), "w") as config_file:
+            config_file.write("[backends]\n")
+            config_file.write("lazy import = " + str(self.lazy_import) + "\n")
+            config_file.write("required backends = dolfin,\n")
+        return ()
+
+    def evaluate_import(self):
+        return self._run("import rbnics")
+
+    def assert_import(self, result):
+        assert result.returncode == 0
+        # Problems requiring symbolic computations should only be imported when eagerly importing RBniCS
+        result = self._run("import sys; import rbnics; sys.exit('sympy' in sys.modules)")
+        assert result.returncode == (0 if self.lazy_import else 1)
+        # Required backends should only be imported on first dispatch when lazily importing RBniCS
+        result = self._run("import sys; import rbnics; sys.exit(any(module in sys.modules for module in "
+                           + "('dolfin', 'ufl', 'rbnics.backends.dolfin')))")
+        assert result.returncode == (0 if self.lazy_import else 1)
+        result = self._run("import sys; from dolfin import Function, FunctionSpace, UnitIntervalMesh; "
+                           + "from rbnics.backends import transpose; "
+                           + "transpose(Function(FunctionSpace(UnitIntervalMesh(2), 'Lagrange', 1)).vector()); "
+                           + "sys.exit('rbnics.backends.dolfin' not in sys.modules)")
+        assert result.returncode == 0
+        # Names should always be available, possibly after importing the corresponding module (or backend) on first
+        # access
+        result = self._run("import rbnics; rbnics.ShapeParametrization; rbnics.ParametrizedExpression; "
+                           + "from rbnics.backends import product")
+        assert result.returncode == 0
+        # Accessing a name which does not belong to RBniCS should not load deferred backends
+        result = self._run("import sys; import rbnics; hasattr(rbnics, 'not_an_rbnics_name'); "
+                           + "sys.exit('rbnics.backends.dolfin' in sys.modules)")
+        assert result.returncode == (0 if self.lazy_import else 1)
+
+    def _run(self, command):
+        return subprocess.run([sys.executable, "-c", command], cwd=self.tempdir)
+
+
+@pytest.mark.parametrize("lazy_import", [False, True])
+def test_import(tempdir, lazy_import, benchmark):
+    data = Data(tempdir, lazy_import)
+    print("lazy import = " + str(lazy_import))
+    benchmark(data.evaluate_import, setup=data.generate_configuration, teardown=data.assert_import)
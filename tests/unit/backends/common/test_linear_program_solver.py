@@ -37,3 +37,29 @@ def test_linear_program_solver():
     solver = LinearProgramSolver(c, A, b, bounds)
     optimal_cost = solver.solve()
     assert isclose(optimal_cost, 0.625)
+
+
+def test_linear_program_solver_update():
+    c = Vector(2)
+    A = Matrix(2, 2)
+    b = Vector(2)
+    bounds = [(0., 1.), (0., 1.)]
+
+    c[0], c[1] = 0.5, 1.
+    A[0, 0], A[0, 1] = 1., 1.
+    A[1, 0], A[1, 1] = -1., 1.
+    b[0], b[1] = 1., -0.5
+
+    solver = LinearProgramSolver(c, A, b, bounds)
+    assert isclose(solver.solve(), 0.625)
+
+    # Swapping the cost coefficients moves the optimal solution to x = 0, y = 1
+    c[0], c[1] = 1., 0.5
+    solver.set_cost(c)
+    assert isclose(solver.solve(), 0.5)
+
+    # Requiring x >= 0.5 as well moves the optimal solution to x = 0.5, y = 0.5
+    A[1, 0], A[1, 1] = 1., 0.
+    b[1] = 0.5
+    solver.set_inequality_constraints(A, b)
+    assert isclose(solver.solve(), 0.75)
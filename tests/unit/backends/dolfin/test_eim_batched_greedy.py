@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import allclose
+from dolfin import dx, FunctionSpace, IntervalMesh, TestFunction, TrialFunction
+from rbnics import EquispacedDistribution, ParametrizedExpression
+from rbnics.backends import ParametrizedExpressionFactory, ParametrizedTensorFactory, to_local_array
+from rbnics.eim.problems.eim_approximation import EIMApproximation
+from rbnics.eim.reduction_methods.eim_approximation_reduction_method import EIMApproximationReductionMethod
+from rbnics.problems.base import ParametrizedProblem
+from rbnics.utils.config import config
+
+
+def _offline(V, expression_type, folder_prefix):
+
+    class MockProblem(ParametrizedProblem):
+        def __init__(self, V, **kwargs):
+            ParametrizedProblem.__init__(self, "")
+            self.V = V
+
+        def name(self):
+            return "MockProblem_BatchedGreedy_" + expression_type
+
+    mock_problem = MockProblem(V)
+    f = ParametrizedExpression(
+        mock_problem, "(1-x[0])*cos(3*pi*mu[0]*(1+x[0]))*exp(-mu[0]*(1+x[0]))", mu=(1., ),
+        element=V.ufl_element())
+    if expression_type == "Function":
+        parametrized_expression = ParametrizedExpressionFactory(f)
+    elif expression_type == "Vector":
+        v = TestFunction(V)
+        parametrized_expression = ParametrizedTensorFactory(f * v * dx)
+    elif expression_type == "Matrix":
+        u = TrialFunction(V)
+        v = TestFunction(V)
+        parametrized_expression = ParametrizedTensorFactory(f * u * v * dx)
+    else:
+        raise AssertionError("Invalid expression_type")
+    EIM_approximation = EIMApproximation(mock_problem, parametrized_expression, folder_prefix, "Greedy")
+    EIM_approximation.set_mu_range([(1., 3.), ])
+    reduction_method = EIMApproximationReductionMethod(EIM_approximation)
+    reduction_method.set_Nmax(10)
+    reduction_method.initialize_training_set(21, sampling=EquispacedDistribution())
+    return reduction_method.offline()
+
+
+# Test that the batched greedy selects the same interpolation locations and basis functions as the greedy
+# which solves the interpolation problem for one parameter at a time
+@pytest.mark.parametrize("expression_type", ["Function", "Vector", "Matrix"])
+def test_eim_batched_greedy(expression_type, tempdir):
+    mesh = IntervalMesh(100, -1., 1.)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    batched = _offline(V, expression_type, os.path.join(tempdir, expression_type, "Batched"))
+    greedy_memory_limit = config.get("EIM", "greedy memory limit")
+    config.set("EIM", "greedy memory limit", "1B")  # residuals never fit, forcing the greedy one parameter at a time
+    try:
+        unbatched = _offline(V, expression_type, os.path.join(tempdir, expression_type, "Unbatched"))
+    finally:
+        config.set("EIM", "greedy memory limit", greedy_memory_limit)
+    assert batched.N == unbatched.N == 10
+    assert batched.interpolation_locations.get_dofs_list() == unbatched.interpolation_locations.get_dofs_list()
+    for n in range(batched.N):
+        assert allclose(to_local_array(batched.basis_functions[n]), to_local_array(unbatched.basis_functions[n]))
+    assert allclose(batched.interpolation_matrix[0].content, unbatched.interpolation_matrix[0].content)
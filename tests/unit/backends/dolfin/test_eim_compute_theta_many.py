@@ -0,0 +1,82 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import allclose, asarray
+from dolfin import Constant, DirichletBC, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import DEIM, EIM, EllipticCoerciveProblem, ParametrizedExpression, ReducedBasis
+
+
+def _Problem(Decorator, name):
+
+    @Decorator()
+    class Problem(EllipticCoerciveProblem):
+        def __init__(self, V, **kwargs):
+            EllipticCoerciveProblem.__init__(self, V, **kwargs)
+            self.u = TrialFunction(V)
+            self.v = TestFunction(V)
+            self.g = ParametrizedExpression(
+                self, "exp(- 2*pow(x[0]-mu[0], 2) - 2*pow(x[1]-mu[1], 2))", mu=(0., 0.), element=V.ufl_element())
+
+        def name(self):
+            return name
+
+        def get_stability_factor_lower_bound(self):
+            return 1.
+
+        def compute_theta(self, term):
+            mu = self.mu
+            if term == "a":
+                return (1., 1. + mu[0]**2)
+            elif term == "f":
+                return (2. + mu[1], )
+            else:
+                raise ValueError("Invalid term for compute_theta().")
+
+        def assemble_operator(self, term):
+            (u, v, g) = (self.u, self.v, self.g)
+            if term == "a":
+                return (inner(grad(u), grad(v)) * dx, g * u * v * dx)
+            elif term == "f":
+                return (g * v * dx, )
+            elif term == "dirichlet_bc":
+                return ([DirichletBC(self.V, Constant(0.), "on_boundary")], )
+            elif term == "inner_product":
+                return (inner(grad(u), grad(v)) * dx, )
+            else:
+                raise ValueError("Invalid term for assemble_operator().")
+
+    return Problem
+
+
+# Test that batched evaluation of thetas of EIM/DEIM decorated problems, which solves the interpolation system
+# once for all parameters, agrees with their evaluation one parameter at a time
+@pytest.mark.parametrize("decorator_name, Decorator", [("EIM", EIM), ("DEIM", DEIM)])
+def test_eim_compute_theta_many(decorator_name, Decorator, tempdir):
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = _Problem(Decorator, os.path.join(tempdir, "ComputeThetaMany" + decorator_name))(V)
+    problem.set_mu_range([(-1.0, 1.0), (-1.0, 1.0)])
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(3, **{decorator_name: 6})
+    reduction_method.initialize_training_set(10, **{decorator_name: 20})
+    reduced_problem = reduction_method.offline()
+    mus = [(-0.7, -0.5), (0.3, 0.2), (0.9, 0.9)]
+    mu = (0., 0.)
+    reduced_problem.set_mu(mu)
+    for term in ("a", "f"):
+        thetas = reduced_problem.compute_theta_many(term, mus)
+        assert reduced_problem.mu == mu
+        for (mu_i, thetas_i) in zip(mus, thetas):
+            reduced_problem.set_mu(mu_i)
+            assert allclose(thetas_i, asarray(reduced_problem.compute_theta(term), dtype=float))
+        reduced_problem.set_mu(mu)
+    # Batched solves should also honor a smaller number of interpolation basis functions
+    solutions = reduced_problem.solve_many(mus, **{decorator_name: 3})
+    for (mu_i, solution_i) in zip(mus, solutions):
+        reduced_problem.set_mu(mu_i)
+        assert allclose(solution_i.vector().content, reduced_problem.solve(**{decorator_name: 3}).vector().content)
@@ -178,3 +178,32 @@ def test_linear_solver():
         error_dense = _test_linear_solver_dense(V, a, f, X, exact_solution)
         assert isclose(error_dense, error_sparse_tensor_callbacks)
         assert isclose(error_dense, error_sparse_form_callbacks)
+
+
+# ~~~ Many rhs sharing the same lhs ~~~ #
+def test_linear_solver_many_rhs():
+    from dolfin import Constant, Function
+    from rbnics.backends.dolfin import LinearSolver
+
+    mesh = IntervalMesh(132, 0, 2 * pi)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    A = assemble(inner(grad(u), grad(v)) * dx + u * v * dx)
+    bc = [DirichletBC(V, Constant(0.), "on_boundary")]
+    F = [assemble(Expression("sin(k * x[0])", k=k, element=V.ufl_element()) * v * dx) for k in range(1, 5)]
+
+    F_copy = [F_k.copy() for F_k in F]
+
+    # Solve for all rhs at once
+    solutions = [Function(V) for _ in F]
+    solver = LinearSolver(A, solutions, F, bc)
+    solver.solve()
+
+    # Compare to solving for one rhs at a time, and make sure that the original lhs and rhs were not changed
+    for (F_k, F_k_copy, solution_k) in zip(F, F_copy, solutions):
+        assert isclose((F_k_copy - F_k).norm("l2"), 0.)
+        solution = Function(V)
+        solver = LinearSolver(A, solution, F_k, bc)
+        solver.solve()
+        assert isclose((solution.vector() - solution_k.vector()).norm("l2"), 0., atol=1.e-12)
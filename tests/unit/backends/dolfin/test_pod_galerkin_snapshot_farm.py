@@ -0,0 +1,98 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import subprocess
+import sys
+
+# The snapshot farm spawns processes which import the main module: run the test as a standalone script, written as
+# an RBniCS user would write it
+script = """
+import sys
+from numpy import allclose
+from numpy.random import seed
+from dolfin import Constant, DirichletBC, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import EllipticCoerciveProblem, PODGalerkin
+from rbnics.backends import to_local_array
+from rbnics.utils.config import config
+
+
+class Problem(EllipticCoerciveProblem):
+    def __init__(self, V, **kwargs):
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            return (mu[0], 1.)
+        elif term == "f":
+            return (1., mu[1])
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    def assemble_operator(self, term):
+        (u, v) = (self.u, self.v)
+        if term == "a":
+            return (inner(grad(u), grad(v)) * dx, u * v * dx)
+        elif term == "f":
+            return (v * dx, v.dx(0) * dx)
+        elif term == "dirichlet_bc":
+            return ([DirichletBC(self.V, Constant(0.), "on_boundary")], )
+        elif term == "inner_product":
+            return (inner(grad(u), grad(v)) * dx, )
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+def generate_truth_problem():
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = Problem(V)
+    problem.set_mu_range([(0.5, 2.0), (-1.0, 1.0)])
+    return problem
+
+
+def offline(name, snapshot_processes):
+    config.set("sampling", "snapshot processes", str(snapshot_processes))
+    problem = generate_truth_problem()
+    problem.name = lambda: name
+    reduction_method = PODGalerkin(problem)
+    reduction_method.set_Nmax(4)
+    reduction_method.set_snapshot_farm(generate_truth_problem)
+    seed(0)  # both runs should use the same training set
+    reduction_method.initialize_training_set(6)
+    reduced_problem = reduction_method.offline()
+    snapshots = [to_local_array(snapshot) for snapshot in reduction_method.POD.snapshots_matrix]
+    return (reduction_method, reduced_problem, snapshots)
+
+
+if __name__ == "__main__":
+    (serial_reduction_method, serial_reduced_problem, serial_snapshots) = offline("Serial", 1)
+    (farmed_reduction_method, farmed_reduced_problem, farmed_snapshots) = offline("Farmed", 3)
+    # Both runs should obtain the same snapshots
+    assert list(serial_reduction_method.training_set) == list(farmed_reduction_method.training_set)
+    assert len(serial_snapshots) == len(farmed_snapshots) == 6
+    for (serial_snapshot, farmed_snapshot) in zip(serial_snapshots, farmed_snapshots):
+        assert allclose(serial_snapshot, farmed_snapshot)
+    # Farmed truth solutions should also be available in the cache of the truth problem
+    mu = farmed_reduction_method.training_set[-1]
+    farmed_reduction_method.truth_problem.set_mu(mu)
+    assert allclose(to_local_array(farmed_reduction_method.truth_problem.solve()), farmed_snapshots[-1])
+    # Reduced problems should therefore coincide
+    serial_reduced_problem.set_mu((1.3, 0.2))
+    farmed_reduced_problem.set_mu((1.3, 0.2))
+    assert allclose(serial_reduced_problem.solve().vector().content, farmed_reduced_problem.solve().vector().content)
+    sys.exit(0)
+"""
+
+
+def test_pod_galerkin_snapshot_farm(tempdir):
+    with open(os.path.join(tempdir, "snapshot_farm.py"), "w") as script_file:
+        script_file.write(script)
+    result = subprocess.run([sys.executable, "snapshot_farm.py"], cwd=tempdir)
+    assert result.returncode == 0
@@ -0,0 +1,55 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from dolfin import (assemble, dx, Expression, FunctionSpace, grad, inner, interpolate, TestFunction, TrialFunction,
+                    UnitSquareMesh)
+from rbnics.backends import ProperOrthogonalDecomposition, transpose
+from rbnics.utils.config import config
+
+
+@pytest.fixture
+def incremental_config():
+    backup = config.get("POD", "incremental")
+    config.set("POD", "incremental", True)
+    yield
+    config.set("POD", "incremental", backup)
+
+
+# Test incremental POD: snapshots are stored in batches (as for time trajectories), and the resulting modes
+# are compared to the ones computed by a standard POD
+def test_proper_orthogonal_decomposition_incremental(incremental_config):
+    mesh = UnitSquareMesh(16, 16)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    X = assemble(inner(grad(u), grad(v)) * dx + u * v * dx)
+
+    snapshots = [
+        [interpolate(Expression("sin(mu * x[0]) * cos(t * x[1])", mu=1. + mu, t=1. + 0.1 * t, degree=2), V)
+         for t in range(10)]
+        for mu in range(8)]
+
+    incremental_POD = ProperOrthogonalDecomposition(V, X)
+    assert incremental_POD.incremental
+    config.set("POD", "incremental", False)
+    POD = ProperOrthogonalDecomposition(V, X)
+    assert not POD.incremental
+    for snapshots_mu in snapshots:
+        incremental_POD.store_snapshot(snapshots_mu)
+        POD.store_snapshot(snapshots_mu)
+    # The incremental POD only stores as many functions as the numerical rank of the snapshots
+    assert len(incremental_POD.snapshots_matrix) < len(POD.snapshots_matrix)
+
+    Nmax = 5
+    (incremental_eigenvalues, _, incremental_basis_functions, incremental_N) = incremental_POD.apply(Nmax, 0.)
+    (eigenvalues, _, basis_functions, N) = POD.apply(Nmax, 0.)
+    assert incremental_N == N
+    for n in range(N):
+        assert isclose(incremental_eigenvalues[n], eigenvalues[n], rtol=1e-8)
+        # Modes are the same, up to their sign
+        assert isclose(abs(transpose(incremental_basis_functions[n]) * X * basis_functions[n]), 1.)
@@ -0,0 +1,98 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import subprocess
+import sys
+
+# The greedy farm spawns processes which import the main module: run the test as a standalone script, written as
+# an RBniCS user would write it
+script = """
+import sys
+from functools import partial
+from numpy import allclose
+from numpy.random import seed
+from dolfin import Constant, DirichletBC, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import EllipticCoerciveProblem, ReducedBasis
+from rbnics.utils.config import config
+
+
+class Problem(EllipticCoerciveProblem):
+    def __init__(self, V, **kwargs):
+        self._name = kwargs["name"]
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+
+    def name(self):
+        return self._name
+
+    def get_stability_factor_lower_bound(self):
+        return min(self.compute_theta("a"))
+
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            return (mu[0], 1.)
+        elif term == "f":
+            return (1., mu[1])
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    def assemble_operator(self, term):
+        (u, v) = (self.u, self.v)
+        if term == "a":
+            return (inner(grad(u), grad(v)) * dx, u * v * dx)
+        elif term == "f":
+            return (v * dx, v.dx(0) * dx)
+        elif term == "dirichlet_bc":
+            return ([DirichletBC(self.V, Constant(0.), "on_boundary")], )
+        elif term == "inner_product":
+            return (inner(grad(u), grad(v)) * dx, )
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+def generate_reduction_method(name):
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = Problem(V, name=name)
+    problem.set_mu_range([(0.5, 2.0), (-1.0, 1.0)])
+    return ReducedBasis(problem)
+
+
+def offline(name, max_processes):
+    config.set("sampling", "max processes", str(max_processes))
+    reduction_method = generate_reduction_method(name)
+    reduction_method.set_Nmax(4)
+    reduction_method.set_greedy_farm(partial(generate_reduction_method, name))
+    seed(0)  # both runs should use the same training set
+    reduction_method.initialize_training_set(20)
+    reduced_problem = reduction_method.offline()
+    return (reduction_method, reduced_problem)
+
+
+if __name__ == "__main__":
+    (serial_reduction_method, serial_reduced_problem) = offline("Serial", 1)
+    (farmed_reduction_method, farmed_reduced_problem) = offline("Farmed", 3)
+    # Both runs should select the same parameters, with the same error estimators
+    assert list(serial_reduction_method.greedy_selected_parameters) == list(
+        farmed_reduction_method.greedy_selected_parameters)
+    assert allclose(list(serial_reduction_method.greedy_error_estimators),
+                    list(farmed_reduction_method.greedy_error_estimators))
+    # Reduced problems should therefore coincide
+    serial_reduced_problem.set_mu((1.3, 0.2))
+    farmed_reduced_problem.set_mu((1.3, 0.2))
+    assert allclose(serial_reduced_problem.solve().vector().content, farmed_reduced_problem.solve().vector().content)
+    sys.exit(0)
+"""
+
+
+def test_rb_greedy_farm(tempdir):
+    with open(os.path.join(tempdir, "greedy_farm.py"), "w") as script_file:
+        script_file.write(script)
+    result = subprocess.run([sys.executable, "greedy_farm.py"], cwd=tempdir)
+    assert result.returncode == 0
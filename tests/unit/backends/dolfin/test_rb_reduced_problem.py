@@ -0,0 +1,108 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import importlib
+import os
+from numpy import allclose, isclose
+from dolfin import dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import EllipticCoerciveProblem, ReducedBasis
+from rbnics.backends import transpose
+
+
+# Test that the incremental (bordered) update of error estimation operators during the greedy returns
+# the same operators as their assembly from scratch, and that it is actually carried out
+def test_rb_reduced_problem_error_estimation_operators_bordered_update(tempdir, monkeypatch):
+    rb_reduced_problem_module = importlib.import_module("rbnics.problems.base.rb_reduced_problem")
+
+    # Record whether operators were previously assembled and could then be bordered
+    is_bordered_by_calls = list()
+    is_bordered_by = rb_reduced_problem_module._is_bordered_by
+
+    def recording_is_bordered_by(previous_N, N):
+        output = is_bordered_by(previous_N, N)
+        is_bordered_by_calls.append((previous_N, output))
+        return output
+
+    monkeypatch.setattr(rb_reduced_problem_module, "_is_bordered_by", recording_is_bordered_by)
+
+    # Record the number of Riesz representors computed by the solver
+    riesz_solves = list()
+    LinearSolver = rb_reduced_problem_module.LinearSolver
+
+    def recording_linear_solver(lhs, solution, rhs, bcs=None):
+        riesz_solves.append(len(rhs) if isinstance(rhs, list) else 1)
+        return LinearSolver(lhs, solution, rhs, bcs)
+
+    monkeypatch.setattr(rb_reduced_problem_module, "LinearSolver", recording_linear_solver)
+
+    class Problem(EllipticCoerciveProblem):
+        def __init__(self, V, **kwargs):
+            EllipticCoerciveProblem.__init__(self, V, **kwargs)
+            self.u = TrialFunction(V)
+            self.v = TestFunction(V)
+
+        def name(self):
+            return os.path.join(tempdir, "ErrorEstimationOperatorsBorderedUpdate")
+
+        def get_stability_factor_lower_bound(self):
+            return min(self.compute_theta("a"))
+
+        def compute_theta(self, term):
+            mu = self.mu
+            if term == "a":
+                return (mu[0], 1.)
+            elif term == "f":
+                return (1., mu[1])
+            else:
+                raise ValueError("Invalid term for compute_theta().")
+
+        def assemble_operator(self, term):
+            (u, v) = (self.u, self.v)
+            if term == "a":
+                return (inner(grad(u), grad(v)) * dx, u * v * dx)
+            elif term == "f":
+                return (v * dx, v.dx(0) * dx)
+            elif term == "inner_product":
+                return (inner(grad(u), grad(v)) * dx + u * v * dx, )
+            else:
+                raise ValueError("Invalid term for assemble_operator().")
+
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = Problem(V)
+    problem.set_mu_range([(0.5, 2.0), (-1.0, 1.0)])
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(4)
+    reduction_method.initialize_training_set(10)
+    reduced_problem = reduction_method.offline()
+    assert reduced_problem.N == 4
+    # The factorization shared by Riesz solves should be released at the end of the offline stage
+    assert reduced_problem._riesz_solve_factorization is None
+    # Riesz representors of f should have been computed once, while Riesz representors of a should have been
+    # computed only for the new basis function at each enrichment, rather than for the whole basis
+    assert sum(riesz_solves) == reduced_problem.Q["f"] + reduced_problem.Q["a"] * reduced_problem.N
+    # Every operator which was previously assembled should have been bordered, rather than assembled from scratch
+    previously_assembled = [output for (previous_N, output) in is_bordered_by_calls
+                            if isinstance(previous_N, dict) and sum(previous_N.values()) > 0]
+    assert len(previously_assembled) > 0
+    assert all(previously_assembled)
+
+    X = reduced_problem._error_estimation_inner_product
+    for (term0, term1) in reduced_problem.error_estimation_terms:
+        for q0 in range(reduced_problem.Q[term0]):
+            for q1 in range(reduced_problem.Q[term1]):
+                riesz0 = reduced_problem.riesz[term0][q0]
+                riesz1 = reduced_problem.riesz[term1][q1]
+                if reduced_problem.terms_order[term0] == 1:
+                    riesz0 = riesz0[0]
+                if reduced_problem.terms_order[term1] == 1:
+                    riesz1 = riesz1[0]
+                from_scratch = transpose(riesz0) * X * riesz1
+                bordered = reduced_problem.error_estimation_operator[term0, term1][q0, q1]
+                if isinstance(from_scratch, float):
+                    assert isclose(bordered, from_scratch)
+                else:
+                    assert allclose(bordered.content, from_scratch.content)
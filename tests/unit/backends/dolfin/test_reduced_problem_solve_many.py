@@ -0,0 +1,108 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from numpy import allclose, isclose
+from dolfin import Constant, DirichletBC, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import EllipticCoerciveProblem, ParabolicCoerciveProblem, PODGalerkin
+
+
+def _Problem(ProblemBase):
+
+    class Problem(ProblemBase):
+        def __init__(self, V, **kwargs):
+            ProblemBase.__init__(self, V, **kwargs)
+            self.u = TrialFunction(V)
+            self.v = TestFunction(V)
+
+        def compute_theta(self, term):
+            mu = self.mu
+            if term == "m":
+                return (1., )
+            elif term == "a":
+                return (mu[0], 1.)
+            elif term == "f":
+                return (1., mu[1])
+            elif term == "s":
+                return (1., )
+            else:
+                raise ValueError("Invalid term for compute_theta().")
+
+        def assemble_operator(self, term):
+            (u, v) = (self.u, self.v)
+            if term == "m":
+                return (u * v * dx, )
+            elif term == "a":
+                return (inner(grad(u), grad(v)) * dx, u * v * dx)
+            elif term == "f":
+                return (v * dx, v.dx(0) * dx)
+            elif term == "s":
+                return (v * dx, )
+            elif term == "dirichlet_bc":
+                return ([DirichletBC(self.V, Constant(0.), "on_boundary")], )
+            elif term in ("inner_product", "projection_inner_product"):
+                return (inner(grad(u), grad(v)) * dx, )
+            else:
+                raise ValueError("Invalid term for assemble_operator().")
+
+    return Problem
+
+
+def _offline(problem, tempdir, name):
+    problem.name = lambda: os.path.join(tempdir, name)
+    problem.set_mu_range([(0.5, 2.0), (-1.0, 1.0)])
+    reduction_method = PODGalerkin(problem)
+    reduction_method.set_Nmax(3)
+    reduction_method.initialize_training_set(4)
+    return reduction_method.offline()
+
+
+# Test that batched solves of steady problems agree with solving one parameter at a time
+def test_reduced_problem_solve_many_elliptic(tempdir):
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = _Problem(EllipticCoerciveProblem)(V)
+    reduced_problem = _offline(problem, tempdir, "SolveManyElliptic")
+    mus = [(0.7, -0.5), (1.3, 0.2), (1.9, 0.9)]
+    mu = (1.0, 0.0)
+    reduced_problem.set_mu(mu)
+    solutions = reduced_problem.solve_many(mus)
+    outputs = reduced_problem.compute_output_many()
+    assert reduced_problem.mu == mu
+    assert len(solutions) == len(outputs) == len(mus)
+    for (mu_i, solution_i, output_i) in zip(mus, solutions, outputs):
+        reduced_problem.set_mu(mu_i)
+        assert allclose(solution_i.vector().content, reduced_problem.solve().vector().content)
+        assert isclose(output_i, reduced_problem.compute_output())
+
+
+# Test that batched solves of unsteady problems carry out time stepping for each parameter
+def test_reduced_problem_solve_many_parabolic(tempdir):
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = _Problem(ParabolicCoerciveProblem)(V)
+    problem.set_time_step_size(0.1)
+    problem.set_final_time(0.5)
+    reduced_problem = _offline(problem, tempdir, "SolveManyParabolic")
+    mus = [(0.7, -0.5), (1.3, 0.2), (1.9, 0.9)]
+    mu = (1.0, 0.0)
+    reduced_problem.set_mu(mu)
+    solutions_over_time = reduced_problem.solve_many(mus)
+    outputs_over_time = reduced_problem.compute_output_many()
+    assert reduced_problem.mu == mu
+    assert len(solutions_over_time) == len(outputs_over_time) == len(mus)
+    for (mu_i, solution_over_time_i, output_over_time_i) in zip(mus, solutions_over_time, outputs_over_time):
+        # Clear caches, so that the reference solution is actually recomputed
+        reduced_problem._solution_over_time_cache.clear()
+        reduced_problem._solution_dot_over_time_cache.clear()
+        reduced_problem._output_over_time_cache.clear()
+        reduced_problem.set_mu(mu_i)
+        reference_solution_over_time = reduced_problem.solve()
+        reference_output_over_time = reduced_problem.compute_output()
+        assert len(solution_over_time_i) == len(reference_solution_over_time) == 6
+        for (solution, reference_solution) in zip(solution_over_time_i, reference_solution_over_time):
+            assert allclose(solution.vector().content, reference_solution.vector().content)
+        assert allclose(list(output_over_time_i), list(reference_output_over_time))
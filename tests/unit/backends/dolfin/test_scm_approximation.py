@@ -0,0 +1,83 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from numpy import isclose
+from dolfin import Constant, DirichletBC, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import (assemble_operator_for_stability_factor, compute_theta_for_stability_factor,
+                    EllipticCoerciveProblem, generate_function_space_for_stability_factor, ReducedBasis, SCM)
+
+
+# Test that linear programs which are reused across parameters provide the same lower bounds as linear programs
+# built from scratch, also when the number of constraints for the same N changes because the complement of the
+# greedily selected parameters in the training set has less than N elements
+def test_scm_approximation_reused_linear_programs(tempdir):
+
+    @SCM()
+    class Problem(EllipticCoerciveProblem):
+        @generate_function_space_for_stability_factor
+        def __init__(self, V, **kwargs):
+            EllipticCoerciveProblem.__init__(self, V, **kwargs)
+            self.u = TrialFunction(V)
+            self.v = TestFunction(V)
+
+        def name(self):
+            return os.path.join(tempdir, "SCMApproximationReusedLinearPrograms")
+
+        @compute_theta_for_stability_factor
+        def compute_theta(self, term):
+            mu = self.mu
+            if term == "a":
+                return (mu[0], 1.)
+            elif term == "f":
+                return (1., mu[1])
+            else:
+                raise ValueError("Invalid term for compute_theta().")
+
+        @assemble_operator_for_stability_factor
+        def assemble_operator(self, term):
+            (u, v) = (self.u, self.v)
+            if term == "a":
+                return (inner(grad(u), grad(v)) * dx, u * v * dx)
+            elif term == "f":
+                return (v * dx, v.dx(0) * dx)
+            elif term == "dirichlet_bc":
+                return ([DirichletBC(self.V, Constant(0.), "on_boundary")], )
+            elif term == "inner_product":
+                return (inner(grad(u), grad(v)) * dx, )
+            else:
+                raise ValueError("Invalid term for assemble_operator().")
+
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = Problem(V)
+    problem.set_mu_range([(0.5, 2.0), (-1.0, 1.0)])
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(2, SCM=3)
+    reduction_method.initialize_training_set(5, SCM=4)
+    reduction_method.SCM_reduction.offline()
+    SCM_approximation = problem.SCM_approximation
+    assert SCM_approximation.N == 3
+
+    # Lower bounds at parameters in the training set should not be stored in the cache
+    assert len(SCM_approximation._stability_factor_lower_bound_cache) == 0
+
+    def clear():
+        SCM_approximation._linear_programs.clear()
+        SCM_approximation._stability_factor_lower_bounds.clear()
+        SCM_approximation._stability_factor_lower_bound_cache.clear()
+
+    mus = [(0.7, -0.5), (1.3, 0.2), (1.9, 0.9)]
+    reused = dict()
+    for N in range(1, SCM_approximation.N + 1):
+        for mu in mus:
+            SCM_approximation.set_mu(mu)
+            reused[N, mu] = SCM_approximation.get_stability_factor_lower_bound(N)
+    for N in range(1, SCM_approximation.N + 1):
+        for mu in mus:
+            clear()
+            SCM_approximation.set_mu(mu)
+            assert isclose(reused[N, mu], SCM_approximation.get_stability_factor_lower_bound(N))
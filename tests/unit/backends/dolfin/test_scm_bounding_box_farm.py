@@ -0,0 +1,99 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import subprocess
+import sys
+
+# The bounding box farm spawns processes which import the main module: run the test as a standalone script, written
+# as an RBniCS user would write it
+script = """
+import sys
+from functools import partial
+from numpy import allclose
+from numpy.random import seed
+from dolfin import Constant, DirichletBC, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import (assemble_operator_for_stability_factor, compute_theta_for_stability_factor,
+                    EllipticCoerciveProblem, generate_function_space_for_stability_factor, ReducedBasis, SCM)
+from rbnics.utils.config import config
+
+
+@SCM()
+class Problem(EllipticCoerciveProblem):
+    @generate_function_space_for_stability_factor
+    def __init__(self, V, **kwargs):
+        self._name = kwargs["name"]
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+
+    def name(self):
+        return self._name
+
+    @compute_theta_for_stability_factor
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            return (mu[0], 1.)
+        elif term == "f":
+            return (1., mu[1])
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    @assemble_operator_for_stability_factor
+    def assemble_operator(self, term):
+        (u, v) = (self.u, self.v)
+        if term == "a":
+            return (inner(grad(u), grad(v)) * dx, u * v * dx)
+        elif term == "f":
+            return (v * dx, v.dx(0) * dx)
+        elif term == "dirichlet_bc":
+            return ([DirichletBC(self.V, Constant(0.), "on_boundary")], )
+        elif term == "inner_product":
+            return (inner(grad(u), grad(v)) * dx, )
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+def generate_truth_problem(name):
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = Problem(V, name=name)
+    problem.set_mu_range([(0.5, 2.0), (-1.0, 1.0)])
+    return problem
+
+
+def offline(name, bounding_box_processes):
+    config.set("SCM", "bounding box processes", str(bounding_box_processes))
+    problem = generate_truth_problem(name)
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(2, SCM=2)
+    reduction_method.set_bounding_box_farm(partial(generate_truth_problem, name))
+    seed(0)  # both runs should use the same training set
+    reduction_method.initialize_training_set(5, SCM=5)
+    reduction_method.SCM_reduction.offline()
+    return problem.SCM_approximation
+
+
+if __name__ == "__main__":
+    serial_SCM_approximation = offline("Serial", 1)
+    farmed_SCM_approximation = offline("Farmed", 3)
+    # Both runs should obtain the same bounding box, and hence the same lower bounds
+    assert allclose(list(serial_SCM_approximation.bounding_box_min), list(farmed_SCM_approximation.bounding_box_min))
+    assert allclose(list(serial_SCM_approximation.bounding_box_max), list(farmed_SCM_approximation.bounding_box_max))
+    for SCM_approximation in (serial_SCM_approximation, farmed_SCM_approximation):
+        SCM_approximation.set_mu((1.3, 0.2))
+    assert allclose(serial_SCM_approximation.get_stability_factor_lower_bound(),
+                    farmed_SCM_approximation.get_stability_factor_lower_bound())
+    sys.exit(0)
+"""
+
+
+def test_scm_bounding_box_farm(tempdir):
+    with open(os.path.join(tempdir, "bounding_box_farm.py"), "w") as script_file:
+        script_file.write(script)
+    result = subprocess.run([sys.executable, "bounding_box_farm.py"], cwd=tempdir)
+    assert result.returncode == 0
@@ -0,0 +1,40 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from rbnics.sampling import ParameterSpaceSubset
+
+
+# Generator and initializer are defined at module level, so that they can be pickled to spawned workers
+def initializer():
+    global initializer_pid
+    initializer_pid = os.getpid()
+
+
+def generator(mu):
+    assert initializer_pid == os.getpid()
+    return (sum(mu), os.getpid())
+
+
+initializer_pid = None
+
+
+@pytest.mark.parametrize("processes", [1, 3])
+def test_parameter_space_subset_farm(processes):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate([(0., 1.), (2., 3.)], 10)
+
+    # Parameters are enumerated in order, together with the value of the generator on each of them
+    farmed = list()
+    pids = set()
+    for (mu_index, mu, (value, pid)) in parameter_space_subset.farm(generator, initializer, processes):
+        assert value == sum(mu)
+        farmed.append((mu_index, mu))
+        pids.add(pid)
+    assert farmed == list(enumerate(parameter_space_subset))
+    # Values are computed in the current process only if there is a single process
+    assert (pids == {os.getpid()}) == (processes == 1)
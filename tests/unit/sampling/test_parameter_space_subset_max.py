@@ -0,0 +1,41 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.utils.config import config
+
+
+# Generator and initializer are defined at module level, so that they can be pickled to spawned workers
+def initializer():
+    global initializer_pid
+    initializer_pid = os.getpid()
+
+
+def generator(mu):
+    assert initializer_pid == os.getpid()
+    return - (mu[0] - 0.3)**2 - (mu[1] - 2.7)**2
+
+
+initializer_pid = None
+
+
+@pytest.mark.parametrize("max_processes", ["1", "3"])
+def test_parameter_space_subset_max(max_processes):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate([(0., 1.), (2., 3.)], 20)
+    initializer()
+    values = [generator(mu) for mu in parameter_space_subset]
+
+    original_max_processes = config.get("sampling", "max processes")
+    config.set("sampling", "max processes", max_processes)
+    try:
+        (value_max, index_max) = parameter_space_subset.max(generator, initializer=initializer)
+    finally:
+        config.set("sampling", "max processes", original_max_processes)
+    assert index_max == values.index(max(values))
+    assert value_max == values[index_max]
@@ -0,0 +1,24 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose, array, isclose
+from sympy import symbols
+from rbnics.shape_parametrization.utils.symbolic import sympy_eval, sympy_lambdify
+
+
+# Test compiled evaluation of theta factors, both for a single parameter and for a batch of parameters
+def test_sympy_lambdify():
+    expressions = ("mu[0]**2 + sqrt(mu[1])", 2 * symbols("mu[1]") / symbols("mu[0]"), 1)
+    function = sympy_lambdify(expressions, 2)
+    for mu in ((1., 4.), (2., 9.), (0.5, 0.25)):
+        values = function(mu)
+        assert len(values) == len(expressions)
+        for (value, expression) in zip(values, expressions):
+            assert isclose(value, sympy_eval(str(expression), {"mu": mu}))
+    values = function((array([1., 2., 0.5]), array([4., 9., 0.25])))
+    assert allclose(values[0], [3., 7., 0.75])
+    assert allclose(values[1], [8., 9., 1.])
+    assert values[2] == 1
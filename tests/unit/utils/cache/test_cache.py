@@ -0,0 +1,105 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import full, load, save
+from rbnics.utils.cache import Cache
+from rbnics.utils.config import config
+
+
+@pytest.fixture
+def bounded_config():
+    options = ("cache", "disk cache limit", "disk cache size limit", "RAM cache limit", "RAM cache size limit")
+    backup = {option: config.get("problems", option) for option in options}
+    config.set("problems", "cache", {"disk", "RAM"})
+    config.set("problems", "disk cache limit", "unlimited")
+    config.set("problems", "disk cache size limit", "2KB")
+    config.set("problems", "RAM cache limit", "unlimited")
+    config.set("problems", "RAM cache size limit", "1KB")
+    yield
+    for (option, value) in backup.items():
+        config.set("problems", option, value)
+
+
+def test_cache_bounded_size(tempdir, bounded_config):
+    # Each value is 800 bytes large, and is exported to a 928 bytes large npy file
+    def key_generator(*args, **kwargs):
+        return args[0]
+
+    def import_(filename):
+        return load(os.path.join(tempdir, filename + ".npy"))
+
+    def export(filename):
+        save(os.path.join(tempdir, filename + ".npy"), values[int(filename)])
+
+    def filename_generator(*args, **kwargs):
+        return str(args[0])
+
+    cache = Cache("problems", key_generator=key_generator, import_=import_, export=export,
+                  filename_generator=filename_generator, folder=tempdir)
+    values = [full(100, float(i)) for i in range(4)]
+
+    # Only the latest value fits in RAM, while the latest two fit on disk
+    for (i, value) in enumerate(values):
+        cache[i] = value
+    assert len(cache) == 1
+    assert 3 in cache
+    assert sorted(os.listdir(tempdir)) == ["2.npy", "3.npy"]
+    assert cache.statistics() == {
+        "RAM hits": 0, "disk hits": 0, "misses": 0, "RAM evictions": 3, "disk evictions": 2}
+
+    # Hits from RAM and disk, and misses for values which have been evicted from disk
+    assert cache[3][0] == 3.
+    assert cache[2][0] == 2.
+    with pytest.raises(KeyError):
+        cache[1]
+    assert 2 in cache
+    assert 3 not in cache
+    assert cache.statistics() == {
+        "RAM hits": 1, "disk hits": 1, "misses": 1, "RAM evictions": 4, "disk evictions": 2}
+
+    # Accessing a value on disk marks it as the most recently used one
+    cache[0] = values[0]
+    assert sorted(os.listdir(tempdir)) == ["0.npy", "2.npy"]
+
+
+def test_cache_bounded_size_shared_folder(tempdir, bounded_config):
+    # Two caches store their values in the same folder with the same filenames, but with different suffixes
+    def key_generator(*args, **kwargs):
+        return args[0]
+
+    def filename_generator(*args, **kwargs):
+        return str(args[0])
+
+    def generate_cache(suffix, values):
+        def import_(filename):
+            return load(os.path.join(tempdir, filename + suffix + ".npy"))
+
+        def export(filename):
+            save(os.path.join(tempdir, filename + suffix + ".npy"), values[int(filename)])
+
+        return Cache("problems", key_generator=key_generator, import_=import_, export=export,
+                     filename_generator=filename_generator, folder=tempdir)
+
+    values = [full(100, float(i)) for i in range(3)]
+    other_values = [full(100, - float(i)) for i in range(3)]
+    cache = generate_cache("", values)
+    other_cache = generate_cache("_other", other_values)
+
+    # The latest two values of each cache fit on disk, since files of the other cache are not accounted for
+    for i in range(2):
+        other_cache[i] = other_values[i]
+    for i in range(2):
+        cache[i] = values[i]
+    assert sorted(os.listdir(tempdir)) == ["0.npy", "0_other.npy", "1.npy", "1_other.npy"]
+    assert cache.statistics()["disk evictions"] == other_cache.statistics()["disk evictions"] == 0
+
+    # Evicting a value from disk does not remove the files of the other cache
+    cache[2] = values[2]
+    assert sorted(os.listdir(tempdir)) == ["0_other.npy", "1.npy", "1_other.npy", "2.npy"]
+    assert cache.statistics()["disk evictions"] == 1
+    assert other_cache[0][0] == 0.
@@ -0,0 +1,50 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, exp
+from rbnics.problems.base import ParametrizedProblem
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.utils.decorators import vectorized_compute_theta
+
+
+class Problem(ParametrizedProblem):
+    def __init__(self):
+        ParametrizedProblem.__init__(self, "Problem")
+        self.set_mu_range([(0.5, 2.0), (-1.0, 1.0), (0.0, 3.0)])
+
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            return (mu[0], 1., mu[0] * mu[1] + mu[2] / 7.0)
+        elif term == "f":
+            return (exp(mu[1] * mu[2]), )
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+
+class VectorizedProblem(Problem):
+    @vectorized_compute_theta
+    def compute_theta(self, term):
+        return Problem.compute_theta(self, term)
+
+
+# Test batched computation of thetas, both by the default implementation and by the vectorized one
+@pytest.mark.parametrize("ProblemClass", [Problem, VectorizedProblem])
+def test_parametrized_problem_compute_theta_many(ProblemClass):
+    problem = ProblemClass()
+    mu = (1.0, 0.0, 1.0)
+    problem.set_mu(mu)
+    mus = ParameterSpaceSubset()
+    mus.generate(problem.mu_range, 20)
+    for term in ("a", "f"):
+        thetas = problem.compute_theta_many(term, mus)
+        assert problem.mu == mu
+        assert thetas.shape == (20, len(problem.compute_theta(term)))
+        for (mu_i, thetas_i) in zip(mus, thetas):
+            problem.set_mu(mu_i)
+            assert allclose(thetas_i, problem.compute_theta(term))
+        problem.set_mu(mu)
@@ -0,0 +1,37 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from numpy import arange, array_equal, memmap
+from rbnics.utils.io import NumpyArchiveIO, OnlineSizeDict
+
+
+def test_numpy_archive_io(tempdir):
+    content = {
+        "matrices": arange(60.).reshape(3, 4, 5),
+        "vector": arange(7.),
+        "empty": arange(0.)
+    }
+    size = OnlineSizeDict()
+    size["u"] = 4
+    metadata = {"content_item_type": "matrix", "size": size}
+    NumpyArchiveIO.save_file(content, tempdir, "archive", metadata)
+    assert NumpyArchiveIO.exists_file(tempdir, "archive")
+    assert os.path.isfile(os.path.join(tempdir, "archive.npa"))
+
+    (loaded_content, loaded_metadata) = NumpyArchiveIO.load_file(
+        tempdir, "archive", globals={"OnlineSizeDict": OnlineSizeDict})
+    assert loaded_content.keys() == content.keys()
+    for key in content.keys():
+        assert array_equal(loaded_content[key], content[key])
+    assert isinstance(loaded_content["matrices"], memmap)
+    assert loaded_metadata == metadata
+    assert isinstance(loaded_metadata["size"], OnlineSizeDict)
+
+    # Modifications to the memory map do not affect the file
+    loaded_content["matrices"][0, 0, 0] = -1.
+    (reloaded_content, _) = NumpyArchiveIO.load_file(tempdir, "archive", globals={"OnlineSizeDict": OnlineSizeDict})
+    assert array_equal(reloaded_content["matrices"], content["matrices"])